@@ -0,0 +1,71 @@
+"""CSS startup benchmark: root.css via load_from_path vs the cached bundle.
+
+Run:
+    python benchmarks/css_startup.py [--runs 50]
+
+Compares what ComposeApp did before (GTK resolving root.css and its @imports)
+with loading the cached, flattened bundle through load_from_bytes.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import gi
+
+gi.require_version("Gtk", "4.0")
+from gi.repository import Gtk, GLib
+
+from gcompose.styling import bundle
+
+
+def _time(fn, runs):
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=50)
+    args = parser.parse_args()
+
+    # Keep the benchmark from touching the real user cache
+    os.environ["XDG_CACHE_HOME"] = tempfile.mkdtemp(prefix="gcompose-bench-")
+    root_css = str(bundle.ROOT_CSS)
+
+    def from_path():
+        Gtk.CssProvider().load_from_path(root_css)
+
+    def cold_bundle():
+        data = bundle.build_bundle(root_css)
+        Gtk.CssProvider().load_from_bytes(GLib.Bytes.new(data))
+
+    bundle.load_bundle(root_css)  # warm the cache
+
+    def warm_bundle():
+        data, _ = bundle.load_bundle(root_css)
+        Gtk.CssProvider().load_from_bytes(GLib.Bytes.new(data))
+
+    baseline = _time(from_path, args.runs)
+    results = [
+        ("load_from_path(root.css)", baseline),
+        ("bundle, cache miss", _time(cold_bundle, args.runs)),
+        ("bundle, cache hit", _time(warm_bundle, args.runs)),
+    ]
+
+    print(f"{'scenario':<28}{'median ms':>12}{'vs path':>10}")
+    for name, ms in results:
+        print(f"{name:<28}{ms:>12.3f}{ms / baseline:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
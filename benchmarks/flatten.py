@@ -0,0 +1,107 @@
+"""Widget-count savings from layout flattening.
+
+Run:
+    python benchmarks/flatten.py [--rows 200] [--runs 20]
+
+Renders the same tree with flattening on and off (gcompose.layout.box.FLATTEN)
+and reports the widget count, the wrappers the composition recorded as
+elided, and the median render time of each.
+
+Also checks the result: with flattening on, each row elides its grouping
+Column and inner Row, and each ScrollColumn its padding wrapper, so the
+composition must report exactly expected_elided(rows) and the widget count
+must drop by the same amount. Exits 1 otherwise.
+"""
+
+import argparse
+import statistics
+import sys
+import time
+
+import harness
+
+harness.ensure_display()
+
+import gi
+
+gi.require_version("Gtk", "4.0")
+from gi.repository import Gtk
+
+from gcompose import Column, Row, ScrollColumn, Text, Button
+from gcompose.app.renderer import mount
+from gcompose.layout import box as layout
+
+
+def ui_factory(rows):
+    def ui():
+        with ScrollColumn():
+            for i in range(rows):
+                # Grouping-only wrappers, as commonly written by hand
+                with Column():
+                    with Row(styles="items-center gap-2"):
+                        Text(f"Item {i}")
+                        with Row():
+                            Button("Open")
+        with ScrollColumn(styles="bg-gray-900"):
+            Text("Footer")
+
+    return ui
+
+
+def expected_elided(rows):
+    # Per row: the grouping Column and the single-button Row; plus the two
+    # ScrollColumns' padding wrappers (neither has padding styles)
+    return 2 * rows + 2
+
+
+def count_widgets(widget):
+    total = 1
+    child = widget.get_first_child()
+    while child is not None:
+        total += count_widgets(child)
+        child = child.get_next_sibling()
+    return total
+
+
+def measure(flatten, rows, runs):
+    layout.FLATTEN = flatten
+    ui = ui_factory(rows)
+    samples = []
+    for _ in range(runs):
+        root = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
+        start = time.perf_counter()
+        composition = mount(root, ui)
+        samples.append((time.perf_counter() - start) * 1000)
+    return count_widgets(root), composition.elided_widgets, statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    try:
+        off_count, _, off_ms = measure(False, args.rows, args.runs)
+        on_count, elided, on_ms = measure(True, args.rows, args.runs)
+    finally:
+        harness.shutdown_display()
+
+    saved = off_count - on_count
+    expected = expected_elided(args.rows)
+    print(f"{'':<14}{'widgets':>10}{'render ms':>12}")
+    print(f"{'unflattened':<14}{off_count:>10}{off_ms:>12.2f}")
+    print(f"{'flattened':<14}{on_count:>10}{on_ms:>12.2f}")
+    print(
+        f"saved {saved} widgets ({saved / off_count:.0%}); "
+        f"composition reported {elided} elided, expected {expected}"
+    )
+
+    if elided != expected or saved != expected:
+        print("FAIL: elided count does not match the tree")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+"""Shared benchmark plumbing: headless display, scenario registry, timing, baselines."""
+
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+BASELINE_DIR = Path(__file__).resolve().parent / "baselines"
+
+sys.path.insert(0, str(SRC))
+
+_broadwayd = None
+
+
+def ensure_display(display=":94"):
+    """Make GTK usable without a desktop session.
+
+    Uses the existing display when there is one. Otherwise starts a private
+    gtk4-broadwayd and points GDK at it (GDK_BACKEND=broadway).
+    """
+    global _broadwayd
+    if os.environ.get("GDK_BACKEND") or os.environ.get("WAYLAND_DISPLAY") or os.environ.get("DISPLAY"):
+        return
+
+    daemon = shutil.which("gtk4-broadwayd")
+    if daemon is None:
+        raise RuntimeError(
+            "No display available and gtk4-broadwayd not found; "
+            "run under a session, xvfb-run, or install the broadway backend"
+        )
+    _broadwayd = subprocess.Popen(
+        [daemon, display], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    time.sleep(0.3)
+    os.environ["GDK_BACKEND"] = "broadway"
+    os.environ["BROADWAY_DISPLAY"] = display
+
+
+def shutdown_display():
+    if _broadwayd is not None:
+        _broadwayd.terminate()
+        _broadwayd.wait()
+
+
+SCENARIOS = {}
+
+
+def scenario(name, params=(None,)):
+    """Register a benchmark scenario.
+
+    The decorated function receives one parameter value, performs its setup,
+    and returns the zero-argument callable to time.
+    """
+
+    def decorator(fn):
+        SCENARIOS[name] = (fn, list(params))
+        return fn
+
+    return decorator
+
+
+def time_callable(fn, repeat=20, warmup=2):
+    """Time fn() and return a dict of median/min/max in milliseconds."""
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {
+        "median_ms": statistics.median(samples),
+        "min_ms": min(samples),
+        "max_ms": max(samples),
+        "repeat": repeat,
+    }
+
+
+def run_scenarios(selected=None, repeat=20):
+    """Run registered scenarios; returns {"name[param]": timing dict}."""
+    results = {}
+    for name, (fn, params) in SCENARIOS.items():
+        if selected and not any(name.startswith(s) for s in selected):
+            continue
+        for param in params:
+            key = name if param is None else f"{name}[{param}]"
+            results[key] = time_callable(fn(param), repeat=repeat)
+    return results
+
+
+def save_baseline(results, label="default"):
+    BASELINE_DIR.mkdir(exist_ok=True)
+    path = BASELINE_DIR / f"{label}.json"
+    path.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+    return path
+
+
+def load_baseline(label="default"):
+    path = BASELINE_DIR / f"{label}.json"
+    if not path.exists():
+        return None
+    return json.loads(path.read_text())
+
+
+def compare(results, baseline, threshold=0.10):
+    """Format a comparison report; returns (report_text, regressed_keys)."""
+    lines = [f"{'scenario':<36}{'median ms':>12}{'baseline':>12}{'change':>10}"]
+    regressed = []
+    for key, timing in results.items():
+        current = timing["median_ms"]
+        base = (baseline or {}).get(key)
+        if base is None:
+            lines.append(f"{key:<36}{current:>12.3f}{'-':>12}{'new':>10}")
+            continue
+        change = (current - base["median_ms"]) / base["median_ms"] if base["median_ms"] else 0.0
+        flag = ""
+        if change > threshold:
+            regressed.append(key)
+            flag = " !"
+        lines.append(
+            f"{key:<36}{current:>12.3f}{base['median_ms']:>12.3f}{change:>+9.1%}{flag}"
+        )
+    return "\n".join(lines), regressed
@@ -0,0 +1,84 @@
+"""Import-time regression check for `import gcompose`.
+
+Run:
+    python benchmarks/import_time.py [--budget-ms 60] [--runs 5]
+
+Each run imports gcompose in a fresh interpreter with `-X importtime` and reads
+the cumulative time of the `gcompose` entry. Exits non-zero when the median
+exceeds the budget, or when `import gcompose` eagerly loads modules that must
+stay lazy (Adw, the app host, widgets, file dialogs).
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+# Modules that must not be imported by a bare `import gcompose`
+MUST_STAY_LAZY = [
+    "gcompose.app.app",
+    "gcompose.widgets.basic",
+    "gcompose.widgets.sidebar",
+    "gcompose.utils.file_dialogs",
+    "gi.repository.Adw",
+    "gi.repository.GdkPixbuf",
+]
+
+IMPORTTIME_PATTERN = re.compile(r"import time:\s+\d+\s+\|\s+(\d+)\s+\|\s+(\S.*)$")
+
+
+def measure_once():
+    """Return (cumulative_us, eagerly_loaded) for one fresh `import gcompose`."""
+    code = (
+        "import sys, gcompose; "
+        f"print(','.join(m for m in {MUST_STAY_LAZY!r} if m in sys.modules))"
+    )
+    env = dict(os.environ, PYTHONPATH=SRC)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    cumulative = None
+    for line in proc.stderr.splitlines():
+        match = IMPORTTIME_PATTERN.match(line)
+        if match and match.group(2).strip() == "gcompose":
+            cumulative = int(match.group(1))
+    eager = [m for m in proc.stdout.strip().split(",") if m]
+    return cumulative, eager
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=60.0)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    samples = []
+    eager = []
+    for _ in range(args.runs):
+        cumulative, eager = measure_once()
+        samples.append(cumulative / 1000)
+
+    median = statistics.median(samples)
+    print(f"import gcompose: median {median:.1f} ms over {args.runs} runs "
+          f"(budget {args.budget_ms:.1f} ms)")
+
+    failed = False
+    if eager:
+        print(f"FAIL: eagerly imported: {', '.join(eager)}")
+        failed = True
+    if median > args.budget_ms:
+        print("FAIL: import time over budget")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
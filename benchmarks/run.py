@@ -0,0 +1,61 @@
+"""Run the gcompose benchmark suite.
+
+Examples:
+    python benchmarks/run.py                      # run and compare to baselines/default.json
+    python benchmarks/run.py render styles        # only scenarios starting with these names
+    python benchmarks/run.py --save-baseline      # store results as the new baseline
+    python benchmarks/run.py --fail-on-regression --threshold 0.15
+
+Runs headless: without a display, a private gtk4-broadwayd is started.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import sys
+
+import harness
+
+
+def main():
+    parser = argparse.ArgumentParser(description="gcompose benchmark suite")
+    parser.add_argument("scenarios", nargs="*", help="scenario name prefixes")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--baseline", default="default", help="baseline label")
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="relative slowdown reported as a regression")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    parser.add_argument("--json", action="store_true", help="print raw results as JSON")
+    args = parser.parse_args()
+
+    harness.ensure_display()
+    try:
+        import scenarios  # noqa: F401  (registers scenarios)
+
+        # Widgets and the renderer print debug output; keep the report readable
+        with contextlib.redirect_stdout(io.StringIO()):
+            results = harness.run_scenarios(args.scenarios, repeat=args.repeat)
+    finally:
+        harness.shutdown_display()
+
+    if args.json:
+        print(json.dumps(results, indent=2, sort_keys=True))
+
+    report, regressed = harness.compare(
+        results, harness.load_baseline(args.baseline), args.threshold
+    )
+    print(report)
+
+    if args.save_baseline:
+        print(f"baseline saved to {harness.save_baseline(results, args.baseline)}")
+
+    if regressed and args.fail_on_regression:
+        print(f"{len(regressed)} scenario(s) regressed by more than {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,232 @@
+"""Benchmark scenarios for gcompose hot paths.
+
+Each scenario does its setup when called with a parameter and returns the
+callable that is timed. GTK must be usable (see harness.ensure_display) before
+this module is imported.
+"""
+
+import gi
+
+gi.require_version("Gtk", "4.0")
+from gi.repository import Gtk, GLib
+
+from harness import scenario
+
+from gcompose import Column, Row, Text, Button, List, Select, Binding, ScrollColumn, LazyColumn
+from gcompose.app.renderer import mount
+from gcompose.state import make_state, make_fast_state, use_state
+from gcompose.state.history import History
+from gcompose.styling import bundle
+from gcompose.styling.css import apply_styles
+from gcompose.styling.parser import StyleParser
+
+STYLE_STRINGS = [
+    "w-full h-full justify-center items-center p-4",
+    "text-blue-400 text-2xl",
+    "bg-green-600 hover:bg-green-700 rounded-lg px-4 py-2",
+    "w-200 h-48 justify-between items-stretch text-center",
+    "p-[13px] bg-[#1e1e2e] hover:opacity-50 font-bold",
+]
+
+
+def _in_root(build):
+    """Run build() as the composable of a fresh root container."""
+    return mount(Gtk.Box(orientation=Gtk.Orientation.VERTICAL), build)
+
+
+def _widget_tree(n):
+    def ui():
+        with Column(styles="p-4"):
+            for i in range(n):
+                with Row(styles="items-center"):
+                    Text(f"Item {i}", styles="text-gray-500")
+                    Button("Open", styles="bg-blue-600 hover:bg-blue-700")
+
+    return ui
+
+
+@scenario("render.full", params=[10, 100, 1000])
+def render_full(n):
+    ui = _widget_tree(n)
+
+    def run():
+        mount(Gtk.Box(orientation=Gtk.Orientation.VERTICAL), ui)
+
+    return run
+
+
+@scenario("render.rerender_after_state_change", params=[10, 100, 1000])
+def rerender_after_state_change(n):
+    tree = _widget_tree(n)
+    holder = {}
+
+    def ui():
+        holder["state"] = use_state(count=0)
+        Text(bind=Binding(holder["state"], "count", format=lambda v: f"Count: {v}"))
+        tree()
+
+    composition = mount(Gtk.Box(orientation=Gtk.Orientation.VERTICAL), ui)
+
+    def run():
+        holder["state"].count += 1
+        composition.rerender()
+
+    return run
+
+
+def _card(i):
+    with Row(styles="items-center p-2"):
+        Text(f"Item {i}", styles="text-gray-500")
+        Button("Open", styles="bg-blue-600")
+
+
+def _drain():
+    context = GLib.MainContext.default()
+    while context.pending():
+        context.iteration(False)
+
+
+@scenario("render.scroll_column", params=[1000, 10000])
+def render_scroll_column(n):
+    def ui():
+        with ScrollColumn():
+            for i in range(n):
+                _card(i)
+
+    return lambda: _in_root(ui)
+
+
+@scenario("render.lazy_column", params=[1000, 10000])
+def render_lazy_column(n):
+    """Same content as render.scroll_column; only the first viewport is built."""
+
+    def run():
+        _in_root(lambda: LazyColumn(range(n), _card, estimated_height=40))
+        _drain()
+
+    return run
+
+
+@scenario("styles.parse")
+def styles_parse(_):
+    def run():
+        for _i in range(100):
+            for styles in STYLE_STRINGS:
+                StyleParser.parse_all_properties(styles)
+
+    return run
+
+
+@scenario("styles.apply")
+def styles_apply(_):
+    def run():
+        for _i in range(20):
+            for styles in STYLE_STRINGS:
+                apply_styles(Gtk.Label(), styles)
+
+    return run
+
+
+@scenario("state.create")
+def state_create(_):
+    def run():
+        for _i in range(100):
+            make_state(count=0, name="foo", progress=0.0, enabled=False)
+
+    return run
+
+
+@scenario("state.notify_fanout", params=[1, 10, 100])
+def state_notify_fanout(n):
+    state = make_state(count=0)
+    labels = [Gtk.Label() for _ in range(n)]
+    for label in labels:
+        Binding(state, "count", format=lambda v: f"Count: {v}", pure=True).apply_to(label)
+
+    def run():
+        for _i in range(100):
+            state.count += 1
+
+    return run
+
+
+def _state_for(kind):
+    fields = dict(count=0, total=0.0, name="foo", enabled=False)
+    if kind == "gobject":
+        return make_state(**fields)
+    state = make_fast_state(**fields)
+    if kind == "fast_bound":
+        # Bridge one field; the loop below still touches the plain ones
+        Binding(state, "name").apply_to(Gtk.Label())
+    return state
+
+
+@scenario("state.access", params=["gobject", "fast", "fast_bound"])
+def state_access(kind):
+    """Tight read/write loop over state fields: make_state vs make_fast_state."""
+    state = _state_for(kind)
+
+    def run():
+        for i in range(10000):
+            state.count = state.count + 1
+            state.total += 0.5
+            if state.enabled:
+                state.name = "bar"
+
+    return run
+
+
+@scenario("state.bound_write", params=["gobject", "fast"])
+def state_bound_write(kind):
+    """Writes to a bound field (notify + widget update) on both state kinds."""
+    state = make_state(count=0) if kind == "gobject" else make_fast_state(count=0)
+    label = Gtk.Label()
+    Binding(state, "count", format=lambda v: f"Count: {v}").apply_to(label)
+
+    def run():
+        for _i in range(1000):
+            state.count += 1
+
+    return run
+
+
+@scenario("state.history_list_edit", params=[1000, 100000])
+def state_history_list_edit(n):
+    """Record and undo single-item edits to an n-item list field."""
+    doc = make_state(items=list(range(n)))
+    history = History(doc, group_ms=0)
+
+    def run():
+        for i in range(100):
+            items = list(doc.items)
+            items[i] = -i
+            doc.items = items
+        while history.undo():
+            pass
+
+    return run
+
+
+@scenario("widgets.list", params=[100, 1000, 10000])
+def widgets_list(n):
+    items = [f"Row {i}" for i in range(n)]
+    return lambda: _in_root(lambda: List(items, selection_mode="single"))
+
+
+@scenario("widgets.select", params=[100, 1000, 10000])
+def widgets_select(n):
+    items = [f"Option {i}" for i in range(n)]
+    return lambda: _in_root(lambda: Select(items))
+
+
+@scenario("css.load_from_path")
+def css_load_from_path(_):
+    path = str(bundle.ROOT_CSS)
+    return lambda: Gtk.CssProvider().load_from_path(path)
+
+
+@scenario("css.load_bundle")
+def css_load_bundle(_):
+    data, _cache_file = bundle.load_bundle()
+
+    return lambda: Gtk.CssProvider().load_from_bytes(GLib.Bytes.new(data))
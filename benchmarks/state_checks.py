@@ -0,0 +1,125 @@
+"""Correctness checks for state features.
+
+Run:
+    python benchmarks/state_checks.py
+
+Each check exercises one behaviour that is easy to break while optimizing the
+state layer, and prints FAIL with the reason when it does not hold. Exits 1
+if any check fails.
+"""
+
+import sys
+
+import harness  # noqa: F401  (puts src/ on sys.path)
+
+import gi
+
+gi.require_version("Gtk", "4.0")
+from gi.repository import Gtk
+
+from gcompose.state import _cached_format, make_state
+from gcompose.state.history import History
+from gcompose.utils.signals import EntryBinder
+
+CHECKS = []
+
+
+def check(fn):
+    CHECKS.append(fn)
+    return fn
+
+
+class _Units:
+    def __init__(self, suffix):
+        self.suffix = suffix
+
+    def label(self, value):
+        return f"{value} {self.suffix}"
+
+
+@check
+def format_cache_formatter_kinds():
+    """Binding(pure=True) formatters: lambdas cached, builtins and bound methods wrapped as-is."""
+    state = make_state(count=0)
+    calls = []
+
+    def counted(value):
+        calls.append(value)
+        return f"Count: {value}"
+
+    plain = lambda v: f"Count: {v}"  # noqa: E731
+    cached = _cached_format(state, "count", plain)
+    if cached is plain:
+        return "capture-free lambda was not cached"
+    if cached(3) != "Count: 3" or cached(3) != "Count: 3":
+        return "cached lambda returned a wrong result"
+
+    cached = _cached_format(state, "count", counted)
+    cached(1)
+    cached(1)
+    if calls != [1]:
+        return f"cached function called {len(calls)} times for one value"
+
+    for formatter in (str, "{:.1f}".format, _Units("px").label):
+        wrapped = _cached_format(state, "count", formatter)
+        if wrapped is not formatter:
+            return f"{formatter!r} should not be cached"
+
+    # Same method code, different instances: results must not be shared
+    a = _cached_format(state, "count", _Units("px").label)
+    b = _cached_format(state, "count", _Units("em").label)
+    if a(2) == b(2):
+        return "bound methods of different instances shared a cached result"
+    return None
+
+
+@check
+def entry_binder_underscore_field():
+    """Two-way text binding on a field whose name contains an underscore."""
+    form = make_state(first_name="")
+    buffer = Gtk.EntryBuffer()
+    EntryBinder(form, "first_name", buffer).setup()
+
+    form.first_name = "Ada"
+    if buffer.get_text() != "Ada":
+        return f"state change not shown in the widget: {buffer.get_text()!r}"
+    buffer.insert_text(3, " L", -1)
+    if form.first_name != "Ada L":
+        return f"widget edit not applied to state: {form.first_name!r}"
+    return None
+
+
+@check
+def history_underscore_field():
+    """Undo/redo records fields whose names contain an underscore."""
+    person = make_state(first_name="Ada", tags=[])
+    history = History(person, group_ms=0)
+
+    person.first_name = "Grace"
+    person.tags = person.tags + ["admiral"]
+    if history.status.length != 2:
+        return f"expected 2 undo steps, got {history.status.length}"
+    history.undo()
+    history.undo()
+    if person.first_name != "Ada" or person.tags != []:
+        return f"undo left first_name={person.first_name!r}, tags={person.tags!r}"
+    history.redo()
+    if person.first_name != "Grace":
+        return f"redo left first_name={person.first_name!r}"
+    return None
+
+
+def main():
+    failed = 0
+    for fn in CHECKS:
+        error = fn()
+        if error:
+            failed += 1
+            print(f"FAIL: {fn.__name__}: {error}")
+        else:
+            print(f"ok    {fn.__name__}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
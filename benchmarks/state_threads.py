@@ -0,0 +1,97 @@
+"""Stress check for worker-thread state writes.
+
+Run:
+    python benchmarks/state_threads.py [--threads 8] [--rate 10000] [--seconds 2]
+
+Each worker thread writes its own make_state field at the given rate while
+the main loop runs. Verifies that every field ends with the last value its
+thread wrote and that no notify is emitted off the main thread, and reports
+how far the writes were coalesced.
+"""
+
+import argparse
+import sys
+import threading
+import time
+
+import harness  # noqa: F401  (puts src/ on sys.path)
+
+import gi
+
+gi.require_version("GLib", "2.0")
+from gi.repository import GLib
+
+from gcompose.state import make_state, flush_pending_writes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--rate", type=int, default=10000, help="writes per second per thread")
+    parser.add_argument("--seconds", type=float, default=2.0)
+    args = parser.parse_args()
+
+    fields = {f"t{i}": 0 for i in range(args.threads)}
+    state = make_state(**fields)
+
+    main_thread = threading.get_ident()
+    notifies = {"count": 0, "off_thread": 0}
+
+    def on_notify(_obj, _pspec):
+        notifies["count"] += 1
+        if threading.get_ident() != main_thread:
+            notifies["off_thread"] += 1
+
+    state.connect("notify", on_notify)
+
+    last_written = {}
+    writes = [0]
+    writes_lock = threading.Lock()
+
+    def worker(name):
+        interval = 1.0 / args.rate
+        deadline = time.perf_counter() + args.seconds
+        value = 0
+        next_at = time.perf_counter()
+        while time.perf_counter() < deadline:
+            value += 1
+            setattr(state, name, value)
+            next_at += interval
+            delay = next_at - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        last_written[name] = value
+        with writes_lock:
+            writes[0] += value
+
+    loop = GLib.MainLoop()
+    threads = [threading.Thread(target=worker, args=(name,)) for name in fields]
+
+    def watch_workers():
+        if any(t.is_alive() for t in threads):
+            return GLib.SOURCE_CONTINUE
+        loop.quit()
+        return GLib.SOURCE_REMOVE
+
+    for t in threads:
+        t.start()
+    GLib.timeout_add(20, watch_workers)
+    loop.run()
+    flush_pending_writes()
+
+    mismatched = [n for n in fields if getattr(state, n) != last_written[n]]
+    print(f"writes: {writes[0]}  notifies: {notifies['count']}  "
+          f"coalescing: {writes[0] / max(notifies['count'], 1):.1f}x")
+
+    failed = False
+    if notifies["off_thread"]:
+        print(f"FAIL: {notifies['off_thread']} notify emissions off the main thread")
+        failed = True
+    if mismatched:
+        print(f"FAIL: fields without their last written value: {', '.join(mismatched)}")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,28 +3,86 @@ gcompose public API
 
 v1 exposes only the minimal primitives needed to build
 simple declarative GTK applications.
+
+Public names are imported lazily on first access, so tools that only need
+e.g. `gcompose.state.make_state` or the style parser do not pay for Adw,
+every widget module and the file dialogs.
 """
 
-from .app.app import ComposeApp
-
-from .compose.runtime import Composable
-from .compose.window_state import get_window_state
-
-from .layout.box import Row, Column, ScrollRow, ScrollColumn, HeaderBar
-from .widgets.basic import (
-    Text,
-    Button,
-    Image,
-    ProgressBar,
-    List,
-    TextArea,
-    Input,
-    Checkbox,
-    Switch,
-    Select,
-    Spacer,
-    Separator,
-)
-from .widgets.sidebar import SidebarLayout, SidebarContent, SidebarMainScreen
-from .state import Binding
-from .utils import FileDialog, open_file, save_file, pick_folder
+import importlib
+
+import gi
+
+gi.require_version("Gtk", "4.0")
+gi.require_version("Adw", "1")
+
+from .app import startup as _startup
+
+_startup.mark("import")
+
+# public name -> module (relative to this package) that defines it
+_LAZY_IMPORTS = {
+    "ComposeApp": ".app.app",
+    "Composable": ".compose.runtime",
+    "get_window_state": ".compose.window_state",
+    "Row": ".layout.box",
+    "Column": ".layout.box",
+    "ScrollRow": ".layout.box",
+    "ScrollColumn": ".layout.box",
+    "LazyColumn": ".layout.box",
+    "LazyRow": ".layout.box",
+    "HeaderBar": ".layout.box",
+    "Text": ".widgets.basic",
+    "Button": ".widgets.basic",
+    "Image": ".widgets.basic",
+    "ProgressBar": ".widgets.basic",
+    "List": ".widgets.basic",
+    "TextArea": ".widgets.basic",
+    "Input": ".widgets.basic",
+    "Checkbox": ".widgets.basic",
+    "Switch": ".widgets.basic",
+    "Select": ".widgets.basic",
+    "Spacer": ".widgets.basic",
+    "Separator": ".widgets.basic",
+    "SidebarLayout": ".widgets.sidebar",
+    "SidebarContent": ".widgets.sidebar",
+    "SidebarMainScreen": ".widgets.sidebar",
+    "SidebarPages": ".widgets.sidebar",
+    "chrome_slot": ".widgets.chrome",
+    "FrameStats": ".widgets.frame_stats",
+    "Binding": ".state",
+    "use_persisted_state": ".state",
+    "use_fast_state": ".state",
+    "use_history": ".state",
+    "animate": ".animation",
+    "spring": ".animation",
+    "Theme": ".styling.theme",
+    "set_theme": ".styling.theme",
+    "FileDialog": ".utils",
+    "open_file": ".utils",
+    "save_file": ".utils",
+    "pick_folder": ".utils",
+    "scan_directory": ".utils",
+    "open_file_async": ".utils",
+    "save_file_async": ".utils",
+    "pick_folder_async": ".utils",
+    "read_text_async": ".utils",
+    "write_text_async": ".utils",
+    "use_file_watch": ".utils",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
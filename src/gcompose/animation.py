@@ -0,0 +1,183 @@
+"""
+Property animations that bypass rerendering.
+
+animate() and spring() drive a state property with Adw.TimedAnimation /
+Adw.SpringAnimation. Each frame writes the interpolated value straight to the
+state object, so every widget bound to it through Binding updates on the
+frame clock without recomposition.
+
+Starting a new animation on a property that is already animating retargets it
+from the current value; springs also keep their current velocity, so
+interrupted motion stays smooth.
+
+Example:
+    state = use_state(progress=0.0, opacity=1.0)
+
+    ProgressBar(bind=Binding(state, "progress", widget_prop="fraction"))
+
+    Button("Load", on_click=lambda: animate(state, "progress", to=1.0, duration=300))
+    Button("Fade", on_click=lambda: spring(state, "opacity", to=0.0, damping_ratio=0.8))
+"""
+
+import gi
+
+gi.require_version("Adw", "1")
+
+from gi.repository import Adw
+from typing import Callable, Dict, Optional, Tuple
+
+from .compose.runtime import Composition
+
+# (id(state), property) -> running Animation
+_running: Dict[Tuple[int, str], "Animation"] = {}
+
+
+def _resolve_easing(easing):
+    if easing is None:
+        return Adw.Easing.EASE_OUT_CUBIC
+    if isinstance(easing, str):
+        try:
+            return getattr(Adw.Easing, easing.upper().replace("-", "_"))
+        except AttributeError:
+            raise ValueError(f"Unknown easing: {easing!r}")
+    return easing
+
+
+def _clock_widget(widget):
+    """Widget whose frame clock drives the animation."""
+    widget = widget or Composition.get_window() or Composition.get_root()
+    if widget is None:
+        raise RuntimeError("animate() needs a widget: call it from a mounted UI or pass widget=")
+    return widget
+
+
+class Animation:
+    """Handle for a running property animation."""
+
+    def __init__(self, state, prop, adw_animation, on_done=None):
+        self.state = state
+        self.prop = prop
+        self.animation = adw_animation
+        self.on_done = on_done
+        self._handler = adw_animation.connect("done", self._on_done)
+
+    def _on_done(self, _animation):
+        key = (id(self.state), self.prop)
+        if _running.get(key) is self:
+            del _running[key]
+        if self.on_done is not None:
+            self.on_done()
+
+    def cancel(self):
+        """Stop where it is; the property keeps its current value."""
+        self.animation.disconnect(self._handler)
+        self.animation.pause()
+        key = (id(self.state), self.prop)
+        if _running.get(key) is self:
+            del _running[key]
+
+    def skip(self):
+        """Jump to the target value."""
+        self.animation.skip()
+
+    @property
+    def velocity(self) -> float:
+        """Current velocity (springs only, 0 for timed animations)."""
+        if isinstance(self.animation, Adw.SpringAnimation):
+            return self.animation.get_velocity()
+        return 0.0
+
+
+def _make_target(state, prop):
+    current = getattr(state, prop)
+    cast = int if isinstance(current, int) and not isinstance(current, bool) else float
+
+    def apply(value):
+        setattr(state, prop, cast(round(value)) if cast is int else value)
+
+    return Adw.CallbackAnimationTarget.new(apply)
+
+
+def _start(state, prop, build, on_done):
+    key = (id(state), prop)
+    previous = _running.pop(key, None)
+    velocity = 0.0
+    if previous is not None:
+        velocity = previous.velocity
+        previous.cancel()
+
+    adw_animation = build(float(getattr(state, prop)), velocity, _make_target(state, prop))
+    handle = Animation(state, prop, adw_animation, on_done)
+    _running[key] = handle
+    adw_animation.play()
+    return handle
+
+
+def animate(
+    state,
+    prop: str,
+    to: float,
+    duration: int = 250,
+    easing=None,
+    widget=None,
+    on_done: Optional[Callable[[], None]] = None,
+) -> Animation:
+    """Animate a numeric state property over `duration` milliseconds.
+
+    Args:
+        state: State object (make_state / use_state)
+        prop: Property name to animate
+        to: Target value
+        duration: Duration in milliseconds
+        easing: Adw.Easing or its name ("ease-out-cubic", "linear", ...)
+        widget: Widget whose frame clock drives the animation
+                (default: the current window)
+        on_done: Optional callback invoked when the animation finishes
+    """
+    easing = _resolve_easing(easing)
+    clock_widget = _clock_widget(widget)
+
+    def build(start, _velocity, target):
+        animation = Adw.TimedAnimation.new(clock_widget, start, float(to), duration, target)
+        animation.set_easing(easing)
+        return animation
+
+    return _start(state, prop, build, on_done)
+
+
+def spring(
+    state,
+    prop: str,
+    to: float,
+    damping_ratio: float = 1.0,
+    mass: float = 1.0,
+    stiffness: float = 100.0,
+    widget=None,
+    on_done: Optional[Callable[[], None]] = None,
+) -> Animation:
+    """Animate a numeric state property with a spring.
+
+    Interrupting a running spring keeps its velocity, so retargeting is smooth.
+
+    Args:
+        state: State object (make_state / use_state)
+        prop: Property name to animate
+        to: Target value
+        damping_ratio: 1.0 is critically damped, lower values overshoot
+        mass: Spring mass
+        stiffness: Spring stiffness
+        widget: Widget whose frame clock drives the animation
+        on_done: Optional callback invoked when the spring settles
+    """
+    clock_widget = _clock_widget(widget)
+
+    def build(start, velocity, target):
+        params = Adw.SpringParams.new(damping_ratio, mass, stiffness)
+        animation = Adw.SpringAnimation.new(clock_widget, start, float(to), params, target)
+        animation.set_initial_velocity(velocity)
+        return animation
+
+    return _start(state, prop, build, on_done)
+
+
+__all__ = ["animate", "spring", "Animation"]
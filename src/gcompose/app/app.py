@@ -6,10 +6,13 @@ from pathlib import Path
 import os
 import shutil
 
+from . import startup
+
 class ComposeApp(Adw.Application):
     def __init__(self, ui_fn, app_id="com.example.gcompose", title="Gcompose Application",
                  icon=None, width=800, height=600, frameless=False,
-                 bg_color=None, text_color=None, window_icon=None):
+                 bg_color=None, text_color=None, window_icon=None, stylesheet=None,
+                 themes=None, theme=None, frame_monitor=False):
         super().__init__(application_id=app_id)
         self.ui_fn = ui_fn
         self.app_title = title
@@ -20,21 +23,37 @@ class ComposeApp(Adw.Application):
         self.bg_color = bg_color
         self.text_color = text_color
         self.window_icon = window_icon
+        # Optional purged stylesheet (python -m gcompose.styling.purge) used instead of root.css
+        self.stylesheet = stylesheet
+        # Named Theme objects compiled once each; theme is the initial name or "auto"
+        self.themes = themes or {}
+        self.theme = theme
+        # Opt-in FrameMonitor (also enabled by GCOMPOSE_FRAME_MONITOR=1); created in do_activate
+        self.monitor_frames = frame_monitor or bool(os.environ.get("GCOMPOSE_FRAME_MONITOR"))
+        self.frame_monitor = None
     
+    def do_startup(self):
+        Adw.Application.do_startup(self)
+        startup.mark("adw_startup")
+
     def do_activate(self):
         # 1 Load CSS
         try:
             from gcompose.styling.css import load_css
-            css_path = (
-                Path(__file__)
-                .parent.parent / "styling" / "root.css"
-            )
+            if self.stylesheet:
+                css_path = Path(self.stylesheet)
+            else:
+                css_path = (
+                    Path(__file__)
+                    .parent.parent / "styling" / "root.css"
+                )
             load_css(str(css_path.resolve()))
         except ImportError:
             print("Warning: Could not load CSS module.")
         except Exception as e:
             print(f"Warning: CSS loading failed: {e}")
-        
+        startup.mark("css_loaded")
+
         # 2 Create window
         win = Adw.ApplicationWindow(application=self)
         win.set_default_size(self.default_width, self.default_height)
@@ -48,8 +67,14 @@ class ComposeApp(Adw.Application):
         root = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
 
         # Apply root theming
-        if self.bg_color or self.text_color:
-            self._apply_root_theme(root)
+        self._apply_root_theme(root)
+
+        # With frame monitoring, FrameStats floats over the UI in this overlay
+        content = root
+        if self.monitor_frames:
+            content = Gtk.Overlay()
+            content.set_child(root)
+            win._gcompose_overlay = content
         
         # 4 Setup header bar with ToolbarView (THIS IS THE KEY!)
         if not self.frameless:
@@ -61,15 +86,22 @@ class ComposeApp(Adw.Application):
             # Use ToolbarView to properly integrate header bar with content
             toolbar_view = Adw.ToolbarView()
             toolbar_view.add_top_bar(header_bar)
-            toolbar_view.set_content(root)
+            toolbar_view.set_content(content)
             
             # Set the toolbar view as window content
             win.set_content(toolbar_view)
+            # Composables add persistent header items through chrome_slot()
+            win._gcompose_header_bar = header_bar
         else:
             # Frameless mode
             win.set_decorated(False)
-            win.set_content(root)
-        
+            win.set_content(content)
+        startup.mark("window_created")
+
+        if self.monitor_frames and self.frame_monitor is None:
+            from .frame_monitor import FrameMonitor
+            self.frame_monitor = FrameMonitor(win).start()
+
         # 5 Mount UI into root
         try:
             from .renderer import mount
@@ -80,26 +112,37 @@ class ComposeApp(Adw.Application):
             root.append(lbl)
         
         win.present()
+        startup.mark("presented")
+        startup.watch_first_frame(win)
+
+    def do_shutdown(self):
+        if self.frame_monitor is not None:
+            self.frame_monitor.log_histograms()
+            self.frame_monitor.stop()
+        Adw.Application.do_shutdown(self)
 
     def _apply_root_theme(self, root):
-        """Apply background and text color theming to the root container."""
-        css_parts = []
-        if self.bg_color:
-            css_parts.append(f"background-color: {self.bg_color};")
-        if self.text_color:
-            css_parts.append(f"color: {self.text_color};")
-
-        if css_parts:
-            css = f".app-root {{ {' '.join(css_parts)} }}"
-            provider = Gtk.CssProvider()
-            provider.load_from_string(css)
-
-            # Add CSS class to root
-            root.add_css_class("app-root")
-
-            # Apply the provider
-            Gtk.StyleContext.add_provider_for_display(
-                Gdk.Display.get_default(),
-                provider,
-                Gtk.STYLE_PROVIDER_PRIORITY_USER
-            )
+        """Register the app themes and activate the initial one.
+
+        bg_color/text_color become the "default" theme. Each theme is compiled
+        once into its own provider; switching swaps providers without rerendering.
+        """
+        from gcompose.styling.theme import Theme, get_theme_manager, ROOT_CLASS
+
+        root.add_css_class(ROOT_CLASS)
+
+        manager = get_theme_manager()
+        if self.bg_color or self.text_color:
+            manager.register("default", Theme(self.bg_color, self.text_color))
+        for name, theme in self.themes.items():
+            manager.register(name, theme)
+
+        initial = self.theme or ("default" if "default" in manager.themes else None)
+        if initial:
+            manager.set_theme(initial)
+
+    def set_theme(self, name):
+        """Switch to a registered theme (or "auto") without rebuilding the UI."""
+        from gcompose.styling.theme import set_theme
+
+        set_theme(name)
@@ -0,0 +1,293 @@
+"""
+Frame-time and input-latency monitor.
+
+Attaches to a window's Gdk.FrameClock and records:
+- frame intervals (from the frame clock's frame time)
+- missed frames (intervals longer than the display refresh interval)
+- input-to-paint latency (key press / click to the next after-paint)
+- long frames, attributed to the Composition.rerender calls that ran in them
+
+GTK stops the frame clock while nothing changes, so a gap longer than
+IDLE_GAP_FRAMES refresh intervals may be idle time rather than a slow frame.
+If an input event or a rerender happened in the gap, the frame is measured
+from the first of them (a stalled handler still counts in full); otherwise
+only the frame's own work, from before-paint to after-paint, is counted.
+
+Opt in with ComposeApp(..., frame_monitor=True) or GCOMPOSE_FRAME_MONITOR=1.
+Histograms are logged when the app shuts down; FrameStats (gcompose.widgets.
+frame_stats) shows live numbers on screen.
+"""
+
+import gi
+
+gi.require_version("Gtk", "4.0")
+
+import bisect
+import logging
+import time
+from collections import deque
+
+from gi.repository import Gtk
+
+from ..compose.runtime import Composition
+from ..state import make_state
+
+logger = logging.getLogger("gcompose.frames")
+
+# Histogram bucket upper bounds in milliseconds (last bucket is open-ended)
+BUCKETS_MS = (4, 8, 12, 17, 25, 33, 50, 100, 250)
+
+# Assumed refresh interval when the frame clock cannot report one (60 Hz)
+DEFAULT_REFRESH_US = 16667
+
+# Gaps longer than this many refresh intervals mean the clock was idle
+IDLE_GAP_FRAMES = 4
+
+
+class Histogram:
+    """Fixed-bucket histogram of millisecond samples."""
+
+    def __init__(self, bounds=BUCKETS_MS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.total = 0
+        self.max = 0.0
+
+    def add(self, value_ms):
+        self.counts[bisect.bisect_left(self.bounds, value_ms)] += 1
+        self.total += 1
+        self.max = max(self.max, value_ms)
+
+    def percentile(self, p):
+        """Upper bound of the bucket containing the p-th percentile."""
+        if not self.total:
+            return 0.0
+        target = self.total * p / 100
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return float(self.bounds[i]) if i < len(self.bounds) else self.max
+        return self.max
+
+    def format(self, title):
+        lines = [f"{title} (n={self.total}, max={self.max:.1f} ms)"]
+        lower = 0
+        for i, count in enumerate(self.counts):
+            label = (
+                f"{lower}-{self.bounds[i]} ms" if i < len(self.bounds) else f">{lower} ms"
+            )
+            if i < len(self.bounds):
+                lower = self.bounds[i]
+            share = count / self.total if self.total else 0
+            lines.append(f"  {label:>12} {count:>7} {'#' * round(share * 40)}")
+        return "\n".join(lines)
+
+
+class FrameMonitor:
+    """Records frame timing for one window.
+
+    Args:
+        window: Gtk.Window to monitor
+        long_frame_ms: Frames longer than this are kept in `long_frames`
+        stats_interval_ms: How often the `stats` state object is refreshed
+    """
+
+    def __init__(self, window, long_frame_ms=33.0, stats_interval_ms=500, max_long_frames=100):
+        self.window = window
+        self.long_frame_ms = long_frame_ms
+        self.stats_interval_ms = stats_interval_ms
+
+        self.frame_times = Histogram()
+        self.input_latency = Histogram()
+        self.frames = 0
+        self.missed_frames = 0
+        self.long_frames = deque(maxlen=max_long_frames)
+
+        # Live numbers for the overlay; updated at stats_interval_ms, not per frame
+        self.stats = make_state(fps=0.0, frame_p95=0.0, missed=0, latency=0.0)
+
+        self._clock = None
+        self._paint_handler = None
+        self._before_paint_handler = None
+        self._map_handler = None
+        self._controllers = []
+        self._last_frame_us = None
+        self._pending_input = None
+        self._busy_since = None  # first input/rerender since the previous paint
+        self._frame_start = None  # before-paint of the current frame
+        self._rerenders = []  # (start, duration) since the previous paint
+        self._window_frames = 0
+        self._window_active_ms = 0.0  # time the clock was ticking this window
+        self._window_start = time.perf_counter()
+        self._last_latency = 0.0
+
+    # -- lifecycle -----------------------------------------------------
+
+    def start(self):
+        """Start monitoring (safe to call before the window is realized)."""
+        Composition._rerender_observers.append(self._on_rerender)
+
+        key = Gtk.EventControllerKey()
+        key.set_propagation_phase(Gtk.PropagationPhase.CAPTURE)
+        key.connect("key-pressed", self._on_input)
+        click = Gtk.GestureClick()
+        click.set_propagation_phase(Gtk.PropagationPhase.CAPTURE)
+        click.connect("pressed", self._on_input)
+        for controller in (key, click):
+            self.window.add_controller(controller)
+            self._controllers.append(controller)
+
+        if self.window.get_frame_clock() is not None:
+            self._attach_clock()
+        else:
+            self._map_handler = self.window.connect("map", self._attach_clock)
+        return self
+
+    def stop(self):
+        """Detach from the window and the composition."""
+        if self._on_rerender in Composition._rerender_observers:
+            Composition._rerender_observers.remove(self._on_rerender)
+        for controller in self._controllers:
+            self.window.remove_controller(controller)
+        self._controllers = []
+        if self._map_handler is not None:
+            self.window.disconnect(self._map_handler)
+            self._map_handler = None
+        if self._paint_handler is not None:
+            self._clock.disconnect(self._paint_handler)
+            self._clock.disconnect(self._before_paint_handler)
+            self._paint_handler = None
+            self._before_paint_handler = None
+
+    def _attach_clock(self, *_args):
+        if self._map_handler is not None:
+            self.window.disconnect(self._map_handler)
+            self._map_handler = None
+        self._clock = self.window.get_frame_clock()
+        if self._clock is not None:
+            self._before_paint_handler = self._clock.connect(
+                "before-paint", self._on_before_paint
+            )
+            self._paint_handler = self._clock.connect("after-paint", self._on_after_paint)
+
+    # -- event handlers ------------------------------------------------
+
+    def _on_input(self, *_args):
+        # Keep the oldest unpainted input; latency is measured from it
+        if self._pending_input is None:
+            self._pending_input = time.perf_counter()
+            self._mark_busy(self._pending_input)
+        return False
+
+    def _on_rerender(self, composition, start, duration):
+        if composition.get_window() is self.window:
+            self._rerenders.append((start, duration))
+            self._mark_busy(start)
+
+    def _mark_busy(self, since):
+        if self._busy_since is None or since < self._busy_since:
+            self._busy_since = since
+
+    def _on_before_paint(self, _clock):
+        self._frame_start = time.perf_counter()
+
+    def _refresh_interval_us(self, clock):
+        try:
+            refresh_us, _presentation = clock.get_refresh_info(clock.get_frame_time())
+        except (AttributeError, TypeError):
+            refresh_us = 0
+        return refresh_us or DEFAULT_REFRESH_US
+
+    def _on_after_paint(self, clock):
+        now = time.perf_counter()
+        frame_us = clock.get_frame_time()
+        self.frames += 1
+
+        if self._last_frame_us is not None:
+            interval_ms = (frame_us - self._last_frame_us) / 1000
+            refresh_ms = self._refresh_interval_us(clock) / 1000
+            rerender_ms = sum(d for _s, d in self._rerenders) * 1000
+
+            if interval_ms > refresh_ms * IDLE_GAP_FRAMES:
+                # The clock was idle before this frame: measure from the first
+                # input/rerender that led to it, or else the frame's own work
+                since = self._busy_since
+                if since is None:
+                    since = self._frame_start if self._frame_start is not None else now
+                interval_ms = (now - since) * 1000
+
+            self.frame_times.add(interval_ms)
+            missed = max(0, round(interval_ms / refresh_ms) - 1)
+            self.missed_frames += missed
+            self._window_frames += 1
+            self._window_active_ms += max(interval_ms, refresh_ms)
+
+            if interval_ms > self.long_frame_ms:
+                self.long_frames.append(
+                    {
+                        "interval_ms": round(interval_ms, 2),
+                        "missed": missed,
+                        "rerenders": len(self._rerenders),
+                        "rerender_ms": round(rerender_ms, 2),
+                    }
+                )
+                if self._rerenders:
+                    logger.debug(
+                        "long frame %.1f ms: %d rerender(s) took %.1f ms",
+                        interval_ms, len(self._rerenders), rerender_ms,
+                    )
+        self._last_frame_us = frame_us
+        self._rerenders.clear()
+        self._busy_since = None
+        self._frame_start = None
+
+        if self._pending_input is not None:
+            self._last_latency = (now - self._pending_input) * 1000
+            self.input_latency.add(self._last_latency)
+            self._pending_input = None
+
+        elapsed_ms = (now - self._window_start) * 1000
+        if elapsed_ms >= self.stats_interval_ms:
+            self._publish_stats(elapsed_ms)
+
+    def _publish_stats(self, elapsed_ms):
+        # Frames per second of active painting; an idle window reports 0
+        active_ms = self._window_active_ms
+        self.stats.fps = self._window_frames * 1000 / active_ms if active_ms else 0.0
+        self.stats.frame_p95 = self.frame_times.percentile(95)
+        self.stats.missed = self.missed_frames
+        self.stats.latency = self._last_latency
+        self._window_frames = 0
+        self._window_active_ms = 0.0
+        self._window_start = time.perf_counter()
+
+    # -- reporting -----------------------------------------------------
+
+    def summary(self):
+        """Return the collected data as a dict."""
+        return {
+            "frames": self.frames,
+            "missed_frames": self.missed_frames,
+            "frame_p50_ms": self.frame_times.percentile(50),
+            "frame_p95_ms": self.frame_times.percentile(95),
+            "input_latency_p95_ms": self.input_latency.percentile(95),
+            "long_frames": list(self.long_frames),
+        }
+
+    def log_histograms(self, level=logging.INFO):
+        logger.log(level, self.frame_times.format("frame interval"))
+        logger.log(level, self.input_latency.format("input-to-paint latency"))
+        logger.log(
+            level,
+            "frames=%d missed=%d long=%d",
+            self.frames, self.missed_frames, len(self.long_frames),
+        )
+
+
+def get_frame_monitor():
+    """Return the running app's FrameMonitor, or None when monitoring is off."""
+    return getattr(Composition.get_app(), "frame_monitor", None)
+
+
+__all__ = ["FrameMonitor", "Histogram", "get_frame_monitor"]
@@ -1,4 +1,10 @@
+import logging
+
 from ..compose.runtime import Composition
+from ..styling.css import flush_arbitrary_classes
+from . import startup
+
+logger = logging.getLogger("gcompose.layout")
 
 
 def _clear(container):
@@ -12,18 +18,44 @@ def mount(root, render_fn, app=None, win=None, frameless=False):
     """
     Mount root composable and render UI.
     v1: full redraw on every state change.
+
+    Each call creates an independent Composition, so several windows (or
+    gcompose islands embedded in a hand-written GTK app) can be mounted at
+    once; rerendering one leaves the others untouched.
+
+    Returns:
+        The Composition for this root (call .rerender() on it to update)
+
+    Example (island inside an existing GTK app):
+        box = Gtk.Box()
+        sidebar.append(box)
+        island = mount(box, StatusPanel)
+        ...
+        island.rerender()
     """
-    Composition.set_root(root)
-    Composition.set_app(app)
-    Composition.set_window(win)
+    composition = Composition(root=root, app=app, window=win)
 
     def render():
         _clear(root)
-        Composition._stack = [root]
-        Composition.reset_hooks()
+        # Drop every handler connected by the previous render in one pass
+        signals = composition.signals
+        signals.disconnect_generation(signals.next_generation())
+        composition._stack = [root]
+        composition.reset_hooks()
         render_fn()
-        Composition._stack.pop()
-        Composition.end_render()
+        composition._stack.pop()
+        composition.end_render()
+        # Load arbitrary-value classes generated during this render in one reparse
+        flush_arbitrary_classes()
+        if composition.elided_widgets:
+            logger.debug(
+                "flattening elided %d wrapper widget(s) (%d total)",
+                composition.elided_widgets, composition.elided_total,
+            )
 
-    Composition._render = render
-    render()
+    composition._render = render
+    # Code running outside renders and callbacks targets the latest mount
+    Composition.activate(composition)
+    composition.render()
+    startup.mark_once("first_render")
+    return composition
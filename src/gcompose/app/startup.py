@@ -0,0 +1,133 @@
+"""
+Startup timeline instrumentation.
+
+ComposeApp records a marker at each startup phase, from `import gcompose` to
+the first frame painted by the window's frame clock:
+
+    import -> adw_startup -> css_loaded -> window_created -> first_render
+           -> presented -> first_frame
+
+Set GCOMPOSE_STARTUP_TRACE=table (or =json) to print the timeline to stderr
+once the first frame is painted. From tests, read it with `report()`.
+"""
+
+import json
+import os
+import sys
+import time
+from typing import Dict, List, Optional
+
+ENV_VAR = "GCOMPOSE_STARTUP_TRACE"
+
+_marks = []  # (phase, perf_counter seconds)
+_emitted = False
+
+
+def _process_age() -> Optional[float]:
+    """Seconds since the process started (Linux only, ~10 ms resolution)."""
+    try:
+        with open("/proc/self/stat") as f:
+            # Field 22 (starttime) follows the ")" closing the command name
+            fields = f.read().rsplit(")", 1)[1].split()
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+        return uptime - int(fields[19]) / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _process_start() -> float:
+    age = _process_age()
+    now = time.perf_counter()
+    return now - age if age is not None else now
+
+
+# Timeline origin on the perf_counter clock, as close to exec() as we can get
+_origin = _process_start()
+
+
+def mark(phase: str):
+    """Record that `phase` has just completed."""
+    _marks.append((phase, time.perf_counter()))
+
+
+def mark_once(phase: str):
+    """Record `phase` unless it was already recorded (e.g. first_render)."""
+    if not any(name == phase for name, _ in _marks):
+        mark(phase)
+
+
+def reset():
+    """Clear all markers and restart the timeline from now (for tests)."""
+    global _origin, _emitted
+    _marks.clear()
+    _origin = time.perf_counter()
+    _emitted = False
+
+
+def report() -> List[Dict[str, float]]:
+    """Return the timeline as a list of {phase, at_ms, delta_ms} dicts.
+
+    at_ms is measured from process start; delta_ms from the previous marker.
+    """
+    rows = []
+    previous = _origin
+    for phase, at in _marks:
+        rows.append(
+            {
+                "phase": phase,
+                "at_ms": round((at - _origin) * 1000, 3),
+                "delta_ms": round((at - previous) * 1000, 3),
+            }
+        )
+        previous = at
+    return rows
+
+
+def format_table(rows=None) -> str:
+    """Render the timeline as a plain-text table."""
+    rows = report() if rows is None else rows
+    lines = [f"{'phase':<16}{'at ms':>10}{'delta ms':>10}"]
+    for row in rows:
+        lines.append(f"{row['phase']:<16}{row['at_ms']:>10.1f}{row['delta_ms']:>10.1f}")
+    return "\n".join(lines)
+
+
+def emit(mode=None, stream=None):
+    """Print the timeline if requested via GCOMPOSE_STARTUP_TRACE (table|json)."""
+    global _emitted
+    mode = mode or os.environ.get(ENV_VAR)
+    if not mode or _emitted:
+        return
+    _emitted = True
+    stream = stream or sys.stderr
+    if mode == "json":
+        print(json.dumps(report()), file=stream)
+    else:
+        print(format_table(), file=stream)
+
+
+def watch_first_frame(window, phase="first_frame"):
+    """Mark `phase` after the window's first frame is painted, then emit the report."""
+
+    def on_after_paint(clock):
+        clock.disconnect(handler_ids.pop("paint"))
+        mark(phase)
+        emit()
+
+    def connect_clock(*_args):
+        if "map" in handler_ids:
+            window.disconnect(handler_ids.pop("map"))
+        clock = window.get_frame_clock()
+        if clock is not None:
+            handler_ids["paint"] = clock.connect("after-paint", on_after_paint)
+
+    handler_ids = {}
+    if window.get_frame_clock() is not None:
+        connect_clock()
+    else:
+        # The frame clock only exists once the window is realized
+        handler_ids["map"] = window.connect("map", connect_clock)
+
+
+__all__ = ["mark", "mark_once", "reset", "report", "format_table", "emit", "watch_first_frame"]
@@ -0,0 +1,292 @@
+"""
+Dev-mode widget and state leak detector.
+
+After every render the detector walks the mounted tree and tracks each widget
+through a GObject weak reference (so tracking never keeps anything alive).
+State objects created by make_state are tracked the same way. Once an object
+has left the tree (or, for state, is not held by a use_state hook), it must be
+finalized within `grace_renders` renders; anything still alive after that is
+reported as leaked, grouped by creating composable and user call site, with
+tracemalloc deltas for those lines.
+
+State that is meant to outlive renders is not reported: objects reachable
+from the app or window through attributes and containers (e.g. the frame
+monitor's stats), and objects passed to mark_long_lived().
+
+Example:
+    detector = LeakDetector(composition).start()
+    for _ in range(20):
+        composition.rerender()
+    print(detector.format_report())
+    detector.stop()
+
+See gcompose.testing.assert_no_leaks for the test helper.
+"""
+
+import gc
+import linecache
+import os
+import tracemalloc
+import types
+from collections import defaultdict, deque
+from typing import Dict, List
+
+from .runtime import Composition
+
+# Files inside the gcompose package; frames from them are framework frames
+_PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_TRACK_ATTR = "_gcompose_leak_id"
+_LONG_LIVED_ATTR = "_gcompose_long_lived"
+
+# How many attribute/container hops from the app and window are followed
+REACHABLE_DEPTH = 6
+
+
+def mark_long_lived(obj):
+    """Exclude `obj` from leak reports (e.g. app-level state in a module global)."""
+    setattr(obj, _LONG_LIVED_ATTR, True)
+    return obj
+
+
+def _reachable_ids(roots, max_depth=REACHABLE_DEPTH):
+    """Leak IDs of tracked objects reachable from `roots`.
+
+    Only instance __dict__s and plain containers are followed, not functions,
+    classes or modules, so the walk stays within application objects.
+    """
+    found = set()
+    seen = set()
+    frontier = [root for root in roots if root is not None]
+    for _depth in range(max_depth):
+        next_frontier = []
+        for obj in frontier:
+            if id(obj) in seen:
+                continue
+            seen.add(id(obj))
+            if isinstance(obj, dict):
+                next_frontier.extend(obj.values())
+                continue
+            if isinstance(obj, (list, tuple, set, frozenset, deque)):
+                next_frontier.extend(obj)
+                continue
+            if isinstance(obj, (type, types.ModuleType, types.FunctionType, types.MethodType)):
+                continue
+            attrs = getattr(obj, "__dict__", None)
+            if isinstance(attrs, dict):
+                leak_id = attrs.get(_TRACK_ATTR)
+                if leak_id is not None:
+                    found.add(leak_id)
+                next_frontier.extend(attrs.values())
+        frontier = next_frontier
+    return found
+
+
+def _iter_tree(widget):
+    yield widget
+    child = widget.get_first_child()
+    while child is not None:
+        yield from _iter_tree(child)
+        child = child.get_next_sibling()
+
+
+def _attribute(traceback):
+    """Return (composable_site, call_site) for an allocation traceback."""
+    if traceback is None:
+        return "<unknown>", "<unknown>"
+    composable = "<unknown>"
+    call_site = "<unknown>"
+    # Frames are oldest first; walk from the allocation outwards
+    for frame in reversed(traceback):
+        in_package = os.path.abspath(frame.filename).startswith(_PACKAGE_DIR)
+        if in_package and composable == "<unknown>":
+            composable = f"{os.path.relpath(frame.filename, _PACKAGE_DIR)}:{frame.lineno}"
+        elif not in_package:
+            source = linecache.getline(frame.filename, frame.lineno).strip()
+            call_site = f"{frame.filename}:{frame.lineno}  {source}"
+            break
+    return composable, call_site
+
+
+class _Tracked:
+    __slots__ = ("ref", "kind", "type_name", "created", "removed", "traceback")
+
+    def __init__(self, ref, kind, type_name, created, traceback):
+        self.ref = ref
+        self.kind = kind
+        self.type_name = type_name
+        self.created = created
+        self.removed = None
+        self.traceback = traceback
+
+
+class LeakDetector:
+    """Tracks widgets and state objects across renders and reports survivors.
+
+    Args:
+        composition: Composition to watch (default: the active one)
+        grace_renders: Renders an object may survive after removal
+        nframes: Traceback depth recorded by tracemalloc
+    """
+
+    def __init__(self, composition=None, grace_renders=3, nframes=16):
+        self.composition = composition or Composition.active()
+        self.grace_renders = grace_renders
+        self.nframes = nframes
+        self.generation = 0
+        self._tracked: Dict[int, _Tracked] = {}
+        self._next_id = 0
+        self._baseline = None
+        self._started_tracemalloc = False
+
+    def start(self):
+        """Begin tracking; the currently mounted tree is generation 0."""
+        from ..state import _creation_observers
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.nframes)
+            self._started_tracemalloc = True
+        self._baseline = tracemalloc.take_snapshot()
+
+        Composition._rerender_observers.append(self._on_rerender)
+        _creation_observers.append(self._on_state_created)
+        self.after_render()
+        return self
+
+    def stop(self):
+        from ..state import _creation_observers
+
+        if self._on_rerender in Composition._rerender_observers:
+            Composition._rerender_observers.remove(self._on_rerender)
+        if self._on_state_created in _creation_observers:
+            _creation_observers.remove(self._on_state_created)
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    # -- tracking ------------------------------------------------------
+
+    def _track(self, obj, kind):
+        if getattr(obj, _TRACK_ATTR, None) is not None:
+            return
+        self._next_id += 1
+        leak_id = self._next_id
+        # Setting an attribute also keeps the Python wrapper (and its
+        # allocation traceback) tied to the GObject for its whole lifetime
+        setattr(obj, _TRACK_ATTR, leak_id)
+        ref = obj.weak_ref(self._on_finalized, leak_id)
+        self._tracked[leak_id] = _Tracked(
+            ref,
+            kind,
+            type(obj).__name__,
+            self.generation,
+            tracemalloc.get_object_traceback(obj),
+        )
+
+    def _on_finalized(self, leak_id):
+        self._tracked.pop(leak_id, None)
+
+    def _on_state_created(self, state):
+        self._track(state, "state")
+
+    def _on_rerender(self, composition, _start, _duration):
+        if composition is self.composition:
+            self.after_render()
+
+    def after_render(self):
+        """Advance one generation: track new widgets, mark removed objects."""
+        self.generation += 1
+        gc.collect()
+
+        live = set()
+        root = self.composition.get_root()
+        if root is not None:
+            for widget in _iter_tree(root):
+                self._track(widget, "widget")
+                live.add(getattr(widget, _TRACK_ATTR))
+
+        held_states = {
+            getattr(hook, _TRACK_ATTR, None)
+            for hook in self.composition._hooks
+            if hook is not None
+        }
+        app_states = None  # computed only if some state is not held by a hook
+
+        for leak_id, record in list(self._tracked.items()):
+            if record.removed is not None:
+                continue
+            if record.kind == "widget" and leak_id not in live:
+                record.removed = self.generation
+            elif record.kind == "state" and leak_id not in held_states:
+                obj = record.ref()
+                if obj is None or getattr(obj, _LONG_LIVED_ATTR, False):
+                    continue
+                if app_states is None:
+                    app_states = _reachable_ids(
+                        (self.composition.get_app(), self.composition.get_window())
+                    )
+                if leak_id not in app_states:
+                    record.removed = self.generation
+
+    # -- reporting -----------------------------------------------------
+
+    def leaks(self) -> List[_Tracked]:
+        """Objects still alive more than grace_renders renders after removal."""
+        gc.collect()
+        return [
+            record
+            for record in self._tracked.values()
+            if record.removed is not None
+            and self.generation - record.removed >= self.grace_renders
+            and record.ref() is not None
+        ]
+
+    def report(self) -> List[dict]:
+        """Leaks grouped by (kind, type, composable, call site), largest first."""
+        groups = defaultdict(lambda: {"count": 0, "oldest_render": None})
+        for record in self.leaks():
+            composable, call_site = _attribute(record.traceback)
+            key = (record.kind, record.type_name, composable, call_site)
+            group = groups[key]
+            group["count"] += 1
+            if group["oldest_render"] is None or record.created < group["oldest_render"]:
+                group["oldest_render"] = record.created
+
+        line_deltas = {}
+        if self._baseline is not None and tracemalloc.is_tracing():
+            for stat in tracemalloc.take_snapshot().compare_to(self._baseline, "lineno"):
+                frame = stat.traceback[0]
+                line_deltas[f"{frame.filename}:{frame.lineno}"] = stat.size_diff
+
+        rows = []
+        for (kind, type_name, composable, call_site), group in groups.items():
+            site = call_site.split("  ", 1)[0]
+            rows.append(
+                {
+                    "kind": kind,
+                    "type": type_name,
+                    "composable": composable,
+                    "call_site": call_site,
+                    "count": group["count"],
+                    "oldest_render": group["oldest_render"],
+                    "tracemalloc_delta_bytes": line_deltas.get(site, 0),
+                }
+            )
+        rows.sort(key=lambda row: row["count"], reverse=True)
+        return rows
+
+    def format_report(self) -> str:
+        rows = self.report()
+        if not rows:
+            return f"No leaks after {self.generation} renders"
+        lines = [f"Leaked objects after {self.generation} renders:"]
+        for row in rows:
+            lines.append(
+                f"  {row['count']:>5} x {row['type']} ({row['kind']}) "
+                f"from {row['composable']}, +{row['tracemalloc_delta_bytes']} B\n"
+                f"        at {row['call_site']}"
+            )
+        return "\n".join(lines)
+
+
+__all__ = ["LeakDetector", "mark_long_lived"]
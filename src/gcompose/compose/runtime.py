@@ -1,71 +1,274 @@
+import sys
+import time
+from contextvars import ContextVar
 from functools import wraps
 
+# Composition whose UI is being built or whose callback is running
+_active = ContextVar("gcompose_composition", default=None)
+
+
+def _dispose_hooks(hooks):
+    """Call dispose() on hooks that own resources (monitors, timers, ...)."""
+    for hook in hooks:
+        dispose = getattr(hook, "dispose", None)
+        if dispose is not None:
+            dispose()
+
+
+class _hybridmethod:
+    """Method callable on an instance, or on the class for the active composition.
+
+    `Composition.current()` keeps working from composables and callbacks,
+    while `composition.current()` targets one specific root.
+    """
+
+    def __init__(self, fn):
+        self.fn = fn
+        wraps(fn)(self)
+
+    def __get__(self, obj, cls):
+        if obj is None:
+            obj = cls.active()
+        return self.fn.__get__(obj, cls)
+
 
 class Composition:
-    _root = None
-    _stack = []
-    _render = None
-    _hook_index = 0
-    _hooks = []
-    _rendering = False
-    _app = None
-    _window = None
+    """Render state for one mounted root (a window or an embedded island).
 
-    @classmethod
-    def set_root(cls, root):
-        cls._root = root
+    Each mount() creates its own Composition, so several windows, or gcompose
+    islands inside hand-written GTK apps, keep separate hook state and
+    rerender independently. The composition being rendered is tracked in a
+    context variable; class-level calls such as `Composition.current()` or
+    `Composition.rerender()` resolve to it.
+    """
 
-    @classmethod
-    def set_app(cls, app):
-        cls._app = app
+    # Callables(composition, start, duration) notified after each rerender
+    # of any composition (e.g. FrameMonitor, LeakDetector)
+    _rerender_observers = []
+
+    # Fallback used when nothing has been mounted in this context
+    _default = None
+
+    def __init__(self, root=None, app=None, window=None):
+        self._root = root
+        self._stack = []
+        self._render = None
+        self._hook_index = 0
+        self._hooks = []
+        self._rendering = False
+        self._app = app
+        self._window = window
+        self._signals = None
+        # Wrapper widgets removed by layout flattening (last render / overall)
+        self.elided_widgets = 0
+        self.elided_total = 0
+
+    @property
+    def signals(self):
+        """SignalManager for handlers connected by this composition's renders."""
+        if self._signals is None:
+            from ..utils.signals import SignalManager
+
+            self._signals = SignalManager()
+        return self._signals
 
     @classmethod
-    def set_window(cls, window):
-        cls._window = window
+    def active(cls):
+        """Return the composition for the current context."""
+        composition = _active.get()
+        if composition is None:
+            if cls._default is None:
+                cls._default = cls()
+            composition = cls._default
+        return composition
 
     @classmethod
-    def rerender(cls):
+    def activate(cls, composition):
+        """Make `composition` the ambient one for code outside renders and callbacks."""
+        _active.set(composition)
+
+    @_hybridmethod
+    def set_root(self, root):
+        self._root = root
+
+    @_hybridmethod
+    def set_app(self, app):
+        self._app = app
+
+    @_hybridmethod
+    def set_window(self, window):
+        self._window = window
+
+    @_hybridmethod
+    def get_root(self):
+        return self._root
+
+    @_hybridmethod
+    def get_app(self):
+        return self._app
+
+    @_hybridmethod
+    def get_window(self):
+        return self._window
+
+    @_hybridmethod
+    def reset(self):
+        """Forget the mounted UI and all hook state (used between test runs)."""
+        _dispose_hooks(self._hooks)
+        if self._signals is not None:
+            self._signals.clear()
+        self._root = None
+        self._stack = []
+        self._render = None
+        self._hook_index = 0
+        self._hooks = []
+        self._rendering = False
+        self._app = None
+        self._window = None
+        self.elided_widgets = 0
+        self.elided_total = 0
+
+    def render(self):
+        """Run the render function with this composition active."""
+        if not self._render:
+            return
+        token = _active.set(self)
+        try:
+            self._render()
+        finally:
+            _active.reset(token)
+
+    @_hybridmethod
+    def rerender(self):
         print("DEBUG: Composition.rerender called")
-        if cls._render:
-            cls._render()
+        if self._render:
+            start = time.perf_counter()
+            self.render()
+            if Composition._rerender_observers:
+                duration = time.perf_counter() - start
+                for observer in list(Composition._rerender_observers):
+                    observer(self, start, duration)
 
-    @classmethod
-    def current(cls):
-        return cls._stack[-1]
+    @_hybridmethod
+    def callback(self, fn):
+        """Wrap an event handler so it runs with this composition active.
 
-    @classmethod
-    def push(cls, widget):
-        cls.current().append(widget)
-        cls._stack.append(widget)
+        Handlers connected during a render call Composition.rerender() (or
+        use hooks) on the window they belong to, not on the last mounted one.
+        """
+        if fn is None:
+            return None
 
-    @classmethod
-    def pop(cls):
-        cls._stack.pop()
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            token = _active.set(self)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                _active.reset(token)
 
-    @classmethod
-    def reset_hooks(cls):
-        cls._hook_index = 0
-        cls._rendering = True
+        return wrapper
 
-    @classmethod
-    def end_render(cls):
-        cls._rendering = False
+    @_hybridmethod
+    def connect(self, obj, signal_name, handler, *data, after=False):
+        """Connect a signal handler owned by the current render.
 
-    @classmethod
-    def next_hook(cls):
-        if not cls._rendering:
+        The handler is disconnected when the next render starts, so handlers
+        on objects that outlive a render (state, windows) don't pile up.
+
+        Returns:
+            The handler ID
+        """
+        return self.signals.connect(obj, signal_name, handler, *data, after=after)
+
+    @_hybridmethod
+    def current(self):
+        return self._stack[-1]
+
+    @_hybridmethod
+    def push(self, widget):
+        self.current().append(widget)
+        self._stack.append(widget)
+
+    @_hybridmethod
+    def enter(self, widget):
+        """Make widget the current container without appending it to the parent."""
+        self._stack.append(widget)
+
+    @_hybridmethod
+    def pop(self):
+        self._stack.pop()
+
+    @_hybridmethod
+    def reset_hooks(self):
+        self._hook_index = 0
+        self._rendering = True
+        self.elided_widgets = 0
+
+    @_hybridmethod
+    def note_elided(self, count=1):
+        """Record wrapper widgets that layout flattening did not create."""
+        self.elided_widgets += count
+        self.elided_total += count
+
+    @_hybridmethod
+    def end_render(self):
+        self._rendering = False
+        # Hooks past the last one used this render belong to composables that
+        # were not rendered (unmounted); release the ones holding resources
+        unmounted = self._hooks[self._hook_index :]
+        if unmounted:
+            _dispose_hooks(unmounted)
+            for i in range(self._hook_index, len(self._hooks)):
+                if hasattr(self._hooks[i], "dispose"):
+                    self._hooks[i] = None
+
+    @_hybridmethod
+    def next_hook(self):
+        if not self._rendering:
             raise RuntimeError(
                 "use_state must be called within a composable function during rendering"
             )
-        if cls._hook_index >= len(cls._hooks):
-            cls._hooks.append(None)
-        hook = cls._hooks[cls._hook_index]
-        cls._hook_index += 1
+        if self._hook_index >= len(self._hooks):
+            self._hooks.append(None)
+        hook = self._hooks[self._hook_index]
+        self._hook_index += 1
         return hook
 
-    @classmethod
-    def set_hook(cls, hook):
-        cls._hooks[cls._hook_index - 1] = hook
+    @_hybridmethod
+    def set_hook(self, hook):
+        self._hooks[self._hook_index - 1] = hook
+
+    @_hybridmethod
+    def claim_hook(self, kind, key=None):
+        """next_hook(), returning the hook only if it is a `kind` made with `key`.
+
+        Hooks are matched by position, so when a composable earlier in the
+        tree is skipped conditionally, later slots can hold another
+        composable's hook. A hook of another type, or whose `_hook_key`
+        differs from `key`, is disposed and its slot cleared; the caller then
+        creates its own (and sets `_hook_key` on it) instead of adopting it.
+        """
+        hook = self.next_hook()
+        if hook is None:
+            return None
+        if isinstance(hook, kind) and getattr(hook, "_hook_key", None) == key:
+            return hook
+        _dispose_hooks([hook])
+        self._hooks[self._hook_index - 1] = None
+        return None
+
+    @staticmethod
+    def call_site(depth=2):
+        """(filename, line) of the code calling the hook function; a hook key.
+
+        `depth` counts from the caller of call_site(); @Composable wrapper
+        frames are skipped.
+        """
+        frame = sys._getframe(depth)
+        while frame.f_back is not None and frame.f_code is _COMPOSABLE_WRAPPER:
+            frame = frame.f_back
+        return (frame.f_code.co_filename, frame.f_lineno)
 
 
 def Composable(fn):
@@ -79,3 +282,7 @@ def Composable(fn):
         return fn(*args, **kwargs)
 
     return wrapper
+
+
+# Code object of Composable's wrapper, skipped by Composition.call_site()
+_COMPOSABLE_WRAPPER = Composable(lambda: None).__code__
@@ -1,15 +1,23 @@
 from .runtime import Composition
 
 class WindowState:
-    def __init__(self, window):
+    def __init__(self, window, composition=None):
         self.window = window
+        # Rerender the window this state belongs to, not whichever is active
+        self.composition = composition or Composition.active()
         self._maximized = window.is_maximized()
         # Connect to window state events to keep track
-        self.window.connect("notify::maximized", self._on_maximized_changed)
+        self._handler = self.window.connect("notify::maximized", self._on_maximized_changed)
+
+    def dispose(self):
+        """Stop tracking the window."""
+        if self._handler is not None:
+            self.window.disconnect(self._handler)
+            self._handler = None
 
     def _on_maximized_changed(self, window, param):
         self._maximized = window.is_maximized()
-        Composition.rerender()
+        self.composition.rerender()
 
     def minimize(self):
         self.window.minimize()
@@ -27,4 +35,17 @@ class WindowState:
         self.window.close()
 
 def get_window_state():
-    return WindowState(Composition._window)
\ No newline at end of file
+    """Return the WindowState of the active composition's window.
+
+    One WindowState (and one notify::maximized handler) exists per window;
+    later calls, including every rerender, return the same object.
+    """
+    composition = Composition.active()
+    window = composition.get_window()
+    state = getattr(window, "_gcompose_window_state", None)
+    if state is None or state.composition is not composition:
+        if state is not None:
+            state.dispose()
+        state = WindowState(window, composition)
+        window._gcompose_window_state = state
+    return state
\ No newline at end of file
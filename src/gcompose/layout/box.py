@@ -1,28 +1,154 @@
 import gi
 
 gi.require_version("Gtk", "4.0")
-from gi.repository import Gtk, Gdk
+from gi.repository import Gtk, Gdk, GLib
+import os
+import re
+from collections import OrderedDict
 from contextlib import contextmanager
 from ..compose.runtime import Composition
 from ..styling.css import apply_styles
 
 
+# Set GCOMPOSE_FLATTEN=0 to keep every wrapper (e.g. when inspecting the tree)
+FLATTEN = os.environ.get("GCOMPOSE_FLATTEN", "1") != "0"
+
+PADDING_PATTERN = re.compile(r"^(?:hover:)?p[xytrbl]?-")
+# gap-* is border-spacing: on the content box it would add to `spacing`
+GAP_PATTERN = re.compile(r"^(?:hover:)?gap-")
+
+
+def _needs_wrapper(styles):
+    return bool(styles) and any(
+        PADDING_PATTERN.match(token) or GAP_PATTERN.match(token) for token in styles.split()
+    )
+
+
+# Properties a wrapper must still have at their defaults to be elided; a value
+# set on the yielded box inside the block would be lost with the box. Event
+# controllers are not checked (observe_controllers() slows widgets down):
+# pass flatten=False to a box you add_controller() to.
+_DEFAULT_PROPS = (
+    "visible",
+    "sensitive",
+    "halign",
+    "valign",
+    "hexpand-set",
+    "vexpand-set",
+    "margin-start",
+    "margin-end",
+    "margin-top",
+    "margin-bottom",
+    "width-request",
+    "height-request",
+    "tooltip-text",
+    "tooltip-markup",
+    "name",
+    "opacity",
+    "can-target",
+    "focusable",
+    "overflow",
+    "homogeneous",
+    "baseline-position",
+)
+_reference_box = None
+
+
+def _has_default_properties(box):
+    global _reference_box
+    if _reference_box is None:
+        _reference_box = Gtk.Box()
+    for name in _DEFAULT_PROPS:
+        if box.get_property(name) != _reference_box.get_property(name):
+            return False
+    return True
+
+
+def _unwrap_single_child(box, styles):
+    """Replace a style-less wrapper holding one child with that child.
+
+    Only done when the parent is a Gtk.Box with the same orientation: the
+    child then gets exactly the allocation the wrapper would have given it
+    (spacing is irrelevant with one child, and expand flags propagate). The
+    wrapper must also be untouched: no CSS classes and no properties changed
+    from their defaults.
+    """
+    if not FLATTEN or styles:
+        return box
+    child = box.get_first_child()
+    if child is None or child.get_next_sibling() is not None:
+        return box
+    parent = box.get_parent()
+    if (
+        not isinstance(parent, Gtk.Box)
+        or parent.get_orientation() != box.get_orientation()
+        or box.get_next_sibling() is not None
+        or box.get_css_classes()
+        or not _has_default_properties(box)
+    ):
+        return box
+    box.remove(child)
+    parent.remove(box)
+    parent.append(child)
+    Composition.note_elided()
+    return child
+
+
 @contextmanager
-def Column(spacing=8, styles=None):
+def Column(spacing=8, styles=None, flatten=True):
+    """Vertical container.
+
+    A Column without styles that ends up holding a single child inside
+    another Column is removed, and its child takes its place (see
+    _unwrap_single_child). The yielded box is then detached from the tree:
+    pass flatten=False to keep it when using it after the block (append,
+    set_* calls) or when adding event controllers to it.
+    """
     box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=spacing)
     apply_styles(box, styles)
     Composition.push(box)
     yield box
     Composition.pop()
+    if flatten:
+        _unwrap_single_child(box, styles)
 
 
 @contextmanager
-def Row(spacing=8, styles=None):
+def Row(spacing=8, styles=None, flatten=True):
+    """Horizontal container; flattened like Column inside another Row."""
     box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=spacing)
     apply_styles(box, styles)
     Composition.push(box)
     yield box
     Composition.pop()
+    if flatten:
+        _unwrap_single_child(box, styles)
+
+
+def _scroll_content(orientation, spacing, styles):
+    """Content box for ScrollColumn/ScrollRow, wrapped only if it needs it.
+
+    Padding styles go on a separate wrapper so they pad the scrollable area,
+    and gap styles stay off the content box so they don't add to `spacing`.
+    Without either, the styles are applied to the (expanding) content box
+    itself and the wrapper is elided.
+    """
+    # Inner box for content
+    box = Gtk.Box(orientation=orientation, spacing=spacing)
+    if FLATTEN and not _needs_wrapper(styles):
+        apply_styles(box, styles)
+        box.set_vexpand(True)
+        box.set_hexpand(True)
+        Composition.note_elided()
+        return box, box
+
+    # Padding wrapper (applies padding inline to scrollable area)
+    padding_box = Gtk.Box(orientation=orientation)
+    apply_styles(padding_box, styles)
+    padding_box.append(box)
+    padding_box.set_vexpand(True)
+    padding_box.set_hexpand(True)
+    return padding_box, box
 
 
 @contextmanager
@@ -41,19 +167,11 @@ def ScrollColumn(spacing=8, styles=None):
             for i in range(100):
                 Text(f"Item {i}")
     """
-    # Inner box for content
-    box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=spacing)
-
-    # Padding wrapper (applies padding inline to scrollable area)
-    padding_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
-    apply_styles(padding_box, styles)
-    padding_box.append(box)
-    padding_box.set_vexpand(True)
-    padding_box.set_hexpand(True)
+    content, box = _scroll_content(Gtk.Orientation.VERTICAL, spacing, styles)
 
     # Wrap in ScrolledWindow
     scrolled = Gtk.ScrolledWindow()
-    scrolled.set_child(padding_box)
+    scrolled.set_child(content)
     scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
     scrolled.set_vexpand(True)
     scrolled.set_hexpand(True)
@@ -84,19 +202,11 @@ def ScrollRow(spacing=8, styles=None):
             for i in range(50):
                 Button(f"Tab {i}")
     """
-    # Inner box for content
-    box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=spacing)
-
-    # Padding wrapper (applies padding inline to scrollable area)
-    padding_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
-    apply_styles(padding_box, styles)
-    padding_box.append(box)
-    padding_box.set_vexpand(True)
-    padding_box.set_hexpand(True)
+    content, box = _scroll_content(Gtk.Orientation.HORIZONTAL, spacing, styles)
 
     # Wrap in ScrolledWindow
     scrolled = Gtk.ScrolledWindow()
-    scrolled.set_child(padding_box)
+    scrolled.set_child(content)
     scrolled.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.NEVER)
     scrolled.set_vexpand(True)
     scrolled.set_hexpand(True)
@@ -134,8 +244,284 @@ def HeaderBar(as_type=Row, spacing=8, styles=None):
     # Add handle to current parent and push box to stack
     parent = Composition.current()
     parent.append(handle)
-    Composition._stack.append(box)
+    Composition.enter(box)
 
     yield box
 
-    Composition._stack.pop()
+    Composition.pop()
+
+
+class _Extents:
+    """Item sizes with O(log n) prefix sums and offset lookup (Fenwick tree)."""
+
+    def __init__(self, count, default):
+        self.sizes = [default] * count
+        self._tree = [0] * (count + 1)
+        for i in range(count):
+            j = i + 1
+            self._tree[j] += default
+            parent = j + (j & -j)
+            if parent <= count:
+                self._tree[parent] += self._tree[j]
+
+    def __len__(self):
+        return len(self.sizes)
+
+    def set(self, index, size):
+        delta = size - self.sizes[index]
+        if not delta:
+            return False
+        self.sizes[index] = size
+        j = index + 1
+        while j < len(self._tree):
+            self._tree[j] += delta
+            j += j & -j
+        return True
+
+    def prefix(self, index):
+        """Total size of items [0, index)."""
+        total = 0
+        while index > 0:
+            total += self._tree[index]
+            index -= index & -index
+        return total
+
+    def find(self, offset):
+        """Index of the item covering `offset` (clamped to the last item)."""
+        index = 0
+        step = 1 << len(self._tree).bit_length()
+        while step:
+            nxt = index + step
+            if nxt < len(self._tree) and self._tree[nxt] <= offset:
+                index = nxt
+                offset -= self._tree[nxt]
+            step >>= 1
+        return min(index, len(self.sizes) - 1)
+
+
+class _LazyList:
+    """Virtualized list of arbitrary composables inside a ScrolledWindow.
+
+    Only items within the viewport plus `prefetch` viewports on each side are
+    mounted. Items are laid out between two spacers sized from measured
+    extents (or the estimate, for items not yet seen). Items scrolled out of
+    range are detached and kept in a bounded cache, so scrolling back does
+    not rebuild them; beyond that their holders are emptied and reused.
+    """
+
+    def __init__(self, items, item_fn, orientation, estimate, spacing, prefetch, max_cached, memo):
+        self.items = items
+        self.item_fn = item_fn
+        self.vertical = orientation == Gtk.Orientation.VERTICAL
+        self.spacing = spacing
+        self.prefetch = prefetch
+        self.max_cached = max_cached
+        self.composition = Composition.active()
+
+        # Measured extents and scroll position survive rerenders (see memo)
+        if memo.get("count") != len(items) or memo.get("estimate") != estimate:
+            memo.clear()
+            memo.update(count=len(items), estimate=estimate, value=0.0)
+            memo["extents"] = _Extents(len(items), estimate + spacing)
+        self.memo = memo
+        self.extents = memo["extents"]
+
+        self.box = Gtk.Box(orientation=orientation)
+        self.before = Gtk.Box()
+        self.after = Gtk.Box()
+        self.box.append(self.before)
+        self.box.append(self.after)
+
+        self.scrolled = Gtk.ScrolledWindow()
+        self.scrolled.set_child(self.box)
+        if self.vertical:
+            self.scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
+            self.adjustment = self.scrolled.get_vadjustment()
+        else:
+            self.scrolled.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.NEVER)
+            self.adjustment = self.scrolled.get_hadjustment()
+        self.scrolled.set_vexpand(True)
+        self.scrolled.set_hexpand(True)
+
+        self.mounted = {}  # index -> holder, in the box
+        self.detached = OrderedDict()  # index -> holder, built but off-screen
+        self.pool = []  # empty holders
+        self.range = (0, 0)
+        self._restored = memo["value"] == 0.0
+        self._update_pending = False
+
+        for signal in ("value-changed", "notify::page-size", "notify::upper"):
+            Composition.connect(self.adjustment, signal, self._schedule_update)
+        self._schedule_update()
+
+    # -- item subtrees -------------------------------------------------
+
+    def _holder(self):
+        if self.pool:
+            return self.pool.pop()
+        holder = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
+        if self.vertical:
+            holder.set_margin_bottom(self.spacing)
+        else:
+            holder.set_margin_end(self.spacing)
+        return holder
+
+    def _build(self, index):
+        holder = self.detached.pop(index, None)
+        if holder is not None:
+            return holder
+        holder = self._holder()
+        composition = self.composition
+        composition.enter(holder)
+        try:
+            self.composition.callback(self.item_fn)(self.items[index])
+        finally:
+            composition.pop()
+        return holder
+
+    def _release(self, index, holder):
+        self.box.remove(holder)
+        self.detached[index] = holder
+        while len(self.detached) > self.max_cached:
+            _old_index, old = self.detached.popitem(last=False)
+            child = old.get_first_child()
+            while child is not None:
+                old.remove(child)
+                child = old.get_first_child()
+            self.pool.append(old)
+
+    # -- layout --------------------------------------------------------
+
+    def _schedule_update(self, *_args):
+        if not self._update_pending:
+            self._update_pending = True
+            GLib.idle_add(self._update, priority=GLib.PRIORITY_HIGH_IDLE)
+
+    def _measure(self):
+        changed = False
+        for index, holder in self.mounted.items():
+            size = holder.get_height() if self.vertical else holder.get_width()
+            if size > 0:
+                changed |= self.extents.set(index, size + self.spacing)
+        return changed
+
+    def _set_spacer(self, spacer, size):
+        if self.vertical:
+            spacer.set_size_request(-1, size)
+        else:
+            spacer.set_size_request(size, -1)
+
+    def _update(self):
+        self._update_pending = False
+        # Replaced by a rerender (or empty): nothing to do
+        if not self.items or self.scrolled.get_parent() is None:
+            return GLib.SOURCE_REMOVE
+        remeasured = self._measure()
+        built = False
+
+        if not self._restored and self.adjustment.get_upper() >= self.memo["value"]:
+            self._restored = True
+            self.adjustment.set_value(self.memo["value"])
+
+        value = self.adjustment.get_value()
+        self.memo["value"] = value
+        page = self.adjustment.get_page_size() or self.extents.sizes[0]
+        margin = page * self.prefetch
+        first = self.extents.find(max(0.0, value - margin))
+        last = self.extents.find(value + page + margin) + 1
+
+        if (first, last) != self.range:
+            self.range = (first, last)
+            for index in [i for i in self.mounted if not first <= i < last]:
+                self._release(index, self.mounted.pop(index))
+
+            # Insert missing holders in order, after the previous sibling
+            previous = self.before
+            for index in range(first, last):
+                holder = self.mounted.get(index)
+                if holder is None:
+                    holder = self.mounted[index] = self._build(index)
+                    self.box.insert_child_after(holder, previous)
+                    built = True
+                previous = holder
+
+        self._set_spacer(self.before, self.extents.prefix(first))
+        self._set_spacer(self.after, self.extents.prefix(len(self.extents)) - self.extents.prefix(last))
+
+        # New items are measured once laid out; settle the spacers then
+        if built or remeasured:
+            self.scrolled.add_tick_callback(self._after_layout)
+        return GLib.SOURCE_REMOVE
+
+    def _after_layout(self, _widget, _clock):
+        if self._measure():
+            self._schedule_update()
+        return GLib.SOURCE_REMOVE
+
+
+class _ScrollMemo(dict):
+    """Per-call-site hook remembering a lazy list's scroll position."""
+
+
+def _lazy(items, item_fn, orientation, estimate, spacing, styles, prefetch, max_cached):
+    site = Composition.call_site(3)
+    memo = Composition.claim_hook(_ScrollMemo, key=site)
+    if memo is None:
+        memo = _ScrollMemo()
+        memo._hook_key = site
+        Composition.set_hook(memo)
+    lazy = _LazyList(list(items), item_fn, orientation, estimate, spacing, prefetch, max_cached, memo)
+    apply_styles(lazy.box, styles)
+    Composition.current().append(lazy.scrolled)
+    return lazy.scrolled
+
+
+def LazyColumn(
+    items,
+    item_fn,
+    estimated_height=48,
+    spacing=8,
+    styles=None,
+    prefetch=1.0,
+    max_cached=100,
+):
+    """Scrollable vertical list that only builds the items on screen.
+
+    Unlike ScrollColumn, which builds every child up front, LazyColumn calls
+    `item_fn(item)` only for items in the viewport plus `prefetch` viewports
+    above and below. Items far off-screen are detached (up to `max_cached`
+    are kept built for scrolling back). Any composable works as an item.
+
+    Item composables are built outside the render pass, so they should not
+    call hooks like use_state; keep per-item state in the items themselves.
+
+    Args:
+        items: Sequence of items
+        item_fn: Composable called with one item to build its subtree
+        estimated_height: Height in pixels assumed for items not yet measured
+        spacing: Space between items
+        styles: CSS classes for the content box
+        prefetch: Extra viewports to build on each side
+        max_cached: Off-screen items kept built
+
+    Example:
+        LazyColumn(range(10000), lambda i: Card(i), estimated_height=72)
+    """
+    return _lazy(
+        items, item_fn, Gtk.Orientation.VERTICAL, estimated_height, spacing, styles, prefetch, max_cached
+    )
+
+
+def LazyRow(
+    items,
+    item_fn,
+    estimated_width=120,
+    spacing=8,
+    styles=None,
+    prefetch=1.0,
+    max_cached=100,
+):
+    """Horizontal counterpart of LazyColumn (tracks the hadjustment)."""
+    return _lazy(
+        items, item_fn, Gtk.Orientation.HORIZONTAL, estimated_width, spacing, styles, prefetch, max_cached
+    )
@@ -1,8 +1,133 @@
-from gi.repository import GObject
+import threading
+import weakref
+
+from gi.repository import GObject, GLib
 from typing import Iterable, Dict, Any
 
 from ..compose.runtime import Composition
 
+# Callables(state) notified for every state object created (e.g. LeakDetector)
+_creation_observers = []
+
+# GTK runs on the Python main thread
+_MAIN_THREAD_ID = threading.main_thread().ident
+
+# Worker writes are applied at most once per this interval (about one frame)
+DRAIN_INTERVAL_MS = 16
+
+# Writes from worker threads, coalesced until the main loop drains them:
+# id(state) -> (state, {property: last value})
+_pending_writes: Dict[int, tuple] = {}
+_pending_lock = threading.Lock()
+_drain_scheduled = False
+
+
+def _queue_write(state, name, value):
+    """Queue a write made off the main thread; one timeout drains the queue."""
+    global _drain_scheduled
+    with _pending_lock:
+        entry = _pending_writes.get(id(state))
+        if entry is None:
+            _pending_writes[id(state)] = (state, {name: value})
+        else:
+            entry[1][name] = value
+        if _drain_scheduled:
+            return
+        _drain_scheduled = True
+    # A timeout (not an idle) so sustained writes drain once per frame at most
+    GLib.timeout_add(DRAIN_INTERVAL_MS, _drain_pending_writes)
+
+
+def _drain_pending_writes():
+    global _drain_scheduled
+    with _pending_lock:
+        pending = list(_pending_writes.values())
+        _pending_writes.clear()
+        _drain_scheduled = False
+
+    for state, values in pending:
+        # One batched notify per state, emitted on the main thread
+        state.freeze_notify()
+        try:
+            for name, value in values.items():
+                # Bypass _StateBase.__setattr__: it would discard newer queued writes
+                GObject.Object.__setattr__(state, name, value)
+        finally:
+            state.thaw_notify()
+    return GLib.SOURCE_REMOVE
+
+
+def _discard_pending_write(state, name):
+    """A main-thread write supersedes any older queued worker write to `name`."""
+    with _pending_lock:
+        entry = _pending_writes.get(id(state))
+        if entry is not None:
+            entry[1].pop(name, None)
+
+
+def flush_pending_writes():
+    """Apply queued worker-thread writes now (main thread only, e.g. in tests)."""
+    _drain_pending_writes()
+
+
+class _StateBase(GObject.Object):
+    """Base for make_state classes: writes from worker threads are marshalled
+    to the main loop instead of emitting notify off the GTK thread."""
+
+    _state_fields = frozenset()
+
+    def __setattr__(self, name, value):
+        if name in self._state_fields:
+            if threading.get_ident() != _MAIN_THREAD_ID:
+                _queue_write(self, name, value)
+                return
+            if _pending_writes:
+                _discard_pending_write(self, name)
+        super().__setattr__(name, value)
+
+
+# Values of these types are compared on assignment; equal writes are dropped.
+# Collections always notify so in-place mutation + reassignment still updates.
+_COMPARED_TYPES = (bool, int, float, str)
+
+
+def _property_spec(default):
+    """GObject.Property type/default for a field with this initial value.
+
+    Scalars map to their GLib type. Anything else (lists, dicts, sets, None,
+    arbitrary objects) is stored as a Python object; GLib has no default for
+    those, but the getters below return the initial value themselves.
+    """
+    if isinstance(default, _COMPARED_TYPES):
+        return {"type": type(default), "default": default}
+    return {"type": object}
+
+
+def _state_property(name, default):
+    """GObject property with explicit notify: emitted only when the value changes."""
+    key = "_state_" + name
+    notify_name = name.replace("_", "-")
+    compared = isinstance(default, _COMPARED_TYPES)
+
+    def getter(self):
+        return self.__dict__.get(key, default)
+
+    def setter(self, value):
+        values = self.__dict__
+        if compared:
+            current = values.get(key, default)
+            if type(current) is type(value) and current == value:
+                return
+        values[key] = value
+        self.notify(notify_name)
+
+    return GObject.Property(
+        **_property_spec(default),
+        getter=getter,
+        setter=setter,
+        flags=GObject.ParamFlags.READWRITE | GObject.ParamFlags.EXPLICIT_NOTIFY,
+    )
+
 
 def make_state(**kwargs) -> GObject.Object:
     """Create a lightweight GObject state instance with the given initial fields.
@@ -11,16 +136,29 @@ def make_state(**kwargs) -> GObject.Object:
     model where state is just data. Only explicit Composition.rerender() calls
     trigger UI updates.
 
+    Fields may be assigned from worker threads: such writes are queued and
+    applied on the main loop at most once per DRAIN_INTERVAL_MS, keeping only
+    the last value per field. A main-thread write drops queued worker values
+    for that field, so the newer value wins.
+
+    Assigning a bool/int/float/str field its current value emits no notify,
+    so repeated identical updates cost nothing downstream. Other values
+    (lists, dicts, sets, None, objects) are held as Python objects and always
+    notify on assignment; reassign them rather than mutating in place.
+
     Example:
         state = make_state(count=0, name="foo")
         state.count = 1  # Just updates the property, no rerender
     """
     props = {}
     for name, val in kwargs.items():
-        props[name] = GObject.Property(type=type(val), default=val)
+        props[name] = _state_property(name, val)
+    props["_state_fields"] = frozenset(kwargs)
 
-    StateCls = type("State", (GObject.Object,), props)
+    StateCls = type("State", (_StateBase,), props)
     inst = StateCls()
+    for observer in _creation_observers:
+        observer(inst)
     return inst
 
 
@@ -79,7 +217,7 @@ def adapt(obj: Any, attrs: Iterable[str] = None) -> GObject.Object:
 def bind(state, state_attr, widget, widget_prop="label", flags=None, transform=None):
     """Bind GObject state property to widget property.
 
-    - state: GObject.Object with property `state_attr`
+    - state: GObject.Object with property `state_attr`, or a fast state
     - widget: target Gtk/GObject
     - widget_prop: name of the target property (default: 'label')
     - flags: GObject.BindingFlags (default includes SYNC_CREATE)
@@ -88,10 +226,69 @@ def bind(state, state_attr, widget, widget_prop="label", flags=None, transform=N
     if flags is None:
         flags = GObject.BindingFlags.DEFAULT | GObject.BindingFlags.SYNC_CREATE
 
+    _record_binding(widget, state, state_attr, widget_prop)
+    source = bindable(state, state_attr)
+
     if transform is None:
-        return state.bind_property(state_attr, widget, widget_prop, flags)
+        return source.bind_property(state_attr, widget, widget_prop, flags)
     else:
-        return state.bind_property(state_attr, widget, widget_prop, flags, transform)
+        return source.bind_property(state_attr, widget, widget_prop, flags, transform)
+
+
+def _record_binding(widget, state, state_attr, widget_prop):
+    """Remember bindings on the widget so tooling (gcompose.testing) can inspect them."""
+    entry = (state, state_attr, widget_prop)
+    try:
+        widget._gcompose_bindings.append(entry)
+    except AttributeError:
+        widget._gcompose_bindings = [entry]
+
+
+# state -> {(attr, formatter code): (value, formatted)}
+_format_cache = weakref.WeakKeyDictionary()
+
+
+def _same_value(a, b):
+    if isinstance(a, _COMPARED_TYPES):
+        return type(a) is type(b) and a == b
+    return a is b
+
+
+def _cached_format(state, attr, format):
+    """Wrap `format` so widgets bound to the same field share one result per value.
+
+    Used for Binding(..., pure=True), where the caller promises the result
+    depends on the value alone (no globals such as a locale or settings).
+    Formatters that capture something (closure, defaults) are still not
+    cached: the same lambda written in a composable shares its code object
+    across renders, but not its captured values. Builtins and bound methods
+    (format=str, "{:.1f}".format, obj.method) are not cached either: they
+    have no code object, or their result also depends on `__self__`.
+    """
+    code = getattr(format, "__code__", None)
+    if (
+        code is None
+        or getattr(format, "__self__", None) is not None
+        or getattr(format, "__closure__", None)
+        or getattr(format, "__defaults__", None)
+        or getattr(format, "__kwdefaults__", None)
+    ):
+        return format
+    key = (attr, code)
+
+    def cached(value):
+        try:
+            entries = _format_cache[state]
+        except KeyError:
+            entries = _format_cache[state] = {}
+        hit = entries.get(key)
+        if hit is not None and _same_value(hit[0], value):
+            return hit[1]
+        result = format(value)
+        entries[key] = (value, result)
+        return result
+
+    return cached
 
 
 class Binding:
@@ -110,7 +307,7 @@ class Binding:
         Binding(state, "progress", widget_prop="value")
     """
 
-    def __init__(self, state, attr, format=None, widget_prop="label"):
+    def __init__(self, state, attr, format=None, widget_prop="label", pure=False):
         """Create a binding descriptor.
 
         Args:
@@ -118,18 +315,24 @@ class Binding:
             attr: attribute name on state to bind from
             format: optional callable(value) -> str to transform the value
             widget_prop: widget property to bind to (default: "label")
+            pure: `format` depends only on its argument; its results are then
+                  cached per value and shared by every widget bound to the field
         """
         self.state = state
         self.attr = attr
         self.format = format
         self.widget_prop = widget_prop
+        self.pure = pure
 
     def apply_to(self, widget):
         """Apply this binding to a widget."""
         transform = None
         if self.format is not None:
             # Wrap format function to match GObject.bind_property signature
-            transform = lambda binding, value: self.format(value)
+            format = self.format
+            if self.pure:
+                format = _cached_format(self.state, self.attr, format)
+            transform = lambda binding, value: format(value)
 
         bind(self.state, self.attr, widget, self.widget_prop, transform=transform)
 
@@ -143,7 +346,7 @@ def use_state(**kwargs):
         state = use_state(count=0)
         state.count += 1  # Just updates the property, does NOT rerender
     """
-    hook = Composition.next_hook()
+    hook = Composition.claim_hook(_StateBase)
     if hook is None:
         s = make_state(**kwargs)
         Composition.set_hook(s)
@@ -151,4 +354,20 @@ def use_state(**kwargs):
     return hook
 
 
-__all__ = ["make_state", "adapt", "bind", "use_state", "Binding"]
+from .persist import use_persisted_state  # noqa: E402  (needs make_state above)
+from .fast import make_fast_state, use_fast_state, bindable  # noqa: E402
+from .history import History, use_history  # noqa: E402
+
+__all__ = [
+    "make_state",
+    "adapt",
+    "bind",
+    "use_state",
+    "use_persisted_state",
+    "make_fast_state",
+    "use_fast_state",
+    "use_history",
+    "History",
+    "Binding",
+    "flush_pending_writes",
+]
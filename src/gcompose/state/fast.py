@@ -0,0 +1,184 @@
+"""Fast state: plain __slots__ attributes, GObject properties only where bound.
+
+make_state objects are GObject subclasses, so every attribute read and write
+goes through PyGObject's property machinery. make_fast_state objects store
+fields in __slots__ instead: unbound fields are plain attribute access.
+
+The first time a field is bound (Binding, bind(), a two-way Input), it gets a
+bridge: a small GObject with one notifying property of that name, whose
+value lives in the state's slot. From then on, writes to that field go
+through the bridge and emit notify (only when the value changes), so bound
+widgets update as usual. The other fields stay plain.
+
+Example:
+    stats = use_fast_state(frames=0, fps=0.0, label="")
+    Text(bind=Binding(stats, "label"))       # only "label" is bridged
+
+    for _ in range(10_000):
+        stats.frames += 1                     # plain slot access
+    stats.label = f"{stats.frames} frames"    # notifies the bound Text
+"""
+
+import weakref
+
+from gi.repository import GObject
+from typing import Dict, Tuple
+
+from ..compose.runtime import Composition
+from . import _COMPARED_TYPES, _StateBase, _property_spec
+
+
+class _BoundField:
+    """Data descriptor replacing a slot once its field has a bridge."""
+
+    __slots__ = ("member", "name")
+
+    def __init__(self, member, name):
+        self.member = member
+        self.name = name
+
+    def __get__(self, obj, cls=None):
+        if obj is None:
+            return self
+        return self.member.__get__(obj, cls)
+
+    def __set__(self, obj, value):
+        # The bridge stores into the slot and emits notify
+        setattr(obj._bridges[self.name], self.name, value)
+
+
+_bridge_classes: Dict[Tuple[str, type], type] = {}
+
+
+def _bridge_class(name, sample):
+    """GObject class with a single explicit-notify property `name`."""
+    key = (name, type(sample))
+    cls = _bridge_classes.get(key)
+    if cls is not None:
+        return cls
+
+    notify_name = name.replace("_", "-")
+    compared = isinstance(sample, _COMPARED_TYPES)
+
+    def getter(self):
+        owner = self._owner()
+        return self._member.__get__(owner) if owner is not None else sample
+
+    def setter(self, value):
+        owner = self._owner()
+        if owner is None:
+            return
+        if compared:
+            current = self._member.__get__(owner)
+            if type(current) is type(value) and current == value:
+                return
+        self._member.__set__(owner, value)
+        self.notify(notify_name)
+
+    prop = GObject.Property(
+        **_property_spec(sample),
+        getter=getter,
+        setter=setter,
+        flags=GObject.ParamFlags.READWRITE | GObject.ParamFlags.EXPLICIT_NOTIFY,
+    )
+    # _StateBase marshals worker-thread writes to the main loop
+    cls = _bridge_classes[key] = type(
+        "FastStateBridge", (_StateBase,), {name: prop, "_state_fields": frozenset([name])}
+    )
+    return cls
+
+
+class FastState:
+    """Base class for make_fast_state objects."""
+
+    __slots__ = ()
+
+    def gobject_for(self, attr: str) -> GObject.Object:
+        """Return the GObject that exposes `attr` as a notifying property.
+
+        Created on first use; afterwards writes to `attr` emit notify on it.
+        Connect to "notify::<attr>" on the returned object to observe the field.
+        """
+        bridge = self._bridges.get(attr)
+        if bridge is not None:
+            return bridge
+
+        cls = type(self)
+        member = cls.__dict__.get(attr)
+        if member is None or attr not in cls._state_fields:
+            raise AttributeError(f"{cls.__name__} has no field {attr!r}")
+
+        bridge = _bridge_class(attr, member.__get__(self))()
+        bridge._member = member
+        bridge._owner = weakref.ref(self)
+        self._bridges[attr] = bridge
+        # The class is private to this instance, so only this object changes
+        setattr(cls, attr, _BoundField(member, attr))
+        return bridge
+
+    def bound_fields(self):
+        """Names of the fields that currently have a GObject bridge."""
+        return list(self._bridges)
+
+    def __repr__(self):
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._state_fields)
+        return f"FastState({values})"
+
+
+_RESERVED = set(dir(FastState)) | {"_bridges", "_state_fields"}
+
+
+def make_fast_state(**kwargs) -> FastState:
+    """Create a state object with plain-attribute fields.
+
+    Reads and writes of unbound fields are ordinary slot accesses. Fields
+    become GObject-backed (and emit notify) when first bound; see the module
+    docstring. Unlike make_state, writes to unbound fields do not notify,
+    and worker threads should only write fields that are bound.
+
+    Example:
+        state = make_fast_state(count=0, name="foo")
+        state.count += 1
+    """
+    clash = _RESERVED.intersection(kwargs)
+    if clash:
+        raise ValueError(f"Reserved field name(s) for fast state: {sorted(clash)}")
+
+    StateCls = type(
+        "FastState",
+        (FastState,),
+        {
+            "__slots__": tuple(kwargs) + ("_bridges", "__weakref__"),
+            "_state_fields": frozenset(kwargs),
+        },
+    )
+    inst = StateCls()
+    inst._bridges = {}
+    for name, value in kwargs.items():
+        setattr(inst, name, value)
+    return inst
+
+
+def use_fast_state(**kwargs) -> FastState:
+    """use_state variant returning a make_fast_state object.
+
+    Example:
+        state = use_fast_state(count=0)
+        Text(bind=Binding(state, "count", format=lambda v: f"Count: {v}"))
+    """
+    hook = Composition.claim_hook(FastState)
+    if hook is None:
+        s = make_fast_state(**kwargs)
+        Composition.set_hook(s)
+        return s
+    return hook
+
+
+def bindable(state, attr):
+    """The GObject to bind `attr` on: the state itself, or a fast state's bridge."""
+    if isinstance(state, FastState):
+        return state.gobject_for(attr)
+    return state
+
+
+__all__ = ["FastState", "make_fast_state", "use_fast_state", "bindable"]
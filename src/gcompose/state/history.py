@@ -0,0 +1,362 @@
+"""Undo/redo history for state objects.
+
+use_history(state) records every change to the state's fields as a compact
+diff. Scalars store (old, new). Lists store only the replaced slice. Dicts
+and sets store only the keys that changed. The history keeps one shadow copy
+of each collection field and shares its elements with the live value, so
+memory grows with the size of the edits, not with the size of the state.
+
+Changes made within `group_ms` of each other (e.g. typing) form one undo
+step; history.transaction() groups explicitly. undo() and redo() apply a
+whole step with notify frozen, so bound widgets update once per field.
+
+Example:
+    doc = use_state(title="", tags=[])
+    history = use_history(doc, group_ms=500, max_length=200)
+
+    Input(bind=Binding(doc, "title", widget_prop="text"))
+    Button("Undo", on_click=history.undo,
+           bind=Binding(history.status, "can_undo", widget_prop="sensitive"))
+
+    with history.transaction():
+        doc.title = "Draft"
+        doc.tags = doc.tags + ["new"]
+"""
+
+import sys
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Iterable, List, Optional
+
+from ..compose.runtime import Composition
+from . import make_state
+from ..utils.signals import notify_signal
+from .fast import FastState, bindable
+
+_MISSING = object()
+
+
+def _copy(value):
+    """Shadow copy of a collection (elements are shared, not copied)."""
+    if isinstance(value, list):
+        return list(value)
+    if isinstance(value, dict):
+        return dict(value)
+    if isinstance(value, set):
+        return set(value)
+    return value
+
+
+def _diff(field, old, new):
+    """Return a compact change record turning `old` into `new`, or None."""
+    if isinstance(old, list) and isinstance(new, list):
+        limit = min(len(old), len(new))
+        start = 0
+        while start < limit and old[start] is new[start]:
+            start += 1
+        end = 0
+        while end < limit - start and old[-1 - end] is new[-1 - end]:
+            end += 1
+        removed = tuple(old[start : len(old) - end])
+        added = tuple(new[start : len(new) - end])
+        if not removed and not added:
+            return None
+        return ("list", field, start, removed, added)
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        before, after = {}, {}
+        for key in old.keys() | new.keys():
+            a = old.get(key, _MISSING)
+            b = new.get(key, _MISSING)
+            if a is not b:
+                before[key] = a
+                after[key] = b
+        return ("dict", field, before, after) if before else None
+
+    if isinstance(old, set) and isinstance(new, set):
+        removed = frozenset(old - new)
+        added = frozenset(new - old)
+        return ("set", field, removed, added) if removed or added else None
+
+    if old is new or (type(old) is type(new) and old == new):
+        return None
+    return ("value", field, old, new)
+
+
+def _apply(change, shadow, reverse=False):
+    """Apply a change record (or its inverse) to the shadow values in place."""
+    kind, field = change[0], change[1]
+    if kind == "value":
+        shadow[field] = change[2] if reverse else change[3]
+    elif kind == "list":
+        start, removed, added = change[2], change[3], change[4]
+        if reverse:
+            removed, added = added, removed
+        shadow[field][start : start + len(removed)] = added
+    elif kind == "dict":
+        before, after = change[2], change[3]
+        target = shadow[field]
+        for key, value in (before if reverse else after).items():
+            if value is _MISSING:
+                target.pop(key, None)
+            else:
+                target[key] = value
+    elif kind == "set":
+        removed, added = change[2], change[3]
+        if reverse:
+            removed, added = added, removed
+        shadow[field].difference_update(removed)
+        shadow[field].update(added)
+
+
+def _change_size(change) -> int:
+    """Approximate bytes held by a change record (payload only, shallow)."""
+    size = sys.getsizeof(change)
+    for part in change[2:]:
+        size += sys.getsizeof(part)
+        if isinstance(part, (tuple, frozenset)):
+            size += sum(sys.getsizeof(item) for item in part)
+        elif isinstance(part, dict):
+            size += sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in part.items())
+    return size
+
+
+class _Step:
+    __slots__ = ("changes", "size", "last_change")
+
+    def __init__(self):
+        self.changes = []
+        self.size = 0
+        self.last_change = 0.0
+
+    def add(self, change):
+        self.changes.append(change)
+        self.size += _change_size(change)
+        self.last_change = time.monotonic()
+
+
+class History:
+    """Undo/redo stack for the fields of one state object.
+
+    Args:
+        state: make_state / use_state object (or a fast state)
+        fields: Fields to track (default: all; required for a fast state,
+                whose tracked fields become GObject-bridged)
+        group_ms: Changes closer together than this merge into one step
+                  (0 disables time-based grouping)
+        max_length: Maximum number of undo steps kept
+        max_bytes: Approximate memory budget for recorded diffs
+
+    Attributes:
+        status: State object with can_undo, can_redo and length, for binding
+    """
+
+    def __init__(
+        self,
+        state,
+        fields: Optional[Iterable[str]] = None,
+        group_ms: int = 500,
+        max_length: int = 100,
+        max_bytes: int = 1 << 20,
+    ):
+        if fields is None and isinstance(state, FastState):
+            # Recording needs notify, which would bridge every field
+            raise ValueError("use_history on a fast state needs explicit fields=[...]")
+        self.state = state
+        self.fields = list(fields) if fields is not None else sorted(state._state_fields)
+        self.group_ms = group_ms
+        self.max_length = max_length
+        self.max_bytes = max_bytes
+
+        self.status = make_state(can_undo=False, can_redo=False, length=0)
+        self._undo: deque = deque()
+        self._redo: List[_Step] = []
+        self._bytes = 0
+        self._transaction: Optional[_Step] = None
+        self._break_group = False
+
+        self._shadow = {name: _copy(getattr(state, name)) for name in self.fields}
+        self._handlers = []
+        self._sources = []  # distinct GObjects emitting notify for the fields
+        for name in self.fields:
+            source = bindable(state, name)
+            handler_id = source.connect(notify_signal(name), self._on_notify, name)
+            self._handlers.append((source, handler_id))
+            if source not in self._sources:
+                self._sources.append(source)
+
+    # -- recording -----------------------------------------------------
+
+    def _on_notify(self, obj, _pspec, name):
+        new = getattr(obj, name)
+        change = _diff(name, self._shadow[name], new)
+        if change is None:
+            return
+        self._shadow[name] = _copy(new)
+        self._record(change)
+
+    def _record(self, change):
+        self._redo.clear()
+        if self._transaction is not None:
+            self._transaction.add(change)
+            return
+
+        step = self._undo[-1] if self._undo else None
+        grouping = (
+            step is not None
+            and not self._break_group
+            and self.group_ms > 0
+            and (time.monotonic() - step.last_change) * 1000 < self.group_ms
+        )
+        if grouping:
+            self._bytes -= step.size
+        else:
+            step = _Step()
+            self._undo.append(step)
+        self._break_group = False
+        step.add(change)
+        self._bytes += step.size
+        self._trim()
+        self._update_status()
+
+    def _trim(self):
+        while len(self._undo) > self.max_length or (
+            self._bytes > self.max_bytes and len(self._undo) > 1
+        ):
+            self._bytes -= self._undo.popleft().size
+
+    def _update_status(self):
+        self.status.can_undo = bool(self._undo)
+        self.status.can_redo = bool(self._redo)
+        self.status.length = len(self._undo)
+
+    @contextmanager
+    def _frozen(self):
+        for source in self._sources:
+            source.freeze_notify()
+        try:
+            yield
+        finally:
+            for source in self._sources:
+                source.thaw_notify()
+
+    @contextmanager
+    def transaction(self):
+        """Record every change inside the block as a single undo step."""
+        if self._transaction is not None:
+            # Nested: the outer transaction collects everything
+            yield
+            return
+        step = self._transaction = _Step()
+        try:
+            # Notify (and so recording) happens once per field, at thaw
+            with self._frozen():
+                yield
+        finally:
+            self._transaction = None
+            if step.changes:
+                self._undo.append(step)
+                self._bytes += step.size
+                self._break_group = True
+                self._trim()
+            self._update_status()
+
+    def checkpoint(self):
+        """End the current group: the next change starts a new undo step."""
+        self._break_group = True
+
+    # -- undo / redo ---------------------------------------------------
+
+    def _replay(self, step, reverse):
+        changes = reversed(step.changes) if reverse else step.changes
+        touched = []
+        for change in changes:
+            _apply(change, self._shadow, reverse)
+            if change[1] not in touched:
+                touched.append(change[1])
+
+        # One notify per field: writes go out with notify frozen and our own
+        # recorders blocked (the shadow is already up to date)
+        for source, handler_id in self._handlers:
+            source.handler_block(handler_id)
+        try:
+            with self._frozen():
+                for name in touched:
+                    setattr(self.state, name, _copy(self._shadow[name]))
+        finally:
+            for source, handler_id in self._handlers:
+                source.handler_unblock(handler_id)
+
+    def undo(self) -> bool:
+        """Revert the last step; returns False when there is nothing to undo."""
+        if not self._undo:
+            return False
+        step = self._undo.pop()
+        self._bytes -= step.size
+        self._replay(step, reverse=True)
+        self._redo.append(step)
+        self._break_group = True
+        self._update_status()
+        return True
+
+    def redo(self) -> bool:
+        """Reapply the last undone step; returns False when there is none."""
+        if not self._redo:
+            return False
+        step = self._redo.pop()
+        self._replay(step, reverse=False)
+        self._undo.append(step)
+        self._bytes += step.size
+        self._break_group = True
+        self._update_status()
+        return True
+
+    def clear(self):
+        """Forget all undo and redo steps."""
+        self._undo.clear()
+        self._redo.clear()
+        self._bytes = 0
+        self._update_status()
+
+    @property
+    def memory_bytes(self) -> int:
+        """Approximate bytes held by the undo stack."""
+        return self._bytes
+
+    def dispose(self):
+        """Stop recording (called automatically when the composable unmounts)."""
+        for source, handler_id in self._handlers:
+            if source.handler_is_connected(handler_id):
+                source.disconnect(handler_id)
+        self._handlers = []
+
+
+def use_history(
+    state,
+    fields: Optional[Iterable[str]] = None,
+    group_ms: int = 500,
+    max_length: int = 100,
+    max_bytes: int = 1 << 20,
+) -> History:
+    """Create or retrieve an undo/redo History for `state`.
+
+    Example:
+        doc = use_state(text="")
+        history = use_history(doc)
+        Button("Undo", on_click=history.undo)
+        Button("Redo", on_click=history.redo)
+    """
+    site = Composition.call_site()
+    hook = Composition.claim_hook(History, key=site)
+    if hook is not None and hook.state is state:
+        return hook
+    if hook is not None:
+        hook.dispose()
+    hook = History(state, fields, group_ms, max_length, max_bytes)
+    hook._hook_key = site
+    Composition.set_hook(hook)
+    return hook
+
+
+__all__ = ["History", "use_history"]
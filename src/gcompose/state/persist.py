@@ -0,0 +1,193 @@
+"""Persisted state: use_state backed by a small JSON store under XDG config.
+
+Values are loaded synchronously when the hook is first created. Changes are
+written back after a debounce, by a background thread, via an atomic
+temp-file-and-rename, so typing into a bound Input never blocks on disk.
+"""
+
+import atexit
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+from gi.repository import GLib
+
+from ..compose.runtime import Composition
+from . import _StateBase, make_state
+
+DEFAULT_DEBOUNCE_MS = 300
+
+
+def config_dir(app_id: Optional[str] = None) -> Path:
+    """Directory for persisted state ($XDG_CONFIG_HOME/gcompose/<app_id>)."""
+    base = os.environ.get("XDG_CONFIG_HOME") or os.path.join(
+        os.path.expanduser("~"), ".config"
+    )
+    return Path(base) / "gcompose" / (app_id or "default")
+
+
+class PersistentStore:
+    """One JSON file holding {key: {field: value}} for an app.
+
+    Reads happen once, synchronously. Writes are debounced on the main loop,
+    then handed to a single writer thread that only ever writes the most
+    recent snapshot.
+    """
+
+    def __init__(self, path: Path, debounce_ms: int = DEFAULT_DEBOUNCE_MS):
+        self.path = Path(path)
+        self.debounce_ms = debounce_ms
+        self.data: Dict[str, dict] = self._load()
+        self._timer = None
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._latest = None  # snapshot waiting to be written
+        self._idle = threading.Event()
+        self._idle.set()
+        self._thread = threading.Thread(
+            target=self._writer, name="gcompose-persist", daemon=True
+        )
+        self._thread.start()
+
+    def _load(self) -> Dict[str, dict]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, key: str) -> dict:
+        return dict(self.data.get(key) or {})
+
+    def update(self, key: str, values: dict):
+        """Record new values for `key` and schedule a debounced write.
+
+        Values that JSON cannot represent are rejected here, with a warning,
+        so one bad field does not stop persistence for every key.
+        """
+        try:
+            json.dumps(values)
+        except (TypeError, ValueError) as e:
+            print(f"Warning: not persisting {key!r}: {e}")
+            return
+        self.data[key] = values
+        if self._timer is not None:
+            GLib.source_remove(self._timer)
+        self._timer = GLib.timeout_add(self.debounce_ms, self._on_debounce)
+
+    def _on_debounce(self):
+        self._timer = None
+        self._submit()
+        return GLib.SOURCE_REMOVE
+
+    def _submit(self):
+        # Serialize on the main thread so the writer never sees a dict mid-update
+        try:
+            snapshot = json.dumps(self.data, separators=(",", ":"), sort_keys=True)
+        except (TypeError, ValueError) as e:
+            # e.g. a stored list mutated in place to hold an unserializable value
+            print(f"Warning: could not persist state to {self.path}: {e}")
+            return
+        with self._lock:
+            self._latest = snapshot
+            self._idle.clear()
+        self._wake.set()
+
+    def _writer(self):
+        while True:
+            self._wake.wait()
+            with self._lock:
+                snapshot, self._latest = self._latest, None
+                self._wake.clear()
+            if snapshot is not None:
+                try:
+                    self._write_atomic(snapshot)
+                except OSError as e:
+                    print(f"Warning: could not persist state to {self.path}: {e}")
+            with self._lock:
+                if self._latest is None:
+                    self._idle.set()
+
+    def _write_atomic(self, text: str):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=".state-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def flush(self, timeout: float = 5.0):
+        """Write pending changes now and wait for the writer (e.g. at exit)."""
+        if self._timer is not None:
+            GLib.source_remove(self._timer)
+            self._timer = None
+            self._submit()
+        self._idle.wait(timeout)
+
+
+_stores: Dict[Path, PersistentStore] = {}
+
+
+def get_store(app_id: Optional[str] = None, debounce_ms: int = DEFAULT_DEBOUNCE_MS) -> PersistentStore:
+    """Return the (shared) store for an app, loading it on first use."""
+    path = config_dir(app_id) / "state.json"
+    store = _stores.get(path)
+    if store is None:
+        store = _stores[path] = PersistentStore(path, debounce_ms)
+    return store
+
+
+@atexit.register
+def _flush_all():
+    for store in _stores.values():
+        store.flush()
+
+
+def _current_app_id() -> Optional[str]:
+    app = Composition.get_app()
+    return app.get_application_id() if app is not None else None
+
+
+def use_persisted_state(key: str, debounce_ms: int = DEFAULT_DEBOUNCE_MS, **defaults):
+    """use_state whose values survive restarts.
+
+    Values are loaded synchronously from $XDG_CONFIG_HOME/gcompose/<app_id>/
+    state.json on first render. Every change is written back after
+    `debounce_ms` on a background thread, using an atomic rename.
+    Stored values whose type no longer matches the default are ignored.
+
+    Example:
+        settings = use_persisted_state("settings", name="", dark=False)
+        Input(bind=Binding(settings, "name", widget_prop="text"))
+    """
+    hook = Composition.claim_hook(_StateBase, key=("persisted", key))
+    if hook is not None:
+        return hook
+
+    store = get_store(_current_app_id(), debounce_ms)
+    values = dict(defaults)
+    for name, stored in store.get(key).items():
+        if name in defaults and type(stored) is type(defaults[name]):
+            values[name] = stored
+
+    state = make_state(**values)
+
+    def on_notify(obj, _pspec):
+        store.update(key, {name: getattr(obj, name) for name in defaults})
+
+    state.connect("notify", on_notify)
+    state._hook_key = ("persisted", key)
+    Composition.set_hook(state)
+    return state
+
+
+__all__ = ["use_persisted_state", "PersistentStore", "get_store", "config_dir"]
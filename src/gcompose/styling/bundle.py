@@ -0,0 +1,122 @@
+"""
+Resolved and cached stylesheet bundles.
+
+GTK resolves root.css's @imports with separate file reads and parses comments
+and whitespace at every launch. A bundle is the same stylesheet with imports
+inlined, comments removed and whitespace collapsed. Bundles are cached under
+$XDG_CACHE_HOME/gcompose/css, keyed by a hash of the source file contents, and
+loaded with Gtk.CssProvider.load_from_bytes.
+
+Usage:
+    # Build (or refresh) the cache ahead of time, e.g. in packaging scripts
+    python -m gcompose.styling.bundle [stylesheet.css]
+
+This module deliberately avoids importing GTK so it can run in build scripts.
+"""
+
+import hashlib
+import os
+import re
+import sys
+import tempfile
+from pathlib import Path
+from typing import Optional, Tuple
+
+from .purge import ROOT_CSS, IMPORT_PATTERN, flatten_imports
+
+# Bump when the minifier output changes so stale bundles are not reused
+BUNDLE_VERSION = "1"
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+PUNCTUATION_PATTERN = re.compile(r"\s*([{};,>])\s*")
+
+
+def cache_dir() -> Path:
+    """Directory holding cached bundles ($XDG_CACHE_HOME/gcompose/css)."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return Path(base) / "gcompose" / "css"
+
+
+def minify(css: str) -> str:
+    """Collapse whitespace in comment-free CSS.
+
+    Spaces around ':' are kept, since they are significant in selectors
+    (".a :hover" is not ".a:hover").
+    """
+    css = WHITESPACE_PATTERN.sub(" ", css)
+    css = PUNCTUATION_PATTERN.sub(r"\1", css)
+    return css.replace(";}", "}").strip()
+
+
+def _source_files(path: Path, seen=None) -> list:
+    """Stylesheet and all files it imports, in import order."""
+    path = path.resolve()
+    seen = seen if seen is not None else []
+    if path in seen:
+        return seen
+    seen.append(path)
+    for match in IMPORT_PATTERN.finditer(path.read_text(encoding="utf-8")):
+        _source_files(path.parent / match.group(1), seen)
+    return seen
+
+
+def bundle_key(path=ROOT_CSS) -> str:
+    """Hash of the contents of a stylesheet and everything it imports."""
+    digest = hashlib.sha256(BUNDLE_VERSION.encode())
+    for source in _source_files(Path(path)):
+        digest.update(str(source).encode())
+        digest.update(b"\0")
+        digest.update(source.read_bytes())
+    return digest.hexdigest()[:32]
+
+
+def build_bundle(path=ROOT_CSS) -> bytes:
+    """Flatten and minify a stylesheet without consulting the cache."""
+    return minify(flatten_imports(path)).encode("utf-8")
+
+
+def _write_atomic(target: Path, data: bytes):
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=".bundle-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, target)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def load_bundle(path=ROOT_CSS) -> Tuple[bytes, Optional[Path]]:
+    """Return the bundled stylesheet, building and caching it on a miss.
+
+    Returns:
+        Tuple of (css_bytes, cache_file). cache_file is None when the cache
+        directory is not writable; the bundle is still returned.
+    """
+    cache_file = cache_dir() / f"{bundle_key(path)}.css"
+    try:
+        return cache_file.read_bytes(), cache_file
+    except OSError:
+        pass
+
+    data = build_bundle(path)
+    try:
+        _write_atomic(cache_file, data)
+    except OSError:
+        return data, None
+    return data, cache_file
+
+
+def main(argv=None) -> int:
+    args = sys.argv[1:] if argv is None else argv
+    path = args[0] if args else ROOT_CSS
+    data, cache_file = load_bundle(path)
+    print(f"{len(data)} bytes -> {cache_file or '(cache not writable)'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,28 +2,228 @@ import gi
 
 gi.require_version("Gtk", "4.0")
 
-from gi.repository import Gtk, Gdk
+import atexit
+import os
+import re
+from pathlib import Path
+
+from gi.repository import Gtk, Gdk, GLib
 from .parser import StyleParser, apply_size_properties, apply_alignment_properties
 
 _provider = None
 
+# Classes applied at runtime, recorded for the purge tool (None = disabled)
+_recorded_classes = None
+
+
+def record_class_usage(path=None):
+    """Start recording every CSS class applied through apply_styles.
+
+    Args:
+        path: Optional file to merge the recorded classes into at exit
+              (one class per line, readable by `gcompose.styling.purge --usage`)
+    """
+    global _recorded_classes
+    if _recorded_classes is None:
+        _recorded_classes = set()
+    if path:
+        atexit.register(write_class_usage, path)
+
+
+def get_recorded_classes():
+    """Return the set of classes recorded so far (empty if recording is off)."""
+    return set(_recorded_classes or ())
+
+
+def write_class_usage(path):
+    """Merge recorded classes into `path`, keeping classes from earlier runs."""
+    usage_file = Path(path)
+    classes = get_recorded_classes()
+    if usage_file.exists():
+        classes |= set(usage_file.read_text(encoding="utf-8").split())
+    usage_file.write_text("\n".join(sorted(classes)) + "\n", encoding="utf-8")
+
+
+if os.environ.get("GCOMPOSE_RECORD_CLASSES"):
+    record_class_usage(os.environ["GCOMPOSE_RECORD_CLASSES"])
+
 
 def load_css(path):
     """
     Load CSS file once into GTK.
+
+    The stylesheet is loaded as a cached bundle (imports inlined, comments and
+    whitespace removed), see gcompose.styling.bundle.
     """
     global _provider
     if _provider:
         return
 
+    from .bundle import load_bundle
+
     _provider = Gtk.CssProvider()
-    _provider.load_from_path(path)
+    try:
+        data, _cache_file = load_bundle(path)
+        _provider.load_from_bytes(GLib.Bytes.new(data))
+    except (OSError, UnicodeDecodeError):
+        # Fall back to letting GTK resolve the stylesheet itself
+        _provider.load_from_path(path)
 
     Gtk.StyleContext.add_provider_for_display(
         Gdk.Display.get_default(), _provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
     )
 
 
+# -------------------------------------------------------------------
+# On-demand (JIT) utility classes for arbitrary values: p-[13px], bg-[#1e1e2e]
+# -------------------------------------------------------------------
+
+ARBITRARY_PATTERN = re.compile(r"^([a-z]+(?:-[a-z]+)*)-\[([^\]]+)\]$")
+
+# Values are restricted to characters that cannot break out of a declaration
+ARBITRARY_VALUE_PATTERN = re.compile(r"^[#\w.%(),+\-/ ]+$")
+
+# prefix -> CSS properties set to the arbitrary value
+ARBITRARY_PROPERTIES = {
+    "p": ("padding",),
+    "px": ("padding-left", "padding-right"),
+    "py": ("padding-top", "padding-bottom"),
+    "pt": ("padding-top",),
+    "pr": ("padding-right",),
+    "pb": ("padding-bottom",),
+    "pl": ("padding-left",),
+    "m": ("margin",),
+    "mx": ("margin-left", "margin-right"),
+    "my": ("margin-top", "margin-bottom"),
+    "mt": ("margin-top",),
+    "mr": ("margin-right",),
+    "mb": ("margin-bottom",),
+    "ml": ("margin-left",),
+    "bg": ("background-color",),
+    "rounded": ("border-radius",),
+    "opacity": ("opacity",),
+    "min-w": ("min-width",),
+    "min-h": ("min-height",),
+    "gap": ("border-spacing",),
+}
+
+_jit_provider = None
+_jit_rules = []  # Rule strings, in generation order
+_jit_classes = {}  # token -> generated class name (None if token is not valid)
+_jit_dirty = False
+_jit_flush_source = None
+
+
+def _is_length(value):
+    return bool(re.match(r"^-?[\d.]+(px|em|rem|pt|%)?$", value))
+
+
+def _arbitrary_declarations(prefix, value):
+    """Map an arbitrary-value utility to CSS declarations, or None if unsupported."""
+    if prefix in ARBITRARY_PROPERTIES:
+        return [f"{prop}: {value};" for prop in ARBITRARY_PROPERTIES[prefix]]
+    if prefix == "text":
+        # text-[14px] sets the size, text-[#fff] / text-[red] the color
+        prop = "font-size" if _is_length(value) else "color"
+        return [f"{prop}: {value};"]
+    if prefix == "border":
+        if _is_length(value):
+            return ["border-style: solid;", f"border-width: {value};"]
+        return [f"border-color: {value};"]
+    if prefix == "font":
+        prop = "font-weight" if value.isdigit() else "font-family"
+        return [f"{prop}: {value};"]
+    return None
+
+
+def _jit_class_name(token):
+    """Derive a valid CSS identifier from an arbitrary-value token."""
+    prefix, _, value = token[:-1].partition("[")
+    value = re.sub(r"[^a-zA-Z0-9-]", lambda m: f"_{ord(m.group(0)):x}", value)
+    return f"gc-{prefix}{value}"
+
+
+def resolve_arbitrary_class(token):
+    """Return the generated class for an arbitrary-value token, synthesizing its rule once.
+
+    Returns None when the token is not an arbitrary-value utility. New rules are
+    collected and loaded together by flush_arbitrary_classes().
+    """
+    global _jit_dirty
+    if token in _jit_classes:
+        return _jit_classes[token]
+
+    class_name = None
+    match = ARBITRARY_PATTERN.match(token)
+    if match:
+        prefix, value = match.groups()
+        # Tailwind convention: underscores stand for spaces (font-[Noto_Sans])
+        value = value.replace("_", " ")
+        declarations = (
+            _arbitrary_declarations(prefix, value)
+            if ARBITRARY_VALUE_PATTERN.match(value)
+            else None
+        )
+        if declarations:
+            class_name = _jit_class_name(token)
+            _jit_rules.append(f".{class_name} {{ {' '.join(declarations)} }}")
+            _jit_dirty = True
+            _schedule_jit_flush()
+
+    _jit_classes[token] = class_name
+    return class_name
+
+
+def _schedule_jit_flush():
+    """Flush before the next frame for widgets styled outside a render pass."""
+    global _jit_flush_source
+    if _jit_flush_source is None:
+        _jit_flush_source = GLib.idle_add(
+            _on_jit_flush_idle, priority=GLib.PRIORITY_HIGH_IDLE
+        )
+
+
+def _on_jit_flush_idle():
+    global _jit_flush_source
+    _jit_flush_source = None
+    flush_arbitrary_classes()
+    return GLib.SOURCE_REMOVE
+
+
+def flush_arbitrary_classes():
+    """Load all pending arbitrary-value rules into the shared provider.
+
+    Called at the end of every render, so all new rules from one render cause
+    at most one CSS reparse. Does nothing when no rule was added.
+    """
+    global _jit_provider, _jit_dirty
+    if not _jit_dirty:
+        return
+    display = Gdk.Display.get_default()
+    if display is None:
+        return
+
+    if _jit_provider is None:
+        _jit_provider = Gtk.CssProvider()
+        Gtk.StyleContext.add_provider_for_display(
+            display, _jit_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+        )
+    _jit_provider.load_from_string("\n".join(_jit_rules))
+    _jit_dirty = False
+
+
+def _resolve_classes(classes):
+    """Replace arbitrary-value tokens by their generated class names."""
+    resolved = []
+    for cls in classes:
+        if "[" in cls:
+            cls = resolve_arbitrary_class(cls)
+            if cls is None:
+                continue
+        resolved.append(cls)
+    return resolved
+
+
 def _setup_hover_effects(widget, hover_classes):
     """Setup hover event handlers for widgets to add/remove CSS classes.
 
@@ -31,6 +231,7 @@ def _setup_hover_effects(widget, hover_classes):
         widget: GTK widget to apply hover effects to
         hover_classes: List of CSS class names to apply on hover
     """
+    hover_classes = _resolve_classes(hover_classes)
     if not hover_classes:
         return
 
@@ -57,6 +258,7 @@ def apply_styles(widget, styles_string):
     Unknown classes are ignored by GTK.
 
     Hover format: hover:class-name adds class-name on mouse enter
+    Arbitrary values: p-[13px], bg-[#1e1e2e], text-[14px], hover:bg-[#313244]
     """
     if not styles_string:
         # print("DEBUG: No styles to apply")
@@ -73,6 +275,8 @@ def apply_styles(widget, styles_string):
         # Apply hover effects if present
         if "hover" in parsed_props:
             _setup_hover_effects(widget, parsed_props["hover"])
+            if _recorded_classes is not None:
+                _recorded_classes.update(parsed_props["hover"])
     else:
         pass
         # print("DEBUG: No programmatic properties found")
@@ -80,8 +284,10 @@ def apply_styles(widget, styles_string):
     # Apply remaining CSS classes
     if css_classes:
         # print(f"DEBUG: Applying CSS classes: '{css_classes}'")
-        for cls in css_classes.split():
+        for cls in _resolve_classes(css_classes.split()):
             widget.add_css_class(cls)
+        if _recorded_classes is not None:
+            _recorded_classes.update(css_classes.split())
     else:
         pass
         # print("DEBUG: No CSS classes to apply")
@@ -29,7 +29,7 @@ class StyleParser:
     TEXT_PATTERN = re.compile(r"\btext-(left|center|right)\b")
 
     # Hover state properties: hover:class-name
-    HOVER_PATTERN = re.compile(r"\bhover:(\S+)\b")
+    HOVER_PATTERN = re.compile(r"\bhover:(\S+)")
 
     @staticmethod
     def parse_size_properties(styles: str) -> Tuple[Dict[str, str], str]:
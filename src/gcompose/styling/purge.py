@@ -0,0 +1,332 @@
+"""
+CSS purge tool - emits a minimal stylesheet containing only the rules an app uses.
+
+GTK parses and matches every rule in root.css (and its imports) even though an
+app usually touches a small fraction of the utility classes. This module scans
+an app's sources for `styles=` arguments, optionally merges class names recorded
+at runtime, and writes a single tree-shaken stylesheet that ComposeApp can load
+instead of root.css.
+
+Usage:
+    python -m gcompose.styling.purge app/ -o app/gcompose.min.css
+
+    # Record classes applied at runtime (dynamic style strings), then purge
+    GCOMPOSE_RECORD_CLASSES=classes.txt python app.py
+    python -m gcompose.styling.purge app/ --usage classes.txt -o app/gcompose.min.css
+
+    # Load the result
+    ComposeApp(App, stylesheet="gcompose.min.css").run()
+
+This module deliberately avoids importing GTK so it can run in build scripts.
+"""
+
+import argparse
+import ast
+import re
+import sys
+from pathlib import Path
+from typing import Iterable, List, Optional, Set, Tuple
+
+ROOT_CSS = Path(__file__).parent / "root.css"
+
+IMPORT_PATTERN = re.compile(r"""@import\s+(?:url\()?\s*["']?([^"')\s]+)["']?\s*\)?\s*;""")
+COMMENT_PATTERN = re.compile(r"/\*.*?\*/", re.DOTALL)
+CLASS_PATTERN = re.compile(r"\.(-?[_a-zA-Z][_a-zA-Z0-9-]*)")
+VAR_REF_PATTERN = re.compile(r"var\(\s*(--[_a-zA-Z0-9-]+)")
+
+# Prefix used by the style parser for hover classes (hover:bg-gray-100)
+HOVER_PREFIX = "hover:"
+
+
+def flatten_imports(path, _seen=None) -> str:
+    """Read a stylesheet and inline its @import rules recursively.
+
+    Imports are resolved relative to the importing file. Each file is inlined
+    at most once, so import cycles are harmless.
+    """
+    path = Path(path).resolve()
+    seen = _seen if _seen is not None else set()
+    if path in seen:
+        return ""
+    seen.add(path)
+
+    source = path.read_text(encoding="utf-8")
+
+    def inline(match):
+        return flatten_imports(path.parent / match.group(1), seen)
+
+    return IMPORT_PATTERN.sub(inline, COMMENT_PATTERN.sub("", source))
+
+
+def iter_rules(css: str) -> List[Tuple[str, str]]:
+    """Split comment-free CSS into (prelude, body) pairs.
+
+    Only flat rule sets are expected (GTK CSS has no @media). Nested blocks are
+    kept intact inside the body of their outer rule.
+    """
+    rules = []
+    depth = 0
+    start = 0
+    prelude = ""
+    for i, ch in enumerate(css):
+        if ch == "{":
+            if depth == 0:
+                prelude = css[start:i].strip()
+                start = i + 1
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                rules.append((prelude, css[start:i].strip()))
+                start = i + 1
+    return rules
+
+
+def _tokens_from_string(value: str) -> Set[str]:
+    classes = set()
+    for token in value.split():
+        if token.startswith(HOVER_PREFIX):
+            token = token[len(HOVER_PREFIX):]
+        if token:
+            classes.add(token)
+    return classes
+
+
+def _tokens_from_fstring(node: ast.JoinedStr) -> Set[str]:
+    classes = set()
+    values = node.values
+    for i, part in enumerate(values):
+        if not (isinstance(part, ast.Constant) and isinstance(part.value, str)):
+            continue
+        tokens = part.value.split()
+        # Tokens glued to a formatted value are only partially known
+        if tokens and i > 0 and not part.value[:1].isspace():
+            tokens = tokens[1:]
+        if tokens and i < len(values) - 1 and not part.value[-1:].isspace():
+            tokens = tokens[:-1]
+        classes |= _tokens_from_string(" ".join(tokens))
+    return classes
+
+
+def _tokens_from_node(node) -> Tuple[Set[str], bool]:
+    """Collect class tokens from a `styles=` expression.
+
+    Returns:
+        Tuple of (classes, is_dynamic). is_dynamic is True when part of the
+        expression could not be resolved statically.
+    """
+    if isinstance(node, ast.Constant):
+        if isinstance(node.value, str):
+            return _tokens_from_string(node.value), False
+        return set(), node.value is not None
+
+    if isinstance(node, ast.JoinedStr):
+        return _tokens_from_fstring(node), True
+
+    if isinstance(node, (ast.IfExp, ast.BinOp, ast.BoolOp)):
+        # "a" if cond else "b", "a " + "b", cond and "a" or "b"
+        if isinstance(node, ast.IfExp):
+            children = [node.body, node.orelse]
+        elif isinstance(node, ast.BinOp):
+            children = [node.left, node.right]
+        else:
+            children = node.values
+        classes = set()
+        dynamic = False
+        for child in children:
+            found, child_dynamic = _tokens_from_node(child)
+            classes |= found
+            dynamic = dynamic or child_dynamic
+        return classes, dynamic
+
+    return set(), True
+
+
+def scan_source(source: str, filename: str = "<string>") -> Tuple[Set[str], List[str]]:
+    """Statically collect classes passed via `styles=` keyword arguments.
+
+    Returns:
+        Tuple of (classes, warnings). A warning is emitted for every `styles=`
+        argument that is built dynamically; use runtime recording for those.
+    """
+    tree = ast.parse(source, filename=filename)
+    classes = set()
+    warnings = []
+
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        for keyword in node.keywords:
+            if keyword.arg != "styles":
+                continue
+            found, dynamic = _tokens_from_node(keyword.value)
+            classes |= found
+            if dynamic:
+                warnings.append(
+                    f"{filename}:{keyword.value.lineno}: dynamic styles= value, "
+                    f"record runtime usage to capture it"
+                )
+
+    return classes, warnings
+
+
+def scan_paths(paths: Iterable) -> Tuple[Set[str], List[str]]:
+    """Scan files and directories (recursively, *.py) for used classes."""
+    classes = set()
+    warnings = []
+    for path in paths:
+        path = Path(path)
+        files = sorted(path.rglob("*.py")) if path.is_dir() else [path]
+        for file in files:
+            try:
+                found, file_warnings = scan_source(
+                    file.read_text(encoding="utf-8"), str(file)
+                )
+            except (SyntaxError, UnicodeDecodeError) as e:
+                warnings.append(f"{file}: skipped ({e})")
+                continue
+            classes |= found
+            warnings.extend(file_warnings)
+    return classes, warnings
+
+
+def read_usage_file(path) -> Set[str]:
+    """Read classes recorded at runtime (one class name per line)."""
+    return {
+        line.strip()
+        for line in Path(path).read_text(encoding="utf-8").splitlines()
+        if line.strip()
+    }
+
+
+def _selector_is_used(selector: str, used: Set[str]) -> bool:
+    return all(cls in used for cls in CLASS_PATTERN.findall(selector))
+
+
+def _format_rule(prelude: str, body: str) -> str:
+    declarations = [d.strip() for d in body.split(";") if d.strip()]
+    lines = "\n".join(f"  {d};" for d in declarations)
+    return f"{prelude} {{\n{lines}\n}}"
+
+
+def purge_css(css: str, used: Set[str]) -> Tuple[str, int, int]:
+    """Remove rules whose selectors reference classes outside `used`.
+
+    Selector lists are filtered per selector. Rules without class selectors
+    (element rules, :root) are always kept; custom properties declared in
+    :root are kept only when referenced by a surviving rule.
+
+    Returns:
+        Tuple of (purged_css, kept_rule_count, total_rule_count)
+    """
+    rules = iter_rules(css)
+    kept = []
+    root_blocks = []
+
+    for prelude, body in rules:
+        if prelude.startswith("@"):
+            kept.append((prelude, body))
+            continue
+        if prelude == ":root":
+            root_blocks.append(body)
+            continue
+        selectors = [s.strip() for s in prelude.split(",")]
+        selectors = [s for s in selectors if _selector_is_used(s, used)]
+        if selectors:
+            kept.append((", ".join(selectors), body))
+
+    # Resolve custom properties transitively from the kept rules
+    variables = {}
+    for body in root_blocks:
+        for decl in body.split(";"):
+            name, sep, value = decl.partition(":")
+            if sep and name.strip().startswith("--"):
+                variables[name.strip()] = value.strip()
+
+    needed = set()
+    pending = [ref for _, body in kept for ref in VAR_REF_PATTERN.findall(body)]
+    while pending:
+        name = pending.pop()
+        if name in needed or name not in variables:
+            continue
+        needed.add(name)
+        pending.extend(VAR_REF_PATTERN.findall(variables[name]))
+
+    output = []
+    if needed:
+        root_body = "; ".join(f"{n}: {variables[n]}" for n in variables if n in needed)
+        output.append(_format_rule(":root", root_body))
+    output.extend(_format_rule(p, b) for p, b in kept)
+
+    total = len(rules)
+    kept_count = len(kept) + (1 if needed else 0)
+    return "\n".join(output) + "\n", kept_count, total
+
+
+def purge(
+    paths: Iterable,
+    output=None,
+    usage_files: Iterable = (),
+    safelist: Iterable[str] = (),
+    css_path=ROOT_CSS,
+) -> Tuple[str, List[str]]:
+    """Build a purged stylesheet for the app sources in `paths`.
+
+    Args:
+        paths: App source files or directories to scan
+        output: Optional path to write the purged stylesheet to
+        usage_files: Files produced by runtime class recording
+        safelist: Extra classes to always keep
+        css_path: Stylesheet to purge (default: gcompose root.css)
+
+    Returns:
+        Tuple of (purged_css, warnings)
+    """
+    used, warnings = scan_paths(paths)
+    for usage_file in usage_files:
+        used |= read_usage_file(usage_file)
+    used |= set(safelist)
+
+    css, kept, total = purge_css(flatten_imports(css_path), used)
+    if output:
+        Path(output).write_text(css, encoding="utf-8")
+
+    warnings.append(f"kept {kept} of {total} rules ({len(used)} classes referenced)")
+    return css, warnings
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m gcompose.styling.purge",
+        description="Emit a minimal gcompose stylesheet for an app.",
+    )
+    parser.add_argument("paths", nargs="+", help="app source files or directories")
+    parser.add_argument("-o", "--output", help="output file (default: stdout)")
+    parser.add_argument(
+        "--usage",
+        action="append",
+        default=[],
+        help="runtime class usage file (from GCOMPOSE_RECORD_CLASSES)",
+    )
+    parser.add_argument(
+        "--safelist", nargs="*", default=[], help="classes to always keep"
+    )
+    parser.add_argument("--css", default=str(ROOT_CSS), help="stylesheet to purge")
+    args = parser.parse_args(argv)
+
+    css, warnings = purge(
+        args.paths,
+        output=args.output,
+        usage_files=args.usage,
+        safelist=args.safelist,
+        css_path=args.css,
+    )
+    if not args.output:
+        sys.stdout.write(css)
+    for warning in warnings:
+        print(warning, file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
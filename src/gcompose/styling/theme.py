@@ -0,0 +1,182 @@
+"""
+Precompiled themes with runtime switching.
+
+Each theme is compiled once into its own Gtk.CssProvider. Switching themes adds
+the new provider and removes the previous one in the same main-loop iteration,
+so the change lands in a single restyle without rebuilding the widget tree.
+
+Example:
+    app = ComposeApp(
+        App,
+        themes={
+            "light": Theme(bg_color="#ffffff", text_color="#1e293b"),
+            "dark": Theme(bg_color="#1e1e2e", text_color="#cdd6f4"),
+            "brand": Theme(bg_color="#0f172a", text_color="#f8fafc", accent="#3b82f6"),
+        },
+        theme="auto",  # follow Adw.StyleManager (light/dark)
+    )
+
+    # Later, e.g. from a button handler
+    set_theme("brand")
+"""
+
+import gi
+
+gi.require_version("Gtk", "4.0")
+gi.require_version("Adw", "1")
+
+from gi.repository import Gtk, Gdk, Adw
+from typing import Dict, Optional
+
+# Class added to the root container by ComposeApp; themes target it
+ROOT_CLASS = "app-root"
+
+# Theme name that follows the system light/dark preference
+AUTO = "auto"
+
+
+class Theme:
+    """Color tokens for the app root.
+
+    Args:
+        bg_color: Root background color
+        text_color: Root text color
+        **tokens: Extra CSS custom properties (accent="#3b82f6" -> --accent)
+    """
+
+    def __init__(self, bg_color=None, text_color=None, **tokens):
+        self.bg_color = bg_color
+        self.text_color = text_color
+        self.tokens = tokens
+
+    def variant(self, **overrides):
+        """Return a copy of this theme with some tokens replaced (brand variants)."""
+        values = {"bg_color": self.bg_color, "text_color": self.text_color, **self.tokens}
+        values.update(overrides)
+        return Theme(**values)
+
+    def to_css(self) -> str:
+        """Compile the theme to CSS."""
+        parts = []
+        if self.tokens:
+            variables = " ".join(
+                f"--{name.replace('_', '-')}: {value};"
+                for name, value in self.tokens.items()
+            )
+            parts.append(f":root {{ {variables} }}")
+
+        declarations = []
+        if self.bg_color:
+            declarations.append(f"background-color: {self.bg_color};")
+        if self.text_color:
+            declarations.append(f"color: {self.text_color};")
+        if declarations:
+            parts.append(f".{ROOT_CLASS} {{ {' '.join(declarations)} }}")
+
+        return "\n".join(parts)
+
+
+class ThemeManager:
+    """Registry of themes, each compiled once into its own provider."""
+
+    def __init__(self):
+        self.themes: Dict[str, Theme] = {}
+        self._providers: Dict[str, Gtk.CssProvider] = {}
+        self._active_provider = None
+        self._active_name = None
+        self._requested = None
+        self._style_manager_handler = None
+
+    def register(self, name: str, theme: Theme):
+        """Register (or replace) a theme. A replaced theme is recompiled on next use."""
+        self.themes[name] = theme
+        stale = self._providers.pop(name, None)
+        if stale is not None and stale is self._active_provider:
+            # Recompile and swap in place so the change is visible immediately
+            self._active_provider = None
+            self._swap_to(name)
+            _remove_provider(stale)
+
+    def _provider_for(self, name: str) -> Gtk.CssProvider:
+        provider = self._providers.get(name)
+        if provider is None:
+            provider = Gtk.CssProvider()
+            provider.load_from_string(self.themes[name].to_css())
+            self._providers[name] = provider
+        return provider
+
+    def _swap_to(self, name: Optional[str]):
+        display = Gdk.Display.get_default()
+        if display is None:
+            return
+
+        new_provider = self._provider_for(name) if name else None
+        if new_provider is self._active_provider:
+            return
+
+        # Add before removing so no frame is styled without a theme
+        if new_provider is not None:
+            Gtk.StyleContext.add_provider_for_display(
+                display, new_provider, Gtk.STYLE_PROVIDER_PRIORITY_USER
+            )
+        if self._active_provider is not None:
+            _remove_provider(self._active_provider)
+
+        self._active_provider = new_provider
+        self._active_name = name
+
+    def _resolve(self, name: str) -> Optional[str]:
+        if name != AUTO:
+            return name
+        dark = Adw.StyleManager.get_default().get_dark()
+        preferred = "dark" if dark else "light"
+        if preferred in self.themes:
+            return preferred
+        return "default" if "default" in self.themes else None
+
+    def set_theme(self, name: str):
+        """Activate a registered theme, or AUTO to follow the system color scheme."""
+        if name != AUTO and name not in self.themes:
+            raise ValueError(f"Unknown theme: {name!r}")
+
+        self._requested = name
+        if name == AUTO and self._style_manager_handler is None:
+            style_manager = Adw.StyleManager.get_default()
+            self._style_manager_handler = style_manager.connect(
+                "notify::dark", self._on_dark_changed
+            )
+        self._swap_to(self._resolve(name))
+
+    def _on_dark_changed(self, _style_manager, _pspec):
+        if self._requested == AUTO:
+            self._swap_to(self._resolve(AUTO))
+
+    @property
+    def active(self) -> Optional[str]:
+        """Name of the theme currently applied."""
+        return self._active_name
+
+
+def _remove_provider(provider):
+    display = Gdk.Display.get_default()
+    if display is not None:
+        Gtk.StyleContext.remove_provider_for_display(display, provider)
+
+
+_manager = None
+
+
+def get_theme_manager() -> ThemeManager:
+    """Return the process-wide theme manager."""
+    global _manager
+    if _manager is None:
+        _manager = ThemeManager()
+    return _manager
+
+
+def set_theme(name: str):
+    """Switch the active theme without rerendering."""
+    get_theme_manager().set_theme(name)
+
+
+__all__ = ["Theme", "ThemeManager", "get_theme_manager", "set_theme", "AUTO"]
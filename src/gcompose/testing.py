@@ -0,0 +1,251 @@
+"""
+Headless render harness for composables.
+
+Renders a composable into a root container that is never attached to a
+window, and exposes a queryable snapshot of the resulting widget tree.
+Each run mounts its own Composition, which is reset when the run is closed.
+
+Example:
+    from gcompose.testing import render
+
+    with render(App) as ui:
+        ui.click(text="Increment")
+        ui.rerender()
+        assert ui.find(text="Count: 1") is not None
+        print(ui.snapshot())
+"""
+
+import gi
+
+gi.require_version("Gtk", "4.0")
+
+from gi.repository import Gtk, GLib
+from typing import Callable, List, Optional
+
+from .app.renderer import mount
+from .compose.leaks import LeakDetector, mark_long_lived
+
+
+def _widget_text(widget) -> Optional[str]:
+    """Best-effort user-visible text of a widget."""
+    if isinstance(widget, Gtk.Label):
+        return widget.get_label()
+    if isinstance(widget, Gtk.TextView):
+        buf = widget.get_buffer()
+        return buf.get_text(buf.get_start_iter(), buf.get_end_iter(), False)
+    if isinstance(widget, Gtk.Editable):
+        return widget.get_text()
+    if isinstance(widget, Gtk.DropDown):
+        item = widget.get_selected_item()
+        return item.get_string() if item is not None else None
+    if isinstance(widget, (Gtk.Button, Gtk.CheckButton)):
+        label = widget.get_label()
+        if label:
+            return label
+        # Button builds its own Label child (possibly inside an icon Box)
+        for child in _iter_descendants(widget):
+            if isinstance(child, Gtk.Label):
+                return child.get_label()
+    return None
+
+
+def _iter_children(widget):
+    child = widget.get_first_child()
+    while child is not None:
+        yield child
+        child = child.get_next_sibling()
+
+
+def _iter_descendants(widget):
+    for child in _iter_children(widget):
+        yield child
+        yield from _iter_descendants(child)
+
+
+class WidgetNode:
+    """Snapshot of one widget: type, CSS classes, text, bindings and children."""
+
+    __slots__ = ("widget", "type", "css_classes", "text", "bindings", "children")
+
+    def __init__(self, widget):
+        self.widget = widget
+        self.type = type(widget).__name__
+        self.css_classes = list(widget.get_css_classes())
+        self.text = _widget_text(widget)
+        self.bindings = [
+            {"attr": attr, "prop": prop}
+            for _state, attr, prop in getattr(widget, "_gcompose_bindings", ())
+        ]
+        self.children = [WidgetNode(child) for child in _iter_children(widget)]
+
+    def iter(self):
+        """Yield this node and all descendants, depth first."""
+        yield self
+        for child in self.children:
+            yield from child.iter()
+
+    def to_dict(self):
+        return {
+            "type": self.type,
+            "css_classes": self.css_classes,
+            "text": self.text,
+            "bindings": self.bindings,
+            "children": [child.to_dict() for child in self.children],
+        }
+
+    def format(self, indent=0) -> str:
+        parts = [self.type]
+        if self.css_classes:
+            parts.append("." + ".".join(self.css_classes))
+        if self.text is not None:
+            parts.append(repr(self.text))
+        for binding in self.bindings:
+            parts.append(f"<{binding['prop']}={binding['attr']}>")
+        lines = ["  " * indent + " ".join(parts)]
+        lines.extend(child.format(indent + 1) for child in self.children)
+        return "\n".join(lines)
+
+    def __repr__(self):
+        return self.format()
+
+
+class RenderResult:
+    """A mounted composable with query and interaction helpers."""
+
+    def __init__(self, root, composition):
+        self.root = root
+        self.composition = composition
+
+    def snapshot(self) -> WidgetNode:
+        """Capture the current widget tree below the root."""
+        self.flush()
+        return WidgetNode(self.root)
+
+    def find_all(self, type=None, text=None, css_class=None) -> List[WidgetNode]:
+        """Return all nodes matching every given criterion.
+
+        type may be a widget class or its name ("Button").
+        """
+        matches = []
+        for node in self.snapshot().iter():
+            if type is not None:
+                if isinstance(type, str):
+                    if node.type != type:
+                        continue
+                elif not isinstance(node.widget, type):
+                    continue
+            if text is not None and node.text != text:
+                continue
+            if css_class is not None and css_class not in node.css_classes:
+                continue
+            matches.append(node)
+        return matches
+
+    def find(self, type=None, text=None, css_class=None) -> Optional[WidgetNode]:
+        """Return the first matching node, or None."""
+        matches = self.find_all(type=type, text=text, css_class=css_class)
+        return matches[0] if matches else None
+
+    def _resolve(self, target=None, **query):
+        if target is None:
+            target = self.find(**query)
+            if target is None:
+                raise LookupError(f"No widget matches {query}")
+        return target.widget if isinstance(target, WidgetNode) else target
+
+    def click(self, target=None, **query):
+        """Activate a button/check button/switch, like a user click."""
+        widget = self._resolve(target, **query)
+        if isinstance(widget, (Gtk.CheckButton, Gtk.ToggleButton, Gtk.Switch)):
+            widget.set_active(not widget.get_active())
+        elif isinstance(widget, Gtk.Button):
+            widget.emit("clicked")
+        else:
+            raise TypeError(f"Cannot click a {type(widget).__name__}")
+        self.flush()
+
+    def type_text(self, text, target=None, **query):
+        """Replace the text of an entry or text view."""
+        widget = self._resolve(target, **query)
+        if isinstance(widget, Gtk.TextView):
+            widget.get_buffer().set_text(text)
+        else:
+            widget.set_text(text)
+        self.flush()
+
+    def set_state(self, state, rerender=True, **values):
+        """Assign state fields, then rerender (optional)."""
+        for name, value in values.items():
+            setattr(state, name, value)
+        if rerender:
+            self.rerender()
+        else:
+            self.flush()
+
+    def rerender(self):
+        """Rerender synchronously and settle pending main-loop work."""
+        self.composition.rerender()
+        self.flush()
+
+    @staticmethod
+    def flush():
+        """Dispatch pending main-loop sources so results are deterministic."""
+        context = GLib.MainContext.default()
+        while context.pending():
+            context.iteration(False)
+
+    def close(self):
+        """Unmount: drop the composition's hooks and render function."""
+        self.composition.reset()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def render(fn: Callable, window=None) -> RenderResult:
+    """Render composable `fn` headlessly and return a RenderResult.
+
+    Args:
+        fn: Root composable (the same function passed to ComposeApp)
+        window: Optional window exposed to composables via Composition.get_window()
+    """
+    root = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
+    composition = mount(root, fn, app=None, win=window)
+    result = RenderResult(root, composition)
+    result.flush()
+    return result
+
+
+def assert_no_leaks(fn, renders=20, grace_renders=3, between=None):
+    """Assert that rerendering `fn` repeatedly leaks no widgets or state.
+
+    Args:
+        fn: Root composable to render
+        renders: Number of rerenders to run
+        grace_renders: Renders a removed object may survive before it counts
+        between: Optional callable(result) run before each rerender, e.g. to
+                 click a button or change state
+
+    State reachable from the app or window, or passed to mark_long_lived(),
+    is not counted.
+
+    Raises:
+        AssertionError with the grouped leak report
+    """
+    with render(fn) as result:
+        detector = LeakDetector(result.composition, grace_renders=grace_renders).start()
+        try:
+            for _ in range(renders):
+                if between is not None:
+                    between(result)
+                result.rerender()
+            if detector.leaks():
+                raise AssertionError(detector.format_report())
+        finally:
+            detector.stop()
+
+
+__all__ = ["render", "RenderResult", "WidgetNode", "assert_no_leaks", "mark_long_lived"]
@@ -1,5 +1,31 @@
 """gcompose utilities - collection of helper functions and abstractions."""
 
-from .file_dialogs import FileDialog, open_file, save_file, pick_folder
+from .file_dialogs import (
+    FileDialog,
+    open_file,
+    save_file,
+    pick_folder,
+    scan_directory,
+    open_file_async,
+    save_file_async,
+    pick_folder_async,
+)
+from .file_watch import use_file_watch, FileWatch
+from .file_io import read_bytes_async, read_text_async, write_bytes_async, write_text_async
 
-__all__ = ["FileDialog", "open_file", "save_file", "pick_folder"]
+__all__ = [
+    "FileDialog",
+    "open_file",
+    "save_file",
+    "pick_folder",
+    "scan_directory",
+    "open_file_async",
+    "save_file_async",
+    "pick_folder_async",
+    "read_bytes_async",
+    "read_text_async",
+    "write_bytes_async",
+    "write_text_async",
+    "use_file_watch",
+    "FileWatch",
+]
@@ -31,19 +31,85 @@ Examples:
         title="Select Folder",
         on_folder=lambda path: print(f"Folder: {path}")
     )
+
+    # Await the result (asyncio loop running on GLib, PyGObject >= 3.50)
+    path = await open_file_async(title="Open Document")
 """
 
 import gi
 
 gi.require_version("Gtk", "4.0")
 
-from gi.repository import Gtk, Gio
+import asyncio
+from collections import deque
+from gi.repository import Gtk, Gio, GLib
 from pathlib import Path
 from typing import Callable, Optional, List, Dict
 
+from ..compose.runtime import Composition
+
+
+def _build_dialog(
+    title: str,
+    filters: Optional[List[Dict[str, str]]] = None,
+    initial_folder: Optional[str] = None,
+    suggested_name: Optional[str] = None,
+) -> Gtk.FileDialog:
+    """Create a Gtk.FileDialog with filters, initial folder and name."""
+    dialog = Gtk.FileDialog(title=title, modal=True)
+
+    if filters:
+        filter_store = Gio.ListStore.new(Gtk.FileFilter)
+        for filter_spec in filters:
+            file_filter = Gtk.FileFilter()
+            file_filter.set_name(filter_spec.get("name", "Unknown"))
+            for pattern in filter_spec.get("pattern", "").split(";"):
+                file_filter.add_pattern(pattern.strip())
+            filter_store.append(file_filter)
+        dialog.set_filters(filter_store)
+        dialog.set_default_filter(filter_store.get_item(0))
+
+    if initial_folder:
+        path = Path(initial_folder).expanduser()
+        if path.is_dir():
+            dialog.set_initial_folder(Gio.File.new_for_path(str(path)))
+
+    if suggested_name:
+        dialog.set_initial_name(suggested_name)
+
+    return dialog
+
+
+def _is_dismissed(error: GLib.Error) -> bool:
+    """True when the user closed the dialog (as opposed to a real failure)."""
+    return error.matches(Gtk.DialogError.quark(), Gtk.DialogError.DISMISSED) or error.matches(
+        Gtk.DialogError.quark(), Gtk.DialogError.CANCELLED
+    )
+
+
+def _finish(finish, result, on_result, on_cancel):
+    """Complete an async dialog call, routing dismissal to on_cancel."""
+    try:
+        value = finish(result)
+    except GLib.Error as error:
+        if not _is_dismissed(error):
+            print(f"Warning: file dialog failed: {error.message}")
+        if on_cancel:
+            on_cancel()
+        return
+    if value is None:
+        if on_cancel:
+            on_cancel()
+        return
+    on_result(value)
+
 
 class FileDialog:
-    """High-level file dialog interface with intuitive API."""
+    """High-level file dialog interface with intuitive API.
+
+    Built on Gtk.FileDialog: dialogs are asynchronous and never block the
+    main loop. Callbacks run on the main thread.
+    """
 
     @staticmethod
     def open_file(
@@ -55,6 +121,7 @@ class FileDialog:
         on_cancel: Optional[Callable[[], None]] = None,
         parent_window=None,
         initial_folder: Optional[str] = None,
+        cancellable: Optional[Gio.Cancellable] = None,
     ) -> None:
         """Open a file selection dialog.
 
@@ -67,6 +134,7 @@ class FileDialog:
             on_cancel: Callback when dialog is cancelled
             parent_window: Parent GTK window
             initial_folder: Initial folder path to open
+            cancellable: Optional Gio.Cancellable to close the dialog programmatically
 
         Example:
             FileDialog.open_file(
@@ -75,55 +143,38 @@ class FileDialog:
                 on_file=lambda path: print(f"Selected: {path}")
             )
         """
-        dialog = Gtk.FileChooserDialog(
-            title=title,
-            action=Gtk.FileChooserAction.OPEN,
-            transient_for=parent_window,
-        )
+        dialog = _build_dialog(title, filters, initial_folder)
+        on_file = Composition.callback(on_file)
+        on_files = Composition.callback(on_files)
+        on_cancel = Composition.callback(on_cancel)
 
-        # Add buttons
-        dialog.add_buttons(
-            "Cancel",
-            Gtk.ResponseType.CANCEL,
-            "Open",
-            Gtk.ResponseType.OK,
-        )
+        if multiple:
 
-        # Set multiple selection if requested
-        dialog.set_select_multiple(multiple)
-
-        # Add filters
-        if filters:
-            for filter_spec in filters:
-                file_filter = Gtk.FileFilter()
-                file_filter.set_name(filter_spec.get("name", "Unknown"))
-                for pattern in filter_spec.get("pattern", "").split(";"):
-                    file_filter.add_pattern(pattern.strip())
-                dialog.add_filter(file_filter)
-
-        # Set initial folder
-        if initial_folder:
-            path = Path(initial_folder).expanduser()
-            if path.is_dir():
-                dialog.set_current_folder(Gio.File.new_for_path(str(path)))
-
-        def on_response(dialog, response_id):
-            if response_id == Gtk.ResponseType.OK:
-                if multiple and on_files:
-                    files = dialog.get_files()
-                    paths = [f.get_path() for f in files]
+            def on_result(files):
+                paths = [files.get_item(i).get_path() for i in range(files.get_n_items())]
+                if on_files:
                     on_files(paths)
-                elif on_file:
-                    file = dialog.get_file()
-                    if file:
-                        on_file(file.get_path())
-            elif response_id == Gtk.ResponseType.CANCEL and on_cancel:
-                on_cancel()
+                elif on_file and paths:
+                    on_file(paths[0])
 
-            dialog.destroy()
+            dialog.open_multiple(
+                parent_window,
+                cancellable,
+                lambda d, result: _finish(d.open_multiple_finish, result, on_result, on_cancel),
+            )
+        else:
 
-        dialog.connect("response", on_response)
-        dialog.present()
+            def on_result(file):
+                if on_file:
+                    on_file(file.get_path())
+                elif on_files:
+                    on_files([file.get_path()])
+
+            dialog.open(
+                parent_window,
+                cancellable,
+                lambda d, result: _finish(d.open_finish, result, on_result, on_cancel),
+            )
 
     @staticmethod
     def save_file(
@@ -134,6 +185,7 @@ class FileDialog:
         parent_window=None,
         initial_folder: Optional[str] = None,
         suggested_name: Optional[str] = None,
+        cancellable: Optional[Gio.Cancellable] = None,
     ) -> None:
         """Open a file save dialog.
 
@@ -145,6 +197,7 @@ class FileDialog:
             parent_window: Parent GTK window
             initial_folder: Initial folder path to open
             suggested_name: Suggested filename
+            cancellable: Optional Gio.Cancellable to close the dialog programmatically
 
         Example:
             FileDialog.save_file(
@@ -154,52 +207,20 @@ class FileDialog:
                 on_file=lambda path: print(f"Save to: {path}")
             )
         """
-        dialog = Gtk.FileChooserDialog(
-            title=title,
-            action=Gtk.FileChooserAction.SAVE,
-            transient_for=parent_window,
-        )
-
-        # Add buttons
-        dialog.add_buttons(
-            "Cancel",
-            Gtk.ResponseType.CANCEL,
-            "Save",
-            Gtk.ResponseType.OK,
+        dialog = _build_dialog(title, filters, initial_folder, suggested_name)
+        on_file = Composition.callback(on_file)
+        on_cancel = Composition.callback(on_cancel)
+
+        def on_result(file):
+            if on_file:
+                on_file(file.get_path())
+
+        dialog.save(
+            parent_window,
+            cancellable,
+            lambda d, result: _finish(d.save_finish, result, on_result, on_cancel),
         )
 
-        # Add filters
-        if filters:
-            for filter_spec in filters:
-                file_filter = Gtk.FileFilter()
-                file_filter.set_name(filter_spec.get("name", "Unknown"))
-                for pattern in filter_spec.get("pattern", "").split(";"):
-                    file_filter.add_pattern(pattern.strip())
-                dialog.add_filter(file_filter)
-
-        # Set initial folder
-        if initial_folder:
-            path = Path(initial_folder).expanduser()
-            if path.is_dir():
-                dialog.set_current_folder(Gio.File.new_for_path(str(path)))
-
-        # Set suggested filename
-        if suggested_name:
-            dialog.set_current_name(suggested_name)
-
-        def on_response(dialog, response_id):
-            if response_id == Gtk.ResponseType.OK and on_file:
-                file = dialog.get_file()
-                if file:
-                    on_file(file.get_path())
-            elif response_id == Gtk.ResponseType.CANCEL and on_cancel:
-                on_cancel()
-
-            dialog.destroy()
-
-        dialog.connect("response", on_response)
-        dialog.present()
-
     @staticmethod
     def pick_folder(
         title: str = "Select Folder",
@@ -207,6 +228,7 @@ class FileDialog:
         on_cancel: Optional[Callable[[], None]] = None,
         parent_window=None,
         initial_folder: Optional[str] = None,
+        cancellable: Optional[Gio.Cancellable] = None,
     ) -> None:
         """Open a folder selection dialog.
 
@@ -216,6 +238,7 @@ class FileDialog:
             on_cancel: Callback when dialog is cancelled
             parent_window: Parent GTK window
             initial_folder: Initial folder path to open
+            cancellable: Optional Gio.Cancellable to close the dialog programmatically
 
         Example:
             FileDialog.pick_folder(
@@ -223,41 +246,30 @@ class FileDialog:
                 on_folder=lambda path: print(f"Folder: {path}")
             )
         """
-        dialog = Gtk.FileChooserDialog(
-            title=title,
-            action=Gtk.FileChooserAction.SELECT_FOLDER,
-            transient_for=parent_window,
-        )
-
-        # Add buttons
-        dialog.add_buttons(
-            "Cancel",
-            Gtk.ResponseType.CANCEL,
-            "Select",
-            Gtk.ResponseType.OK,
+        dialog = _build_dialog(title, initial_folder=initial_folder)
+        on_folder = Composition.callback(on_folder)
+        on_cancel = Composition.callback(on_cancel)
+
+        def on_result(folder):
+            if on_folder:
+                on_folder(folder.get_path())
+
+        dialog.select_folder(
+            parent_window,
+            cancellable,
+            lambda d, result: _finish(d.select_folder_finish, result, on_result, on_cancel),
         )
 
-        # Set initial folder
-        if initial_folder:
-            path = Path(initial_folder).expanduser()
-            if path.is_dir():
-                dialog.set_current_folder(Gio.File.new_for_path(str(path)))
-
-        def on_response(dialog, response_id):
-            if response_id == Gtk.ResponseType.OK and on_folder:
-                file = dialog.get_file()
-                if file:
-                    on_folder(file.get_path())
-            elif response_id == Gtk.ResponseType.CANCEL and on_cancel:
-                on_cancel()
-
-            dialog.destroy()
 
-        dialog.connect("response", on_response)
-        dialog.present()
+# Convenience functions (shorter API)
+def _default_parent():
+    """The first window of the running application, if any."""
+    app = Gtk.Application.get_default()
+    if app and app.get_windows():
+        return app.get_windows()[0]
+    return None
 
 
-# Convenience functions (shorter API)
 def open_file(
     title: str = "Open File",
     on_file: Callable[[str], None] = None,
@@ -277,9 +289,7 @@ def open_file(
     """
     # Auto-detect parent window if not provided
     if parent_window is None:
-        app = Gtk.Application.get_default()
-        if app and app.get_windows():
-            parent_window = app.get_windows()[0]
+        parent_window = _default_parent()
 
     FileDialog.open_file(
         title=title,
@@ -312,9 +322,7 @@ def save_file(
     """
     # Auto-detect parent window if not provided
     if parent_window is None:
-        app = Gtk.Application.get_default()
-        if app and app.get_windows():
-            parent_window = app.get_windows()[0]
+        parent_window = _default_parent()
 
     FileDialog.save_file(
         title=title,
@@ -344,9 +352,7 @@ def pick_folder(
     """
     # Auto-detect parent window if not provided
     if parent_window is None:
-        app = Gtk.Application.get_default()
-        if app and app.get_windows():
-            parent_window = app.get_windows()[0]
+        parent_window = _default_parent()
 
     FileDialog.pick_folder(
         title=title,
@@ -356,4 +362,243 @@ def pick_folder(
     )
 
 
-__all__ = ["FileDialog", "open_file", "save_file", "pick_folder"]
+# Directory scanning
+DEFAULT_SCAN_ATTRIBUTES = "standard::name,standard::display-name,standard::type,standard::size,time::modified"
+
+
+def scan_directory(
+    path: str,
+    recursive: bool = False,
+    attributes: str = DEFAULT_SCAN_ATTRIBUTES,
+    max_depth: Optional[int] = None,
+    batch_size: int = 256,
+    store: Optional[Gio.ListStore] = None,
+    on_done: Optional[Callable[[Gio.ListStore], None]] = None,
+    on_error: Optional[Callable[[str, GLib.Error], None]] = None,
+    cancellable: Optional[Gio.Cancellable] = None,
+) -> Gio.ListStore:
+    """List a directory asynchronously into a Gio.ListStore of Gio.FileInfo.
+
+    Entries are read with enumerate_children_async / next_files_async,
+    `batch_size` at a time, and each batch is added with a single splice, so
+    a list view bound to the store updates once per batch, not per file.
+    The main loop keeps running between batches.
+
+    Each FileInfo carries its Gio.File in the "standard::file" attribute
+    (info.get_attribute_object("standard::file")), like Gtk.DirectoryList.
+
+    Args:
+        path: Directory to scan
+        recursive: Also scan subdirectories (breadth-first, symlinks not followed)
+        attributes: Gio file attributes to query
+        max_depth: With recursive, how many levels below `path` to descend
+                   (None for no limit)
+        batch_size: Entries requested per next_files_async call
+        store: Existing Gio.ListStore to fill (default: a new one)
+        on_done: Called with the store once the scan has finished
+        on_error: Called with (directory, GLib.Error) for directories that could
+                  not be read; the scan continues with the rest
+        cancellable: Gio.Cancellable to stop the scan
+
+    Returns:
+        The Gio.ListStore being filled
+
+    Example:
+        files = scan_directory("~/Projects", recursive=True, max_depth=2)
+        view = Gtk.ListView(model=Gtk.NoSelection(model=files), factory=factory)
+    """
+    store = store if store is not None else Gio.ListStore.new(Gio.FileInfo)
+    cancellable = cancellable or Gio.Cancellable()
+    on_done = Composition.callback(on_done)
+    on_error = Composition.callback(on_error)
+
+    # Recursion needs the type and symlink flag whatever the caller asked for
+    if recursive:
+        attributes = ",".join([attributes, "standard::type", "standard::is-symlink"])
+    flags = Gio.FileQueryInfoFlags.NOFOLLOW_SYMLINKS if recursive else Gio.FileQueryInfoFlags.NONE
+
+    pending = deque([(Gio.File.new_for_path(str(Path(path).expanduser())), 0)])
+
+    def fail(directory, error):
+        if error.matches(Gio.io_error_quark(), Gio.IOErrorEnum.CANCELLED):
+            return
+        if on_error:
+            on_error(directory.get_path(), error)
+        else:
+            print(f"Warning: could not scan {directory.get_path()}: {error.message}")
+
+    def scan_next():
+        if cancellable.is_cancelled():
+            return
+        if not pending:
+            if on_done:
+                on_done(store)
+            return
+        directory, depth = pending.popleft()
+        directory.enumerate_children_async(
+            attributes,
+            flags,
+            GLib.PRIORITY_DEFAULT,
+            cancellable,
+            lambda source, result: on_enumerator(source, result, depth),
+        )
+
+    def on_enumerator(directory, result, depth):
+        try:
+            enumerator = directory.enumerate_children_finish(result)
+        except GLib.Error as error:
+            fail(directory, error)
+            scan_next()
+            return
+        enumerator.next_files_async(
+            batch_size,
+            GLib.PRIORITY_DEFAULT,
+            cancellable,
+            lambda source, result: on_batch(source, result, depth),
+        )
+
+    def on_batch(enumerator, result, depth):
+        try:
+            infos = enumerator.next_files_finish(result)
+        except GLib.Error as error:
+            enumerator.close_async(GLib.PRIORITY_DEFAULT, None, None)
+            fail(enumerator.get_container(), error)
+            scan_next()
+            return
+
+        if not infos:
+            enumerator.close_async(GLib.PRIORITY_DEFAULT, None, None)
+            scan_next()
+            return
+
+        descend = recursive and (max_depth is None or depth < max_depth)
+        for info in infos:
+            child = enumerator.get_child(info)
+            info.set_attribute_object("standard::file", child)
+            if (
+                descend
+                and info.get_file_type() == Gio.FileType.DIRECTORY
+                and not info.get_is_symlink()
+            ):
+                pending.append((child, depth + 1))
+        store.splice(store.get_n_items(), 0, infos)
+
+        enumerator.next_files_async(
+            batch_size,
+            GLib.PRIORITY_DEFAULT,
+            cancellable,
+            lambda source, result: on_batch(source, result, depth),
+        )
+
+    scan_next()
+    return store
+
+
+# Coroutine variants
+def _dialog_future(run, result_arg: str, **kwargs) -> asyncio.Future:
+    """Run a callback-style FileDialog method and return a future for its result.
+
+    The future resolves to None when the dialog is dismissed. Cancelling the
+    awaiting task closes the dialog.
+    """
+    future = asyncio.get_running_loop().create_future()
+    cancellable = kwargs.pop("cancellable", None) or Gio.Cancellable()
+
+    def resolve(value):
+        if not future.done():
+            future.set_result(value)
+
+    def on_future_done(f):
+        if f.cancelled():
+            cancellable.cancel()
+
+    future.add_done_callback(on_future_done)
+    if kwargs.get("parent_window") is None:
+        kwargs["parent_window"] = _default_parent()
+    kwargs[result_arg] = resolve
+    run(cancellable=cancellable, on_cancel=lambda: resolve(None), **kwargs)
+    return future
+
+
+async def open_file_async(
+    title: str = "Open File",
+    multiple: bool = False,
+    filters: Optional[List[Dict[str, str]]] = None,
+    initial_folder: Optional[str] = None,
+    parent_window=None,
+    cancellable: Optional[Gio.Cancellable] = None,
+):
+    """Await a file selection.
+
+    Requires an asyncio loop running on GLib (PyGObject >= 3.50,
+    asyncio.set_event_loop_policy(gi.events.GLibEventLoopPolicy())).
+
+    Returns:
+        The selected path (a list of paths when multiple=True), or None if
+        the dialog was dismissed
+
+    Example:
+        path = await open_file_async(title="Open Document")
+        if path:
+            read_text_async(path, on_done=show_document)
+    """
+    return await _dialog_future(
+        FileDialog.open_file,
+        "on_files" if multiple else "on_file",
+        title=title,
+        multiple=multiple,
+        filters=filters,
+        initial_folder=initial_folder,
+        parent_window=parent_window,
+        cancellable=cancellable,
+    )
+
+
+async def save_file_async(
+    title: str = "Save File",
+    filters: Optional[List[Dict[str, str]]] = None,
+    initial_folder: Optional[str] = None,
+    suggested_name: Optional[str] = None,
+    parent_window=None,
+    cancellable: Optional[Gio.Cancellable] = None,
+) -> Optional[str]:
+    """Await a save location; returns the path or None if dismissed."""
+    return await _dialog_future(
+        FileDialog.save_file,
+        "on_file",
+        title=title,
+        filters=filters,
+        initial_folder=initial_folder,
+        suggested_name=suggested_name,
+        parent_window=parent_window,
+        cancellable=cancellable,
+    )
+
+
+async def pick_folder_async(
+    title: str = "Select Folder",
+    initial_folder: Optional[str] = None,
+    parent_window=None,
+    cancellable: Optional[Gio.Cancellable] = None,
+) -> Optional[str]:
+    """Await a folder selection; returns the path or None if dismissed."""
+    return await _dialog_future(
+        FileDialog.pick_folder,
+        "on_folder",
+        title=title,
+        initial_folder=initial_folder,
+        parent_window=parent_window,
+        cancellable=cancellable,
+    )
+
+
+__all__ = [
+    "FileDialog",
+    "open_file",
+    "save_file",
+    "pick_folder",
+    "scan_directory",
+    "open_file_async",
+    "save_file_async",
+    "pick_folder_async",
+]
@@ -0,0 +1,293 @@
+"""
+Non-blocking file I/O on Gio.
+
+The helpers read and write files asynchronously through Gio, so nothing
+touches the disk on the main thread and large files never stall a frame.
+All callbacks run on the main loop.
+
+Without on_progress, the helpers use single calls
+(load_contents_async / replace_contents_bytes_async). With on_progress, they
+stream the file in chunks and report (bytes_done, bytes_total) after each one.
+bytes_total is -1 when the size is unknown.
+
+Example:
+    from gcompose.utils import open_file, read_text_async
+
+    open_file(
+        title="Open Notes",
+        on_file=lambda path: read_text_async(
+            path, on_done=lambda text: setattr(state, "notes", text)
+        ),
+    )
+
+    cancellable = write_text_async(
+        "~/notes.txt",
+        state.notes,
+        on_done=lambda: print("Saved"),
+        on_progress=lambda done, total: setattr(state, "progress", done / total),
+    )
+    # Later: cancellable.cancel()
+"""
+
+from gi.repository import Gio, GLib
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+from ..compose.runtime import Composition
+
+# Chunk size used when progress is reported
+CHUNK_SIZE = 256 * 1024
+
+PathLike = Union[str, Path]
+ErrorCallback = Optional[Callable[[GLib.Error], None]]
+ProgressCallback = Optional[Callable[[int, int], None]]
+
+
+def _gfile(path: PathLike) -> Gio.File:
+    return Gio.File.new_for_path(str(Path(path).expanduser()))
+
+
+def _fail(error: GLib.Error, on_error, path):
+    if on_error is not None:
+        on_error(error)
+    elif not error.matches(Gio.io_error_quark(), Gio.IOErrorEnum.CANCELLED):
+        print(f"Warning: I/O on {path} failed: {error.message}")
+
+
+def _abort(stream: Gio.FileOutputStream):
+    """Close a replace stream without committing it (the temp file is dropped)."""
+    aborted = Gio.Cancellable()
+    aborted.cancel()
+    stream.close_async(GLib.PRIORITY_DEFAULT, aborted, None)
+
+
+def read_bytes_async(
+    path: PathLike,
+    on_done: Callable[[bytes], None],
+    on_error: ErrorCallback = None,
+    on_progress: ProgressCallback = None,
+    cancellable: Optional[Gio.Cancellable] = None,
+) -> Gio.Cancellable:
+    """Read a whole file without blocking the main loop.
+
+    Args:
+        path: File path
+        on_done: Called with the file contents as bytes
+        on_error: Called with the GLib.Error on failure or cancellation
+        on_progress: Called with (bytes_read, total_bytes) after each chunk
+        cancellable: Optional Gio.Cancellable (one is created if omitted)
+
+    Returns:
+        The Gio.Cancellable; call .cancel() to abort the read
+    """
+    cancellable = cancellable or Gio.Cancellable()
+    on_done = Composition.callback(on_done)
+    on_error = Composition.callback(on_error)
+    on_progress = Composition.callback(on_progress)
+    file = _gfile(path)
+
+    if on_progress is None:
+
+        def on_loaded(source, result):
+            try:
+                _ok, contents, _etag = source.load_contents_finish(result)
+            except GLib.Error as error:
+                _fail(error, on_error, path)
+                return
+            on_done(bytes(contents))
+
+        file.load_contents_async(cancellable, on_loaded)
+        return cancellable
+
+    buffer = bytearray()
+    total = -1
+
+    def on_chunk(stream, result):
+        try:
+            chunk = stream.read_bytes_finish(result)
+        except GLib.Error as error:
+            stream.close_async(GLib.PRIORITY_DEFAULT, None, None)
+            _fail(error, on_error, path)
+            return
+        data = chunk.get_data() or b""
+        if not data:
+            stream.close_async(GLib.PRIORITY_DEFAULT, None, None)
+            on_progress(len(buffer), len(buffer))
+            on_done(bytes(buffer))
+            return
+        buffer.extend(data)
+        on_progress(len(buffer), total)
+        stream.read_bytes_async(CHUNK_SIZE, GLib.PRIORITY_DEFAULT, cancellable, on_chunk)
+
+    def on_info(stream, result):
+        nonlocal total
+        try:
+            total = stream.query_info_finish(result).get_size()
+        except GLib.Error as error:
+            stream.close_async(GLib.PRIORITY_DEFAULT, None, None)
+            _fail(error, on_error, path)
+            return
+        stream.read_bytes_async(CHUNK_SIZE, GLib.PRIORITY_DEFAULT, cancellable, on_chunk)
+
+    def on_opened(source, result):
+        try:
+            stream = source.read_finish(result)
+        except GLib.Error as error:
+            _fail(error, on_error, path)
+            return
+        stream.query_info_async("standard::size", GLib.PRIORITY_DEFAULT, cancellable, on_info)
+
+    file.read_async(GLib.PRIORITY_DEFAULT, cancellable, on_opened)
+    return cancellable
+
+
+def read_text_async(
+    path: PathLike,
+    on_done: Callable[[str], None],
+    on_error: ErrorCallback = None,
+    on_progress: ProgressCallback = None,
+    cancellable: Optional[Gio.Cancellable] = None,
+    encoding: str = "utf-8",
+) -> Gio.Cancellable:
+    """Read a text file without blocking the main loop.
+
+    Same as read_bytes_async, but on_done receives the decoded string.
+    A decoding failure is reported to on_error as a GLib.Error
+    (G_IO_ERROR_INVALID_DATA).
+    """
+    on_done = Composition.callback(on_done)
+    on_error = Composition.callback(on_error)
+
+    def decode(data: bytes):
+        try:
+            text = data.decode(encoding)
+        except UnicodeDecodeError as e:
+            error = GLib.Error.new_literal(
+                Gio.io_error_quark(), str(e), Gio.IOErrorEnum.INVALID_DATA
+            )
+            _fail(error, on_error, path)
+            return
+        on_done(text)
+
+    return read_bytes_async(path, decode, on_error, on_progress, cancellable)
+
+
+def write_bytes_async(
+    path: PathLike,
+    data: bytes,
+    on_done: Optional[Callable[[], None]] = None,
+    on_error: ErrorCallback = None,
+    on_progress: ProgressCallback = None,
+    cancellable: Optional[Gio.Cancellable] = None,
+    make_backup: bool = False,
+) -> Gio.Cancellable:
+    """Replace a file's contents without blocking the main loop.
+
+    Gio writes to a temporary file and renames it over the target when
+    done, so readers never see a half-written file.
+
+    Args:
+        path: File path (parent directory must exist)
+        data: New contents
+        on_done: Called once the file has been replaced
+        on_error: Called with the GLib.Error on failure or cancellation
+        on_progress: Called with (bytes_written, total_bytes) after each chunk
+        cancellable: Optional Gio.Cancellable (one is created if omitted)
+        make_backup: Keep the previous contents as "<path>~"
+
+    Returns:
+        The Gio.Cancellable; call .cancel() to abort (the target is left intact)
+    """
+    cancellable = cancellable or Gio.Cancellable()
+    on_done = Composition.callback(on_done)
+    on_error = Composition.callback(on_error)
+    on_progress = Composition.callback(on_progress)
+    file = _gfile(path)
+    data = bytes(data)
+    # NONE writes through symlinks and keeps the file's permissions
+    flags = Gio.FileCreateFlags.NONE
+
+    if on_progress is None:
+
+        def on_replaced(source, result):
+            try:
+                source.replace_contents_finish(result)
+            except GLib.Error as error:
+                _fail(error, on_error, path)
+                return
+            if on_done:
+                on_done()
+
+        file.replace_contents_bytes_async(
+            GLib.Bytes.new(data), None, make_backup, flags, cancellable, on_replaced
+        )
+        return cancellable
+
+    total = len(data)
+    written = 0
+
+    def on_closed(stream, result):
+        try:
+            stream.close_finish(result)
+        except GLib.Error as error:
+            _fail(error, on_error, path)
+            return
+        if on_done:
+            on_done()
+
+    def write_next(stream):
+        if written >= total:
+            # Closing commits the rename; a cancelled close discards the temp file
+            stream.close_async(GLib.PRIORITY_DEFAULT, cancellable, on_closed)
+            return
+        chunk = GLib.Bytes.new(data[written : written + CHUNK_SIZE])
+        stream.write_bytes_async(chunk, GLib.PRIORITY_DEFAULT, cancellable, on_written)
+
+    def on_written(stream, result):
+        nonlocal written
+        try:
+            written += stream.write_bytes_finish(result)
+        except GLib.Error as error:
+            _abort(stream)
+            _fail(error, on_error, path)
+            return
+        on_progress(written, total)
+        write_next(stream)
+
+    def on_opened(source, result):
+        try:
+            stream = source.replace_finish(result)
+        except GLib.Error as error:
+            _fail(error, on_error, path)
+            return
+        write_next(stream)
+
+    file.replace_async(None, make_backup, flags, GLib.PRIORITY_DEFAULT, cancellable, on_opened)
+    return cancellable
+
+
+def write_text_async(
+    path: PathLike,
+    text: str,
+    on_done: Optional[Callable[[], None]] = None,
+    on_error: ErrorCallback = None,
+    on_progress: ProgressCallback = None,
+    cancellable: Optional[Gio.Cancellable] = None,
+    make_backup: bool = False,
+    encoding: str = "utf-8",
+) -> Gio.Cancellable:
+    """Write a text file without blocking the main loop.
+
+    Same as write_bytes_async, but takes a string.
+    """
+    return write_bytes_async(
+        path, text.encode(encoding), on_done, on_error, on_progress, cancellable, make_backup
+    )
+
+
+__all__ = [
+    "read_bytes_async",
+    "read_text_async",
+    "write_bytes_async",
+    "write_text_async",
+]
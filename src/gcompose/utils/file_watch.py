@@ -0,0 +1,164 @@
+"""
+File watching with debounced change coalescing.
+
+use_file_watch() is a hook built on Gio.FileMonitor. Editors and save tools
+often write a file in several steps (truncate, write, write, close), and each
+step produces a CHANGED event, followed by CHANGES_DONE_HINT. All events in
+one burst are merged into a single on_change call, made `debounce_ms` after
+the last event.
+
+Watching the same path from several composables shares one Gio.FileMonitor.
+A watch is disposed when its composable is no longer rendered. The monitor
+is cancelled once its last watch is gone.
+
+Example:
+    @Composable
+    def Editor(path):
+        doc = use_state(text="")
+
+        def reload(_paths):
+            read_text_async(path, on_done=lambda text: setattr(doc, "text", text))
+
+        use_file_watch(path, reload, debounce_ms=250)
+        TextArea(bind=Binding(doc, "text", widget_prop="text"))
+"""
+
+from gi.repository import Gio, GLib
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from ..compose.runtime import Composition
+
+DEFAULT_DEBOUNCE_MS = 200
+
+# Events that mean the contents changed (attribute and unmount events are ignored)
+_CONTENT_EVENTS = {
+    Gio.FileMonitorEvent.CHANGED,
+    Gio.FileMonitorEvent.CHANGES_DONE_HINT,
+    Gio.FileMonitorEvent.CREATED,
+    Gio.FileMonitorEvent.DELETED,
+    Gio.FileMonitorEvent.MOVED_IN,
+    Gio.FileMonitorEvent.MOVED_OUT,
+    Gio.FileMonitorEvent.RENAMED,
+}
+
+
+class _SharedMonitor:
+    """One Gio.FileMonitor per path, fanned out to every FileWatch on it."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.watches: List["FileWatch"] = []
+        self.monitor = Gio.File.new_for_path(path).monitor(
+            Gio.FileMonitorFlags.WATCH_MOVES, None
+        )
+        self._handler = self.monitor.connect("changed", self._on_changed)
+
+    def _on_changed(self, _monitor, file, other_file, event):
+        if event not in _CONTENT_EVENTS:
+            return
+        changed = file.get_path()
+        # Renames report the new name in other_file
+        if other_file is not None and event == Gio.FileMonitorEvent.RENAMED:
+            changed = other_file.get_path()
+        for watch in list(self.watches):
+            watch._queue(changed)
+
+    def close(self):
+        self.monitor.disconnect(self._handler)
+        self.monitor.cancel()
+
+
+_monitors: Dict[str, _SharedMonitor] = {}
+
+
+def _normalize(path) -> str:
+    return str(Path(path).expanduser().resolve())
+
+
+class FileWatch:
+    """A debounced subscription to a shared file monitor.
+
+    Args:
+        path: File or directory to watch
+        on_change: Called with the list of changed paths, once per burst
+        debounce_ms: Quiet period after the last event before on_change runs
+    """
+
+    def __init__(self, path, on_change: Callable[[List[str]], None], debounce_ms: int = DEFAULT_DEBOUNCE_MS):
+        self.path = _normalize(path)
+        self.on_change = on_change
+        self.debounce_ms = debounce_ms
+        self._changed: Dict[str, None] = {}  # ordered set of paths in this burst
+        self._timer = None
+
+        shared = _monitors.get(self.path)
+        if shared is None:
+            shared = _monitors[self.path] = _SharedMonitor(self.path)
+        shared.watches.append(self)
+        self._shared: Optional[_SharedMonitor] = shared
+
+    def _queue(self, path: str):
+        self._changed[path] = None
+        if self._timer is not None:
+            GLib.source_remove(self._timer)
+        self._timer = GLib.timeout_add(self.debounce_ms, self._fire)
+
+    def _fire(self):
+        self._timer = None
+        changed, self._changed = list(self._changed), {}
+        if self.on_change is not None:
+            self.on_change(changed)
+        return GLib.SOURCE_REMOVE
+
+    def dispose(self):
+        """Stop watching; the shared monitor closes with its last watch."""
+        if self._timer is not None:
+            GLib.source_remove(self._timer)
+            self._timer = None
+        shared, self._shared = self._shared, None
+        if shared is None:
+            return
+        shared.watches.remove(self)
+        if not shared.watches:
+            del _monitors[shared.path]
+            shared.close()
+
+
+def use_file_watch(
+    path,
+    on_change: Callable[[List[str]], None],
+    debounce_ms: int = DEFAULT_DEBOUNCE_MS,
+) -> FileWatch:
+    """Watch a file or directory while the calling composable is rendered.
+
+    Bursts of events are coalesced: on_change runs once, `debounce_ms` after
+    the last event, with the paths that changed. The watch follows the latest
+    on_change passed in, so closures over fresh state work. Changing `path`
+    between renders moves the watch to the new path.
+
+    Args:
+        path: File or directory to watch
+        on_change: Called with a list of changed paths
+        debounce_ms: Quiet period before on_change runs
+
+    Returns:
+        The FileWatch (call .dispose() to stop early)
+    """
+    site = Composition.call_site()
+    hook = Composition.claim_hook(FileWatch, key=site)
+    on_change = Composition.callback(on_change)
+
+    if hook is not None:
+        if hook._shared is not None and hook.path == _normalize(path):
+            hook.on_change = on_change
+            hook.debounce_ms = debounce_ms
+            return hook
+        hook.dispose()
+    hook = FileWatch(path, on_change, debounce_ms)
+    hook._hook_key = site
+    Composition.set_hook(hook)
+    return hook
+
+
+__all__ = ["use_file_watch", "FileWatch"]
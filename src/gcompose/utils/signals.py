@@ -10,51 +10,173 @@ import gi
 
 gi.require_version("Gtk", "4.0")
 
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+
 from gi.repository import GObject
 
 
+def notify_signal(attr):
+    """The notify signal for a property, e.g. "first_name" -> "notify::first-name".
+
+    GLib emits notify with the canonical property name (dashes), so a detail
+    spelled with underscores would never match.
+    """
+    return "notify::" + attr.replace("_", "-")
+
+
+class _Connection:
+    __slots__ = ("emitter", "signal_name", "handler_id", "generation", "blocked")
+
+    def __init__(self, emitter, signal_name, handler_id, generation):
+        self.emitter = emitter
+        self.signal_name = signal_name
+        self.handler_id = handler_id
+        self.generation = generation
+        self.blocked = False
+
+
+class _Emitter:
+    """Connections on one GObject, plus a weak reference to it."""
+
+    __slots__ = ("ref", "connections")
+
+    def __init__(self, ref):
+        self.ref = ref
+        self.connections = {}  # handler_id -> _Connection
+
+
 class SignalManager:
-    """Manages GTK signal connections with support for blocking and unblocking."""
+    """Manages GTK signal connections with support for blocking and unblocking.
+
+    Emitters are held through GObject weak references, so the manager never
+    keeps a widget alive, and records for finalized objects are dropped
+    automatically. Several handlers may be connected per (object, signal).
+
+    Connections are tagged with a generation (e.g. a render pass);
+    disconnect_generation() removes everything connected during one
+    generation in a single pass over just those connections.
+
+    Example:
+        signals = SignalManager()
+        signals.connect(entry, "changed", on_changed)
+        generation = signals.next_generation()
+        signals.connect(button, "clicked", on_click)
+        signals.disconnect_generation(generation)  # drops on_click only
+    """
 
     def __init__(self):
         """Initialize signal manager."""
-        self.connections = {}  # Maps (obj_id, signal_name) -> listener_id
-        self.blocked = set()  # Set of blocked connection keys
+        self.generation = 0
+        self._emitters = {}  # hash(obj) -> _Emitter
+        self._generations = {}  # generation -> [_Connection]
+
+    def _emitter(self, obj):
+        # GObject hashes by the underlying C pointer; the weak ref callback
+        # forgets the entry at finalization, so a reused address cannot alias
+        key = hash(obj)
+        emitter = self._emitters.get(key)
+        if emitter is None:
+            emitter = self._emitters[key] = _Emitter(obj.weak_ref(self._on_finalized, key))
+        return emitter
+
+    def _on_finalized(self, key):
+        emitter = self._emitters.pop(key, None)
+        if emitter is not None:
+            emitter.connections.clear()
+
+    def _connections(self, obj, signal_name=None):
+        emitter = self._emitters.get(hash(obj))
+        if emitter is None:
+            return []
+        return [
+            c
+            for c in emitter.connections.values()
+            if signal_name is None or c.signal_name == signal_name
+        ]
+
+    @contextmanager
+    def generation_scope(self, generation):
+        """Record connections made inside the block under `generation`.
+
+        Used for widgets that outlive the render that built them (e.g. cached
+        pages), so disconnecting the render does not strip their handlers.
+        """
+        previous = self.generation
+        self.generation = generation
+        try:
+            yield
+        finally:
+            self.generation = previous
+
+    def next_generation(self):
+        """Start a new generation and return the one that just ended."""
+        previous = self.generation
+        self.generation += 1
+        return previous
 
-    def connect(self, obj, signal_name, callback, data=None):
+    def connect(self, obj, signal_name, callback, *data, generation=None, after=False):
         """Connect a signal to a callback.
 
         Args:
             obj: GObject instance
             signal_name: Name of signal (e.g., "notify::property")
             callback: Callable to invoke
-            data: Optional data to pass to callback
+            *data: Optional extra arguments passed to callback
+            generation: Generation to record the connection in
+                        (default: the current generation)
+            after: Run after the signal's default handler (connect_after)
 
         Returns:
-            Connection ID (for later disconnection)
+            Handler ID (for handler-level disconnect/block)
         """
-        key = (id(obj), signal_name)
-
-        if data is not None:
-            listener_id = obj.connect(signal_name, callback, data)
+        if after:
+            handler_id = obj.connect_after(signal_name, callback, *data)
         else:
-            listener_id = obj.connect(signal_name, callback)
-
-        self.connections[key] = listener_id
-        return key
-
-    def disconnect(self, obj, signal_name):
+            handler_id = obj.connect(signal_name, callback, *data)
+        emitter = self._emitter(obj)
+        if generation is None:
+            generation = self.generation
+        connection = _Connection(emitter, signal_name, handler_id, generation)
+        emitter.connections[handler_id] = connection
+        self._generations.setdefault(generation, []).append(connection)
+        return handler_id
+
+    def disconnect(self, obj, signal_name, handler_id=None):
         """Disconnect a signal.
 
         Args:
             obj: GObject instance
             signal_name: Name of signal
+            handler_id: Only this handler (default: every managed handler
+                        for the signal)
         """
-        key = (id(obj), signal_name)
-        if key in self.connections:
-            listener_id = self.connections[key]
-            obj.disconnect(listener_id)
-            del self.connections[key]
+        for connection in self._connections(obj, signal_name):
+            if handler_id is None or connection.handler_id == handler_id:
+                self._disconnect(obj, connection)
+
+    def _disconnect(self, obj, connection):
+        if connection.emitter.connections.pop(connection.handler_id, None) is None:
+            return
+        if obj.handler_is_connected(connection.handler_id):
+            obj.disconnect(connection.handler_id)
+
+    def disconnect_generation(self, generation):
+        """Disconnect every handler connected during `generation`."""
+        for connection in self._generations.pop(generation, ()):
+            obj = connection.emitter.ref()
+            if obj is not None:
+                self._disconnect(obj, connection)
+
+    def _set_blocked(self, obj, connections, blocked):
+        for connection in connections:
+            if connection.blocked == blocked:
+                continue
+            if blocked:
+                obj.handler_block(connection.handler_id)
+            else:
+                obj.handler_unblock(connection.handler_id)
+            connection.blocked = blocked
 
     def block(self, obj, signal_name):
         """Block a signal temporarily.
@@ -63,11 +185,7 @@ class SignalManager:
             obj: GObject instance
             signal_name: Name of signal
         """
-        key = (id(obj), signal_name)
-        if key in self.connections:
-            listener_id = self.connections[key]
-            obj.handler_block(listener_id)
-            self.blocked.add(key)
+        self._set_blocked(obj, self._connections(obj, signal_name), True)
 
     def unblock(self, obj, signal_name):
         """Unblock a previously blocked signal.
@@ -76,66 +194,296 @@ class SignalManager:
             obj: GObject instance
             signal_name: Name of signal
         """
-        key = (id(obj), signal_name)
-        if key in self.blocked:
-            listener_id = self.connections[key]
-            obj.handler_unblock(listener_id)
-            self.blocked.discard(key)
+        self._set_blocked(obj, self._connections(obj, signal_name), False)
+
+    def _each_live(self):
+        for emitter in list(self._emitters.values()):
+            obj = emitter.ref()
+            if obj is not None:
+                yield obj, list(emitter.connections.values())
 
     def block_all(self):
         """Block all managed signals."""
-        for (obj_id, signal_name), listener_id in list(self.connections.items()):
-            # Note: we can't easily block here without the obj reference
-            # This is a simplified approach
-            pass
+        for obj, connections in self._each_live():
+            self._set_blocked(obj, connections, True)
 
     def unblock_all(self):
         """Unblock all managed signals."""
-        for key in list(self.blocked):
-            # Would need obj reference to unblock
-            pass
+        for obj, connections in self._each_live():
+            self._set_blocked(obj, connections, False)
 
     def clear(self):
         """Disconnect all managed signals."""
-        for key in list(self.connections.keys()):
-            # We'd need the obj reference to disconnect
-            pass
+        for obj, connections in self._each_live():
+            for connection in connections:
+                self._disconnect(obj, connection)
+        for emitter in self._emitters.values():
+            emitter.ref.unref()
+        self._emitters.clear()
+        self._generations.clear()
 
 
 class SignalBlocker:
     """Context manager to temporarily block signals during updates.
 
+    Blocks the given handler IDs, or every handler the SignalManager has
+    recorded for (obj, signal_name).
+
     Usage:
-        with SignalBlocker(text_buffer, "changed"):
+        with SignalBlocker(text_buffer, "changed", manager=signals):
             text_buffer.set_text("new text")
+
+        with SignalBlocker(entry_buffer, handler_ids=[inserted_id, deleted_id]):
+            entry_buffer.set_text("new text", -1)
     """
 
-    def __init__(self, obj, signal_name):
+    def __init__(self, obj, signal_name=None, handler_ids=None, manager=None):
         """Create a signal blocker.
 
         Args:
             obj: GObject to block signals on
-            signal_name: Name of signal to block
+            signal_name: Name of signal to block (with a manager)
+            handler_ids: Explicit handler IDs to block
+            manager: SignalManager that connected the handlers
+                     (default: the active composition's)
         """
         self.obj = obj
         self.signal_name = signal_name
-        self.handler_id = None
+        self.handler_ids = list(handler_ids) if handler_ids is not None else None
+        self.manager = manager
+        self._blocked = []
 
     def __enter__(self):
         """Block the signal."""
-        # Find the handler ID for this signal
-        # In GTK, we need to track connections ourselves
-        # This is a simplified implementation - in practice you'd use SignalManager
+        handler_ids = self.handler_ids
+        if handler_ids is None:
+            manager = self.manager
+            if manager is None:
+                from ..compose.runtime import Composition
+
+                manager = Composition.active().signals
+            handler_ids = [
+                c.handler_id
+                for c in manager._connections(self.obj, self.signal_name)
+                if not c.blocked
+            ]
+        for handler_id in handler_ids:
+            self.obj.handler_block(handler_id)
+            self._blocked.append(handler_id)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Unblock the signal."""
-        pass
+        for handler_id in self._blocked:
+            if self.obj.handler_is_connected(handler_id):
+                self.obj.handler_unblock(handler_id)
+        self._blocked = []
+
+
+def _plain_connect(obj, signal_name, handler, after=False):
+    if after:
+        return obj.connect_after(signal_name, handler)
+    return obj.connect(signal_name, handler)
+
+
+def _common_affixes(old, new):
+    """Lengths of the common prefix and (non-overlapping) suffix of two strings."""
+    limit = min(len(old), len(new))
+    prefix = 0
+    while prefix < limit and old[prefix] == new[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and old[-1 - suffix] == new[-1 - suffix]:
+        suffix += 1
+    return prefix, suffix
+
+
+class _IncrementalTextBinder(ABC):
+    """Shared logic for incremental two-way text bindings.
+
+    The binder keeps a shadow copy of the text. Widget edits are applied to it
+    by position, so the widget text is never copied out in full on each
+    keystroke. State changes from elsewhere are pushed back as the smallest
+    delete + insert, which keeps the cursor where it was. Loops are broken by
+    blocking the binder's own handlers, not with Python flags.
+
+    Args:
+        state_obj: State object (GObject with a str property)
+        state_attr: Property name on state object
+        connect: Callable(obj, signal_name, handler, after=False) -> handler ID
+                 (e.g. Composition.connect for render-scoped handlers)
+    """
+
+    def __init__(self, state_obj, state_attr, connect=None):
+        self.state_obj = state_obj
+        self.state_attr = state_attr
+        self._connect = connect or _plain_connect
+        self._value = ""
+        self._notify_id = None
+        self._buffer_ids = []
+
+    @abstractmethod
+    def _buffer_length(self):
+        """Number of characters in the widget."""
+
+    @abstractmethod
+    def _buffer_text(self):
+        """Full widget text (only read on setup or to resync)."""
+
+    @abstractmethod
+    def _set_buffer_text(self, text):
+        """Replace the whole widget text."""
+
+    @abstractmethod
+    def _replace_range(self, start, n_chars, text):
+        """Delete `n_chars` at `start`, then insert `text` there."""
+
+    @abstractmethod
+    def _connect_buffer(self):
+        """Connect the widget's edit signals; return the handler IDs."""
+
+    def setup(self):
+        """Load the state value into the widget and connect both directions."""
+        self._value = str(getattr(self.state_obj, self.state_attr, ""))
+        if self._buffer_text() != self._value:
+            self._set_buffer_text(self._value)
+        self._buffer_ids = self._connect_buffer()
+        self._notify_id = self._connect(
+            self.state_obj, notify_signal(self.state_attr), self._on_state_changed
+        )
+        return self
+
+    def _apply_edit(self, text):
+        # Shadow and widget must agree; if not (e.g. an edit slipped past us),
+        # fall back to one full read
+        if len(text) != self._buffer_length():
+            text = self._buffer_text()
+        self._value = text
+        with SignalBlocker(self.state_obj, handler_ids=[self._notify_id]):
+            setattr(self.state_obj, self.state_attr, text)
+
+    def _inserted(self, position, chars):
+        value = self._value
+        self._apply_edit(value[:position] + chars + value[position:])
+
+    def _deleted(self, position, n_chars):
+        value = self._value
+        end = len(value) if n_chars < 0 else position + n_chars
+        self._apply_edit(value[:position] + value[end:])
+
+    def _on_state_changed(self, obj, _pspec):
+        new = str(getattr(obj, self.state_attr, ""))
+        old = self._value
+        if new == old:
+            return
+        prefix, suffix = _common_affixes(old, new)
+        with SignalBlocker(self._buffer, handler_ids=self._buffer_ids):
+            self._replace_range(prefix, len(old) - prefix - suffix, new[prefix : len(new) - suffix])
+        self._value = new
+
+
+class EntryBinder(_IncrementalTextBinder):
+    """Incremental two-way binding between a str state property and a Gtk.Entry.
+
+    Listens to the Gtk.EntryBuffer's inserted-text / deleted-text signals.
+
+    Example:
+        form = use_state(name="")
+        entry = Gtk.Entry()
+        EntryBinder(form, "name", entry).setup()
+    """
+
+    def __init__(self, state_obj, state_attr, entry, connect=None):
+        super().__init__(state_obj, state_attr, connect)
+        self._buffer = entry.get_buffer() if hasattr(entry, "get_buffer") else entry
+
+    def _buffer_length(self):
+        return self._buffer.get_length()
+
+    def _buffer_text(self):
+        return self._buffer.get_text()
+
+    def _set_buffer_text(self, text):
+        self._buffer.set_text(text, -1)
+
+    def _replace_range(self, start, n_chars, text):
+        if n_chars:
+            self._buffer.delete_text(start, n_chars)
+        if text:
+            self._buffer.insert_text(start, text, -1)
+
+    def _connect_buffer(self):
+        return [
+            self._connect(
+                self._buffer,
+                "inserted-text",
+                lambda _buf, position, chars, _n: self._inserted(position, chars),
+            ),
+            self._connect(
+                self._buffer,
+                "deleted-text",
+                lambda _buf, position, n_chars: self._deleted(position, n_chars),
+            ),
+        ]
+
+
+class TextBufferBinder(_IncrementalTextBinder):
+    """Incremental two-way binding between a str state property and a Gtk.TextBuffer.
+
+    Listens to insert-text (after the insertion) and delete-range (offsets
+    captured before the deletion, applied after it).
+    """
+
+    def __init__(self, state_obj, state_attr, text_buffer, connect=None):
+        super().__init__(state_obj, state_attr, connect)
+        self._buffer = text_buffer
+        self._pending_delete = None
+
+    def _buffer_length(self):
+        return self._buffer.get_char_count()
+
+    def _buffer_text(self):
+        buf = self._buffer
+        return buf.get_text(buf.get_start_iter(), buf.get_end_iter(), False)
+
+    def _set_buffer_text(self, text):
+        self._buffer.set_text(text, -1)
+
+    def _replace_range(self, start, n_chars, text):
+        buf = self._buffer
+        if n_chars:
+            buf.delete(buf.get_iter_at_offset(start), buf.get_iter_at_offset(start + n_chars))
+        if text:
+            buf.insert(buf.get_iter_at_offset(start), text, -1)
+
+    def _on_insert_after(self, _buf, location, text, _length):
+        # The default handler moved `location` to the end of the inserted text
+        self._inserted(location.get_offset() - len(text), text)
+
+    def _on_delete_before(self, _buf, start, end):
+        self._pending_delete = (start.get_offset(), end.get_offset())
+
+    def _on_delete_after(self, _buf, _start, _end):
+        if self._pending_delete is None:
+            return
+        start, end = self._pending_delete
+        self._pending_delete = None
+        self._deleted(start, end - start)
+
+    def _connect_buffer(self):
+        return [
+            self._connect(self._buffer, "insert-text", self._on_insert_after, after=True),
+            self._connect(self._buffer, "delete-range", self._on_delete_before),
+            self._connect(self._buffer, "delete-range", self._on_delete_after, after=True),
+        ]
 
 
 class BiDirectionalBinder:
     """Manages bi-directional binding between two properties without cascading updates.
 
+    Copies the full text in each direction; for text entries prefer
+    EntryBinder / TextBufferBinder, which apply edits incrementally.
+
     Example:
         state = use_state(text="")
         text_buffer = Gtk.TextBuffer()
@@ -235,7 +583,14 @@ class BiDirectionalBinder:
                 self.sync_state_to_widget()
 
         self.widget.connect(self.widget_signal, on_widget_changed)
-        self.state_obj.connect("notify::" + self.state_attr, on_state_changed)
+        self.state_obj.connect(notify_signal(self.state_attr), on_state_changed)
 
 
-__all__ = ["SignalManager", "SignalBlocker", "BiDirectionalBinder"]
+__all__ = [
+    "notify_signal",
+    "SignalManager",
+    "SignalBlocker",
+    "EntryBinder",
+    "TextBufferBinder",
+    "BiDirectionalBinder",
+]
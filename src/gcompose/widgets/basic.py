@@ -6,7 +6,8 @@ from gi.repository import Gtk
 from ..compose.runtime import Composition
 from ..compose.runtime import Composable
 from ..styling.css import apply_styles
-from ..state import bind as state_bind, Binding
+from ..state import bind as state_bind, Binding, _record_binding, bindable
+from ..utils.signals import EntryBinder, TextBufferBinder, notify_signal
 
 
 def _apply_binding(widget, bind, default_prop="label"):
@@ -120,7 +121,8 @@ def Button(
     _apply_binding(lbl, bind, default_prop="label")
 
     if on_click:
-        btn.connect("clicked", lambda *_: on_click())
+        on_click = Composition.callback(on_click)
+        Composition.connect(btn, "clicked", lambda *_: on_click())
     apply_styles(btn, styles)
     _safe_append(btn)
     return btn
@@ -189,30 +191,42 @@ def List(items, styles=None, selection_mode="none", on_select=None):
 
     # Handle selection
     if on_select:
+        on_select = Composition.callback(on_select)
 
         def on_row_selected(_list_box, row):
             if row:
                 index = row.get_index()
                 on_select(items[index])
 
-        list_box.connect("row-selected", on_row_selected)
+        Composition.connect(list_box, "row-selected", on_row_selected)
 
     apply_styles(list_box, styles)
     Composition.current().append(list_box)
     return list_box
 
 
+class _TextAreaHook(dict):
+    """A TextArea's widgets, kept across renders (text_view, text_buffer, scrolled)."""
+
+
 @Composable
 def TextArea(
-    value="", styles=None, on_change=None, on_focus_out=None, bind=None, editable=True
+    value="",
+    styles=None,
+    on_change=None,
+    on_focus_out=None,
+    bind=None,
+    editable=True,
+    two_way=False,
 ):
     """Simplified TextArea widget - widget owns its content.
 
-    Unlike most gcompose widgets, TextArea does NOT synchronize typing back to state.
-    Instead, it follows GTK's natural model where the widget owns its content:
+    By default TextArea does NOT synchronize typing back to state; it follows
+    GTK's natural model where the widget owns its content:
     - Initial content comes from `value` parameter (first render only)
     - Call widget.get_text() to read current content
     - Optional `bind` for ONE-WAY loading (state → display only, e.g., file loads)
+    - Pass two_way=True to also apply typing to `bind` (for str fields)
 
     Args:
         value: Initial text content (first render only)
@@ -221,6 +235,7 @@ def TextArea(
         on_focus_out: Optional callback(text) invoked when user leaves field
         bind: Optional Binding for ONE-WAY sync (state→widget) for loading content
         editable: Whether text area is editable (default: True)
+        two_way: Also sync typing back into `bind` (incrementally, per edit)
 
     Returns:
         GtkTextView widget with get_text() helper method
@@ -250,7 +265,8 @@ def TextArea(
     """
     from ..compose.runtime import Composition
 
-    hook = Composition.next_hook()
+    site = Composition.call_site()
+    hook = Composition.claim_hook(_TextAreaHook, key=site)
 
     if hook is None:
         # First render - create widget
@@ -280,16 +296,13 @@ def TextArea(
         scrolled._get_text = get_buffer_text
 
         # Store widget and buffer for reuse across renders
-        Composition.set_hook(
-            {
-                "text_view": text_view,
-                "text_buffer": text_buffer,
-                "scrolled": scrolled,
-            }
-        )
+        hook = _TextAreaHook(text_view=text_view, text_buffer=text_buffer, scrolled=scrolled)
+        hook._hook_key = site
+        Composition.set_hook(hook)
 
         # Setup on_change callback (local typing event)
         if on_change:
+            on_change = Composition.callback(on_change)
 
             def on_buffer_changed(_buffer):
                 on_change(get_buffer_text())
@@ -298,6 +311,7 @@ def TextArea(
 
         # Setup on_focus_out callback
         if on_focus_out:
+            on_focus_out = Composition.callback(on_focus_out)
             focus_ctrl = Gtk.EventControllerFocus()
 
             def on_focus_leave(_controller):
@@ -306,8 +320,17 @@ def TextArea(
             focus_ctrl.connect("leave", on_focus_leave)
             text_view.add_controller(focus_ctrl)
 
+        # Opt-in TWO-WAY binding: buffer edits are applied to state incrementally
+        if (
+            two_way
+            and isinstance(bind, Binding)
+            and isinstance(getattr(bind.state, bind.attr, None), str)
+        ):
+            _record_binding(text_view, bind.state, bind.attr, "text")
+            TextBufferBinder(bindable(bind.state, bind.attr), bind.attr, text_buffer).setup()
+
         # Setup ONE-WAY binding (state → widget only, for loading files)
-        if bind is not None and isinstance(bind, Binding):
+        elif bind is not None and isinstance(bind, Binding):
 
             def on_state_changed(obj, pspec):
                 """Sync state to display when state changes externally."""
@@ -320,7 +343,7 @@ def TextArea(
                 if current_text != str(new_text):
                     text_buffer.set_text(str(new_text))
 
-            bind.state.connect("notify::" + bind.attr, on_state_changed)
+            bindable(bind.state, bind.attr).connect(notify_signal(bind.attr), on_state_changed)
 
     else:
         # Subsequent renders - reuse widget
@@ -328,8 +351,9 @@ def TextArea(
         text_buffer = hook["text_buffer"]
         scrolled = hook["scrolled"]
 
-        # Sync ONE-WAY binding if provided (state → display)
-        if bind is not None and isinstance(bind, Binding):
+        # Sync ONE-WAY binding if provided (state → display); the two-way
+        # binder keeps the buffer in sync by itself
+        if not two_way and bind is not None and isinstance(bind, Binding):
             new_text = getattr(bind.state, bind.attr, "")
             current_text = text_buffer.get_text(
                 text_buffer.get_start_iter(),
@@ -367,7 +391,9 @@ def Input(
         placeholder: Placeholder text
         styles: CSS styles to apply
         on_change: Optional callback(text) invoked on every keystroke
-        bind: Optional Binding for two-way sync
+        bind: Optional Binding for two-way sync (edits are applied to the
+              state incrementally); one-way when it has format= or the
+              field is not a str
         editable: Whether input is editable (default: True)
         input_type: "text", "password", or "email" (affects display)
 
@@ -384,12 +410,25 @@ def Input(
     if input_type == "password":
         entry.set_visibility(False)
 
-    # Setup binding if provided
-    _apply_binding(entry, bind, default_prop="text")
+    # Setup binding if provided: a plain Binding to a str field is two-way and
+    # incremental; formatted, non-str or legacy bindings stay one-way
+    if (
+        isinstance(bind, Binding)
+        and bind.format is None
+        and bind.widget_prop in ("text", "label")
+        and isinstance(getattr(bind.state, bind.attr, None), str)
+    ):
+        _record_binding(entry, bind.state, bind.attr, "text")
+        EntryBinder(
+            bindable(bind.state, bind.attr), bind.attr, entry, connect=Composition.connect
+        ).setup()
+    else:
+        _apply_binding(entry, bind, default_prop="text")
 
     # Setup on_change callback
     if on_change:
-        entry.connect("changed", lambda *_: on_change(entry.get_text()))
+        on_change = Composition.callback(on_change)
+        Composition.connect(entry, "changed", lambda *_: on_change(entry.get_text()))
 
     apply_styles(entry, styles)
 
@@ -429,7 +468,8 @@ def Checkbox(label="", checked=False, on_toggle=None, bind=None, styles=None):
 
     # Setup on_toggle callback
     if on_toggle:
-        check.connect("toggled", lambda *_: on_toggle(check.get_active()))
+        on_toggle = Composition.callback(on_toggle)
+        Composition.connect(check, "toggled", lambda *_: on_toggle(check.get_active()))
 
     apply_styles(check, styles)
     Composition.current().append(check)
@@ -461,7 +501,10 @@ def Switch(active=False, on_toggled=None, bind=None, styles=None):
 
     # Setup on_toggled callback
     if on_toggled:
-        switch.connect("notify::active", lambda *_: on_toggled(switch.get_active()))
+        on_toggled = Composition.callback(on_toggled)
+        Composition.connect(
+            switch, "notify::active", lambda *_: on_toggled(switch.get_active())
+        )
 
     apply_styles(switch, styles)
     Composition.current().append(switch)
@@ -505,13 +548,14 @@ def Select(items, selected_index=0, on_change=None, bind=None, styles=None):
 
     # Setup on_change callback
     if on_change:
+        on_change = Composition.callback(on_change)
 
         def on_dropdown_change(*_):
             selected_idx = dropdown.get_selected()
             if selected_idx < len(items):
                 on_change(items[selected_idx])
 
-        dropdown.connect("notify::selected", on_dropdown_change)
+        Composition.connect(dropdown, "notify::selected", on_dropdown_change)
 
     apply_styles(dropdown, styles)
     Composition.current().append(dropdown)
@@ -0,0 +1,101 @@
+"""
+Persistent header bar items ("chrome slots").
+
+A render rebuilds the widget tree under the root, but the window's header bar
+lives outside it. Packing a button into the header bar during a render would
+add another button on every rerender. chrome_slot() creates the widget on the
+first render and returns the same widget on later renders. The widget is
+removed from the header bar when the calling composable is no longer rendered.
+
+Example:
+    @Composable
+    def Editor():
+        doc = use_state(dirty=False)
+        save = chrome_slot(lambda: Gtk.Button(icon_name="document-save-symbolic"), pack="end")
+        if save is not None:
+            save.set_sensitive(doc.dirty)
+"""
+
+import gi
+
+gi.require_version("Adw", "1")
+gi.require_version("Gtk", "4.0")
+
+from gi.repository import Adw, Gtk
+from typing import Callable, Optional
+
+from ..compose.runtime import Composition
+
+
+def get_header_bar() -> Optional[Adw.HeaderBar]:
+    """The header bar of the composition's window, or None."""
+    window = Composition.get_window()
+    if window is None:
+        return None
+    header_bar = getattr(window, "_gcompose_header_bar", None)
+    if header_bar is not None:
+        return header_bar
+    content = window.get_content()
+    if hasattr(content, "get_top_bar"):
+        return content.get_top_bar()
+    return None
+
+
+class ChromeSlot:
+    """A widget packed into a header bar, kept across renders."""
+
+    def __init__(self, header_bar: Adw.HeaderBar, widget: Gtk.Widget, pack: str):
+        self.header_bar = header_bar
+        self.widget = widget
+        self.pack = pack
+        if pack == "end":
+            header_bar.pack_end(widget)
+        elif pack == "title":
+            header_bar.set_title_widget(widget)
+        else:
+            header_bar.pack_start(widget)
+
+    def dispose(self):
+        """Remove the widget from the header bar."""
+        widget, self.widget = self.widget, None
+        if widget is None:
+            return
+        if self.pack == "title":
+            if self.header_bar.get_title_widget() is widget:
+                self.header_bar.set_title_widget(None)
+        elif widget.get_parent() is not None:
+            self.header_bar.remove(widget)
+
+
+def chrome_slot(create: Callable[[], Gtk.Widget], pack: str = "start") -> Optional[Gtk.Widget]:
+    """Create a header bar item once and return it on every render.
+
+    Args:
+        create: Builds the widget; only called on the first render (or after
+                the window's header bar changed)
+        pack: "start", "end" or "title"
+
+    Returns:
+        The widget, or None when the window has no header bar. Connect its
+        handlers inside `create` (plain widget.connect); they live as long as
+        the widget. Update properties that depend on state on every render.
+    """
+    site = Composition.call_site()
+    hook = Composition.claim_hook(ChromeSlot, key=site)
+    header_bar = get_header_bar()
+
+    if hook is not None:
+        if hook.widget is not None and hook.header_bar is header_bar and hook.pack == pack:
+            return hook.widget
+        hook.dispose()
+    if header_bar is None:
+        Composition.set_hook(None)
+        return None
+
+    hook = ChromeSlot(header_bar, create(), pack)
+    hook._hook_key = site
+    Composition.set_hook(hook)
+    return hook.widget
+
+
+__all__ = ["chrome_slot", "get_header_bar", "ChromeSlot"]
@@ -0,0 +1,101 @@
+import gi
+
+gi.require_version("Gtk", "4.0")
+
+from gi.repository import Gtk
+from ..compose.runtime import Composition
+from ..compose.runtime import Composable
+from ..styling.css import apply_styles
+from ..state import Binding
+from ..app.frame_monitor import get_frame_monitor
+
+
+class _StatsOverlay:
+    """The readout box, added to the window's overlay once and kept across renders."""
+
+    def __init__(self, overlay, box, monitor):
+        self.overlay = overlay
+        self.box = box
+        self.monitor = monitor
+        overlay.add_overlay(box)
+
+    def dispose(self):
+        box, self.box = self.box, None
+        if box is not None and box.get_parent() is not None:
+            self.overlay.remove_overlay(box)
+
+
+def _stats_box(monitor, styles):
+    box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
+    box.set_halign(Gtk.Align.END)
+    box.set_can_target(False)  # never steal input from the app
+
+    fields = [
+        ("fps", lambda v: f"{v:.0f} fps"),
+        ("frame_p95", lambda v: f"p95 {v:.0f} ms"),
+        ("missed", lambda v: f"missed {v}"),
+        ("latency", lambda v: f"input {v:.0f} ms"),
+    ]
+    for attr, fmt in fields:
+        label = Gtk.Label(xalign=0)
+        Binding(monitor.stats, attr, format=fmt).apply_to(label)
+        box.append(label)
+
+    apply_styles(box, styles)
+    return box
+
+
+@Composable
+def FrameStats(monitor=None, styles="text-xs opacity-50 p-1"):
+    """Small live readout of the frame monitor (fps, p95 frame time, missed frames, latency).
+
+    Labels are bound to the monitor's stats state, so they update without
+    rerendering. Renders nothing when frame monitoring is off.
+
+    In a ComposeApp with frame_monitor=True the readout floats over the
+    bottom-right corner of the window (a Gtk.Overlay around the root), so it
+    takes no layout space wherever FrameStats() is called. Without that
+    overlay (e.g. a bare mount) it is appended inline.
+
+    Args:
+        monitor: FrameMonitor to display (default: the running app's monitor)
+        styles: CSS styles to apply to the container
+
+    Returns:
+        GtkBox containing the labels, or None
+
+    Example:
+        app = ComposeApp(App, frame_monitor=True)
+
+        def App():
+            FrameStats()
+            with Column():
+                ...
+    """
+    site = Composition.call_site()
+    hook = Composition.claim_hook(_StatsOverlay, key=site)
+    monitor = monitor or get_frame_monitor()
+    window = Composition.get_window()
+    overlay = getattr(window, "_gcompose_overlay", None) if window is not None else None
+
+    if monitor is None or overlay is None:
+        if hook is not None:
+            hook.dispose()
+            Composition.set_hook(None)
+        if monitor is None:
+            return None
+        box = _stats_box(monitor, styles)
+        Composition.current().append(box)
+        return box
+
+    if hook is not None:
+        if hook.box is not None and hook.overlay is overlay and hook.monitor is monitor:
+            return hook.box
+        hook.dispose()
+
+    box = _stats_box(monitor, styles)
+    box.set_valign(Gtk.Align.END)
+    hook = _StatsOverlay(overlay, box, monitor)
+    hook._hook_key = site
+    Composition.set_hook(hook)
+    return box
@@ -4,9 +4,35 @@ gi.require_version("Adw", "1")
 gi.require_version("Gtk", "4.0")
 
 from gi.repository import Adw, Gtk
+import logging
+from collections import OrderedDict
 from contextlib import contextmanager
+from typing import Callable, Dict, Optional
 from ..compose.runtime import Composition
+from ..state import Binding
+from ..state.fast import bindable
 from ..styling.css import apply_styles
+from ..utils.signals import notify_signal
+from .chrome import chrome_slot
+
+logger = logging.getLogger("gcompose.sidebar")
+
+
+def _sidebar_toggle():
+    toggle = Gtk.ToggleButton()
+    toggle.set_icon_name("sidebar-show-symbolic")
+    toggle.set_tooltip_text("Toggle Sidebar")
+    toggle.set_active(True)
+    # The button outlives renders; it drives whichever split view rendered last
+    toggle._gcompose_split_view = None
+
+    def on_toggled(btn):
+        split_view = btn._gcompose_split_view
+        if split_view is not None:
+            split_view.set_show_sidebar(btn.get_active())
+
+    toggle.connect("toggled", on_toggled)
+    return toggle
 
 
 @contextmanager
@@ -18,29 +44,18 @@ def SidebarLayout(styles=None, min_sidebar_width=200, max_sidebar_width=300):
     # Append to current (root)
     Composition.current().append(split_view)
 
-    # Add toggle button to header bar if available
-    window = Composition._window
-    if window:
-        content = window.get_content()
-        if hasattr(content, "get_top_bar"):  # ToolbarView
-            header_bar = content.get_top_bar()
-            if header_bar:
-                # Create toggle button
-                toggle_button = Gtk.ToggleButton()
-                toggle_button.set_icon_name("sidebar-show-symbolic")
-                toggle_button.set_tooltip_text("Toggle Sidebar")
-                toggle_button.set_active(True)
-                toggle_button.connect(
-                    "toggled", lambda btn: split_view.set_show_sidebar(btn.get_active())
-                )
-                header_bar.pack_start(toggle_button)
+    # Header bar toggle: created on the first render, reused afterwards
+    toggle = chrome_slot(_sidebar_toggle, pack="start")
+    if toggle is not None:
+        toggle._gcompose_split_view = split_view
+        split_view.set_show_sidebar(toggle.get_active())
 
     # Temporarily push to stack so that child context managers can access it as current
-    Composition._stack.append(split_view)
+    Composition.enter(split_view)
     try:
         yield split_view
     finally:
-        Composition._stack.pop()
+        Composition.pop()
 
 
 @contextmanager
@@ -67,11 +82,11 @@ def SidebarContent(styles=None):
     parent.set_sidebar(page)
 
     # Push the box to the composition stack (NOT append)
-    Composition._stack.append(box)  # Use _stack.append instead of push
+    Composition.enter(box)  # Use enter instead of push
 
     yield box
 
-    Composition._stack.pop()  # Use _stack.pop instead of pop
+    Composition.pop()
 
 
 @contextmanager
@@ -97,8 +112,183 @@ def SidebarMainScreen(styles=None):
     parent.set_content(page)
 
     # Push the box to the composition stack (NOT append)
-    Composition._stack.append(box)  # Use _stack.append instead of push
+    Composition.enter(box)  # Use enter instead of push
 
     yield box
 
-    Composition._stack.pop()  # Use _stack.pop instead of pop
+    Composition.pop()
+
+
+class _PageCache:
+    """Content pages of one SidebarPages, kept across renders (LRU)."""
+
+    def __init__(self, composition, max_cached):
+        self.composition = composition
+        self.max_cached = max_cached
+        self.pages = OrderedDict()  # key -> (Adw.NavigationPage, signal generation)
+        self.screens = {}
+        self.titles = {}
+        self.styles = None
+        self.split_view = None
+        self.shown = None  # (split view, key) currently displayed
+
+    def _build(self, key):
+        scrolled = Gtk.ScrolledWindow()
+        scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
+        apply_styles(scrolled, self.styles)
+        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
+        scrolled.set_child(box)
+        title = self.titles.get(key, str(key).replace("_", " ").title())
+        page = Adw.NavigationPage(child=scrolled, title=title, tag=str(key))
+
+        # Handlers belong to the page, not to the render that happened to build
+        # it; and the screen may run mid-render, so keep it off the hook list
+        composition = self.composition
+        generation = object()
+        rendering, composition._rendering = composition._rendering, False
+        composition.enter(box)
+        try:
+            with composition.signals.generation_scope(generation):
+                composition.callback(self.screens[key])()
+        finally:
+            composition.pop()
+            composition._rendering = rendering
+        return page, generation
+
+    def _evict(self):
+        current = self.shown[1] if self.shown else None
+        for key in list(self.pages):
+            if len(self.pages) <= self.max_cached:
+                break
+            if key != current:
+                self._drop(key)
+
+    def _drop(self, key):
+        _page, generation = self.pages.pop(key)
+        self.composition.signals.disconnect_generation(generation)
+
+    def show(self, key):
+        """Display the page for `key`, building it on first use."""
+        if key not in self.screens:
+            raise KeyError(f"SidebarPages has no screen {key!r}")
+        split_view = self.split_view
+        if self.shown == (split_view, key):
+            return
+        entry = self.pages.get(key)
+        if entry is None:
+            entry = self.pages[key] = self._build(key)
+        self.pages.move_to_end(key)
+        page = entry[0]
+
+        # A cached page may still be the content of a previous render's split view
+        if self.shown is not None:
+            previous = self.shown[0]
+            if previous is not split_view and previous.get_content() is page:
+                previous.set_content(None)
+        split_view.set_content(page)
+        self.shown = (split_view, key)
+        self._evict()
+
+    def invalidate(self, key=None):
+        """Drop cached pages (all, or just `key`) so they are rebuilt on next show."""
+        keys = list(self.pages) if key is None else [key] if key in self.pages else []
+        shown = self.shown[1] if self.shown else None
+        for k in keys:
+            self._drop(k)
+        if shown in keys:
+            self.shown = None
+            self.show(shown)
+
+    def dispose(self):
+        """Release every cached page and its handlers."""
+        for key in list(self.pages):
+            self._drop(key)
+        self.shown = None
+
+
+def SidebarPages(
+    screens: Dict[str, Callable[[], None]],
+    active,
+    titles: Optional[Dict[str, str]] = None,
+    max_cached: int = 4,
+    styles=None,
+    keep_alive: bool = False,
+) -> _PageCache:
+    """Content pages for SidebarLayout, built lazily and cached.
+
+    Use in place of SidebarMainScreen when the sidebar switches between
+    sections. A section's page is built the first time it is shown. With
+    `active` bound to state, switching sections keeps the pages already
+    built, so switching back does not rebuild them. Up to `max_cached` pages
+    stay built; the least recently shown ones are dropped.
+
+    A rerender rebuilds the visible page like the rest of the tree and drops
+    the cached ones, which were built from older state. With keep_alive=True
+    pages survive rerenders too (keeping scroll position and widget state);
+    they then update only through Bindings, or .invalidate(key).
+
+    Screens run outside the render pass: keep their state in state objects
+    created by the parent, as with LazyColumn.
+
+    Args:
+        screens: Section key -> composable building that section's page
+        active: Key of the section to show, or a Binding(state, attr) to a
+                key; with a Binding, changing the state switches pages
+                without a rerender
+        titles: Page titles by key (default: the key, title-cased)
+        max_cached: Pages kept built, including the visible one
+        styles: Styles for each page's scrolled window
+        keep_alive: Reuse built pages across rerenders instead of rebuilding
+
+    Returns:
+        The page cache; call .invalidate(key) to force a rebuild
+
+    Example:
+        nav = use_state(section="home")
+        with SidebarLayout():
+            with SidebarContent():
+                Button("Home", on_click=lambda: setattr(nav, "section", "home"))
+                Button("Settings", on_click=lambda: setattr(nav, "section", "settings"))
+            SidebarPages(
+                {"home": HomeScreen, "settings": SettingsScreen},
+                active=Binding(nav, "section"),
+            )
+    """
+    split_view = Composition.current()
+    if not isinstance(split_view, Adw.NavigationSplitView):
+        raise ValueError("SidebarPages must be used inside SidebarLayout")
+
+    composition = Composition.active()
+    site = Composition.call_site()
+    cache = Composition.claim_hook(_PageCache, key=site)
+    if cache is None or cache.composition is not composition:
+        if cache is not None:
+            cache.dispose()
+        cache = _PageCache(composition, max_cached)
+        cache._hook_key = site
+        Composition.set_hook(cache)
+    cache.max_cached = max(1, max_cached)
+    cache.screens = screens
+    cache.titles = titles or {}
+    cache.styles = styles
+    cache.split_view = split_view
+    if not keep_alive:
+        # Pages built for the previous render are out of date
+        cache.dispose()
+
+    if isinstance(active, Binding):
+        source = bindable(active.state, active.attr)
+
+        def on_active(obj, _pspec):
+            key = getattr(active.state, active.attr)
+            if key not in cache.screens:
+                logger.warning("SidebarPages: no screen for %r; keeping the current page", key)
+                return
+            cache.show(key)
+            split_view.set_show_content(True)
+
+        Composition.connect(source, notify_signal(active.attr), on_active)
+        active = getattr(active.state, active.attr)
+
+    cache.show(active)
+    return cache